@@ -41,12 +41,7 @@ class ErrorHandler(commands.Cog):
             guild_id = ctx.guild.id if ctx.guild else None
             missing_perms = [perm.replace('_', ' ').title() for perm in error.missing_permissions]
             perms_text = ", ".join(missing_perms)
-            embed = discord.Embed(
-                title=t('err_missing_perms_user_title', guild_id=guild_id),
-                description=t('err_missing_perms_user_desc', perms=perms_text, guild_id=guild_id),
-                color=discord.Color.red()
-            )
-            embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            embed = self.client.embed_factory.build(guild_id, 'err_missing_perms_user_title', 'err_missing_perms_user_desc', color=discord.Color.red(), perms=perms_text)
             await ctx.send(embed=embed, delete_after=10)
             return
         
@@ -55,84 +50,49 @@ class ErrorHandler(commands.Cog):
             guild_id = ctx.guild.id if ctx.guild else None
             missing_perms = [perm.replace('_', ' ').title() for perm in error.missing_permissions]
             perms_text = ", ".join(missing_perms)
-            embed = discord.Embed(
-                title=t('err_missing_perms_bot_title', guild_id=guild_id),
-                description=t('err_missing_perms_bot_desc', perms=perms_text, guild_id=guild_id),
-                color=discord.Color.red()
-            )
-            embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            embed = self.client.embed_factory.build(guild_id, 'err_missing_perms_bot_title', 'err_missing_perms_bot_desc', color=discord.Color.red(), perms=perms_text)
             await ctx.send(embed=embed, delete_after=10)
             return
         
         # Missing required argument
         if isinstance(error, commands.MissingRequiredArgument):
             guild_id = ctx.guild.id if ctx.guild else None
-            embed = discord.Embed(
-                title=t('err_missing_arg_title', guild_id=guild_id),
-                description=t('err_missing_arg_desc', command=ctx.command.name, param=error.param.name, guild_id=guild_id),
-                color=discord.Color.red()
-            )
-            embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            embed = self.client.embed_factory.build(guild_id, 'err_missing_arg_title', 'err_missing_arg_desc', color=discord.Color.red(), command=ctx.command.name, param=error.param.name)
             await ctx.send(embed=embed, delete_after=10)
             return
         
         # Invalid argument
         if isinstance(error, commands.BadArgument):
             guild_id = ctx.guild.id if ctx.guild else None
-            embed = discord.Embed(
-                title=t('err_bad_arg_title', guild_id=guild_id),
-                description=t('err_bad_arg_desc', command=ctx.command.name, guild_id=guild_id),
-                color=discord.Color.red()
-            )
-            embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            embed = self.client.embed_factory.build(guild_id, 'err_bad_arg_title', 'err_bad_arg_desc', color=discord.Color.red(), command=ctx.command.name)
             await ctx.send(embed=embed, delete_after=10)
             return
         
         # Command on cooldown
         if isinstance(error, commands.CommandOnCooldown):
             guild_id = ctx.guild.id if ctx.guild else None
-            embed = discord.Embed(
-                title=t('err_cooldown_title', guild_id=guild_id),
-                description=t('err_cooldown_desc', time=round(error.retry_after, 1), guild_id=guild_id),
-                color=discord.Color.orange()
-            )
-            embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            embed = self.client.embed_factory.build(guild_id, 'err_cooldown_title', 'err_cooldown_desc', color=discord.Color.orange(), time=round(error.retry_after, 1))
             await ctx.send(embed=embed, delete_after=error.retry_after)
             return
         
         # Owner only command
         if isinstance(error, commands.NotOwner):
             guild_id = ctx.guild.id if ctx.guild else None
-            embed = discord.Embed(
-                title=t('err_not_owner_title', guild_id=guild_id),
-                description=t('err_not_owner_desc', guild_id=guild_id),
-                color=discord.Color.red()
-            )
-            embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            embed = self.client.embed_factory.build(guild_id, 'err_not_owner_title', 'err_not_owner_desc', color=discord.Color.red())
             await ctx.send(embed=embed, delete_after=10)
             return
         
         # Guild only command
         if isinstance(error, commands.NoPrivateMessage):
             guild_id = ctx.guild.id if ctx.guild else None
-            embed = discord.Embed(
-                title=t('err_no_private_title', guild_id=guild_id),
-                description=t('err_no_private_desc', guild_id=guild_id),
-                color=discord.Color.red()
-            )
-            embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            embed = self.client.embed_factory.build(guild_id, 'err_no_private_title', 'err_no_private_desc', color=discord.Color.red())
             await ctx.send(embed=embed, delete_after=10)
             return
         
         # Check failure (for custom checks)
         if isinstance(error, commands.CheckFailure):
             guild_id = ctx.guild.id if ctx.guild else None
-            embed = discord.Embed(
-                title=t('err_check_failure_title', guild_id=guild_id),
-                description=t('err_check_failure_desc', guild_id=guild_id),
-                color=discord.Color.red()
-            )
-            embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            embed = self.client.embed_factory.build(guild_id, 'err_check_failure_title', 'err_check_failure_desc', color=discord.Color.red())
             await ctx.send(embed=embed, delete_after=10)
             return
         
@@ -142,24 +102,14 @@ class ErrorHandler(commands.Cog):
             original_error = error.original
             # Handle specific Discord errors
             if isinstance(original_error, discord.Forbidden):
-                embed = discord.Embed(
-                    title=t('err_forbidden_title', guild_id=guild_id),
-                    description=t('err_forbidden_desc', guild_id=guild_id),
-                    color=discord.Color.red()
-                )
-                embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+                embed = self.client.embed_factory.build(guild_id, 'err_forbidden_title', 'err_forbidden_desc', color=discord.Color.red())
                 try:
                     await ctx.send(embed=embed, delete_after=10)
                 except:
                     pass
                 return
             elif isinstance(original_error, discord.NotFound):
-                embed = discord.Embed(
-                    title=t('err_not_found_title', guild_id=guild_id),
-                    description=t('err_not_found_desc', guild_id=guild_id),
-                    color=discord.Color.red()
-                )
-                embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+                embed = self.client.embed_factory.build(guild_id, 'err_not_found_title', 'err_not_found_desc', color=discord.Color.red())
                 try:
                     await ctx.send(embed=embed, delete_after=10)
                 except:
@@ -167,12 +117,7 @@ class ErrorHandler(commands.Cog):
                 return
             else:
                 # Other errors - show generic message
-                embed = discord.Embed(
-                    title=t('err_invoke_title', guild_id=guild_id),
-                    description=t('err_invoke_desc', guild_id=guild_id),
-                    color=discord.Color.red()
-                )
-                embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+                embed = self.client.embed_factory.build(guild_id, 'err_invoke_title', 'err_invoke_desc', color=discord.Color.red())
                 try:
                     await ctx.send(embed=embed, delete_after=10)
                 except:
@@ -229,12 +174,7 @@ class ErrorHandler(commands.Cog):
         if isinstance(error, app_commands.MissingPermissions):
             missing_perms = [perm.replace('_', ' ').title() for perm in error.missing_permissions]
             perms_text = ", ".join(missing_perms)
-            embed = discord.Embed(
-                title=t('err_missing_perms_user_title', guild_id=guild_id),
-                description=t('err_missing_perms_user_desc', perms=perms_text, guild_id=guild_id),
-                color=discord.Color.red()
-            )
-            embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            embed = self.client.embed_factory.build(guild_id, 'err_missing_perms_user_title', 'err_missing_perms_user_desc', color=discord.Color.red(), perms=perms_text)
             await send_error_embed(embed)
             return
         
@@ -242,34 +182,19 @@ class ErrorHandler(commands.Cog):
         if isinstance(error, app_commands.BotMissingPermissions):
             missing_perms = [perm.replace('_', ' ').title() for perm in error.missing_permissions]
             perms_text = ", ".join(missing_perms)
-            embed = discord.Embed(
-                title=t('err_missing_perms_bot_title', guild_id=guild_id),
-                description=t('err_missing_perms_bot_desc', perms=perms_text, guild_id=guild_id),
-                color=discord.Color.red()
-            )
-            embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            embed = self.client.embed_factory.build(guild_id, 'err_missing_perms_bot_title', 'err_missing_perms_bot_desc', color=discord.Color.red(), perms=perms_text)
             await send_error_embed(embed)
             return
         
         # Command on cooldown
         if isinstance(error, app_commands.CommandOnCooldown):
-            embed = discord.Embed(
-                title=t('err_cooldown_title', guild_id=guild_id),
-                description=t('err_cooldown_desc', time=round(error.retry_after, 1), guild_id=guild_id),
-                color=discord.Color.orange()
-            )
-            embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            embed = self.client.embed_factory.build(guild_id, 'err_cooldown_title', 'err_cooldown_desc', color=discord.Color.orange(), time=round(error.retry_after, 1))
             await send_error_embed(embed)
             return
         
         # Check failure
         if isinstance(error, app_commands.CheckFailure):
-            embed = discord.Embed(
-                title=t('err_check_failure_title', guild_id=guild_id),
-                description=t('err_check_failure_desc', guild_id=guild_id),
-                color=discord.Color.red()
-            )
-            embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            embed = self.client.embed_factory.build(guild_id, 'err_check_failure_title', 'err_check_failure_desc', color=discord.Color.red())
             await send_error_embed(embed)
             return
         
@@ -279,12 +204,7 @@ class ErrorHandler(commands.Cog):
             
             # Handle specific Discord errors
             if isinstance(original_error, discord.Forbidden):
-                embed = discord.Embed(
-                    title=t('err_forbidden_title', guild_id=guild_id),
-                    description=t('err_forbidden_desc', guild_id=guild_id),
-                    color=discord.Color.red()
-                )
-                embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+                embed = self.client.embed_factory.build(guild_id, 'err_forbidden_title', 'err_forbidden_desc', color=discord.Color.red())
                 await send_error_embed(embed)
                 return
             elif isinstance(original_error, discord.NotFound):
@@ -295,21 +215,11 @@ class ErrorHandler(commands.Cog):
                     print(t('log_err_webhook_expired', command=command_name, guild_id=guild_id))
                     return
                 else:
-                    embed = discord.Embed(
-                        title=t('err_not_found_title', guild_id=guild_id),
-                        description=t('err_not_found_desc', guild_id=guild_id),
-                        color=discord.Color.red()
-                    )
-                    embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+                    embed = self.client.embed_factory.build(guild_id, 'err_not_found_title', 'err_not_found_desc', color=discord.Color.red())
                     await send_error_embed(embed, use_channel_fallback=True)
                     return
             elif isinstance(original_error, discord.HTTPException):
-                embed = discord.Embed(
-                    title=t('err_http_title', guild_id=guild_id),
-                    description=t('err_http_desc', error=str(original_error), guild_id=guild_id),
-                    color=discord.Color.red()
-                )
-                embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+                embed = self.client.embed_factory.build(guild_id, 'err_http_title', 'err_http_desc', color=discord.Color.red(), error=str(original_error))
                 await send_error_embed(embed)
                 print(t('log_err_slash_http', command=command_name, guild_id=guild_id))
                 traceback.print_exception(type(original_error), original_error, original_error.__traceback__)
@@ -336,12 +246,7 @@ class ErrorHandler(commands.Cog):
                 return
             else:
                 # Other errors
-                embed = discord.Embed(
-                    title=t('err_invoke_title', guild_id=guild_id),
-                    description=t('err_invoke_desc', guild_id=guild_id),
-                    color=discord.Color.red()
-                )
-                embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+                embed = self.client.embed_factory.build(guild_id, 'err_invoke_title', 'err_invoke_desc', color=discord.Color.red())
                 await send_error_embed(embed)
                 # Log error for debug
                 self.logger.error(t('log_err_slash_general', command=command_name, guild_id=guild_id))
@@ -349,12 +254,7 @@ class ErrorHandler(commands.Cog):
                 return
         
         # For all other unhandled errors
-        embed = discord.Embed(
-            title=t('error', guild_id=guild_id),
-            description=t('mods_unexpected_error', error=str(error), guild_id=guild_id),
-            color=discord.Color.red()
-        )
-        embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+        embed = self.client.embed_factory.build(guild_id, 'error', 'mods_unexpected_error', color=discord.Color.red(), error=str(error))
         await send_error_embed(embed)
         self.logger.error(t('log_err_slash_unhandled', command=command_name, guild_id=guild_id))
         self.logger.error(''.join(traceback.format_exception(type(error), error, error.__traceback__)))
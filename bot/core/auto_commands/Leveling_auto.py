@@ -8,6 +8,11 @@ class Leveling_auto(commands.Cog):
     def __init__(self, client):
         self.client = client
         self.leveling_service = client.leveling_service
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        # Hand legacy global XP over to the guilds where each user is a member
+        await self.leveling_service.adopt_legacy_levels(self.client.guilds)
     
     @commands.Cog.listener()
     async def on_message(self, message):
@@ -15,7 +20,7 @@ class Leveling_auto(commands.Cog):
             return
 
         # XP attribution via service
-        new_lvl, leveled_up = self.leveling_service.add_xp(message.author.id)
+        new_lvl, leveled_up = self.leveling_service.add_xp(message.guild.id, message.author.id)
         
         if leveled_up:
             embed = discord.Embed(
@@ -1,41 +1,21 @@
 import discord
 from discord.ext import commands
 import re
+import io
+import tempfile
 import aiohttp
-from collections import defaultdict
 import traceback
 import asyncio
 from services.vxt_service import vxt_service_global
+from services.link_rewrite_service import STATUS_ID_PATTERN
 
 # Extracted functions from original index.py
 _punct_tail = '>)].,\'" \t\r\n'
+FXTWITTER_URL_PATTERN = re.compile(r"(https?://(?:\w+\.)?fxtwitter\.com/(?:\w+/)?status/(\d+)(?:\?\S*)?)")
 
 def clean_url(raw: str) -> str:
     return raw.rstrip(_punct_tail)
 
-async def fetch_fxtwitter(status_id: str, session: aiohttp.ClientSession) -> dict | None:
-    api_url = f"https://api.fxtwitter.com/status/{status_id}"
-    # Use a more standard User-Agent to avoid being blocked
-    headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"}
-    try:
-        async with session.get(api_url, headers=headers, timeout=5) as resp:
-            if resp.status == 200:
-                data = await resp.json()
-                return data["tweet"]
-    except:
-        pass
-    return None
-
-async def safe_fetch_webhook(bot, webhook_id):
-    try:
-        return await bot.fetch_webhook(webhook_id)
-    except discord.Forbidden:
-        return None
-
-def remove_extras_after_status(processed_message):
-    pattern = r'(https?://(?:twitter\.com|x\.com)/[^/]+/status/\d+)\S*'
-    return re.sub(pattern, r'\1', processed_message)
-
 def split_message(message, chunk_size=2000):
     parts = message.split('\n')
     chunks = []
@@ -53,9 +33,6 @@ def split_message(message, chunk_size=2000):
 class LinkConverter(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        # Make sure vxt_service has its bot set, though it might natively not strictly need it 
-        # for most operations except perhaps some future logic
-        vxt_service_global.bot = bot
 
     @commands.Cog.listener()
     async def on_ready(self):
@@ -68,54 +45,57 @@ class LinkConverter(commands.Cog):
 
     @commands.Cog.listener()
     async def on_raw_reaction_add(self, payload):
-        master_settings = vxt_service_global.master_settings
-        if not master_settings:
-            return
-        if not master_settings.get(payload.guild_id, {}).get("delete-bot-message", {}).get("toggle", False):
+        g_settings = vxt_service_global.get_guild_settings(payload.guild_id)
+        if not g_settings.get("delete-bot-message", {}).get("toggle", False):
             return
             
         channel = await self.bot.fetch_channel(payload.channel_id)
         message = await channel.fetch_message(payload.message_id)
         
         if message.webhook_id:
-            temp_webhook = await safe_fetch_webhook(self.bot, message.webhook_id)
-            if temp_webhook is None:
-                return     
-            temp_bot = await message.guild.fetch_member(temp_webhook.user.id)
-            if temp_bot.id == self.bot.user.id:
+            owner_id = await self.bot.webhook_registry.get_owner_id(message.webhook_id)
+            if owner_id is None:
+                return
+            if owner_id == self.bot.user.id:
                 reaction = next((react for react in message.reactions if "❌" in str(react.emoji)), None)
                 if reaction is None:
                     return
-                if reaction.count > master_settings[payload.guild_id]["delete-bot-message"]["number"]:
+                if reaction.count > g_settings["delete-bot-message"]["number"]:
                     await message.delete()
                     return
                     
         if message.author == self.bot.user:
             reaction = next((react for react in message.reactions if "❌" in str(react.emoji)), None)
-            if reaction and reaction.count > master_settings[payload.guild_id]["delete-bot-message"]["number"]:
+            if reaction and reaction.count > g_settings["delete-bot-message"]["number"]:
                 await message.delete()
                 return
 
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
-        master_settings = vxt_service_global.master_settings
-        if not master_settings or not message.guild:
+        if not message.guild:
             return
         if message.author == self.bot.user:
             return
+        # Fast path: nothing to convert
+        if "http" not in message.content:
+            return
 
+        # One snapshot for the whole message, even if settings change meanwhile
         guild_id = message.guild.id
-        g_settings = master_settings.get(guild_id, {})
+        g_settings = vxt_service_global.get_guild_settings(guild_id)
+        rewriter = vxt_service_global.get_rewriter(guild_id)
+        if not g_settings:
+            return
 
         if not g_settings.get("message", {}).get("other_webhooks", False) and message.webhook_id:
             return
 
         if message.webhook_id:
-            temp_webhook = await safe_fetch_webhook(self.bot, message.webhook_id)
-            if temp_webhook is None:
-                return     
+            owner_id = await self.bot.webhook_registry.get_owner_id(message.webhook_id)
+            if owner_id is None:
+                return
             try:
-                temp_bot = await message.guild.fetch_member(temp_webhook.user.id)
+                temp_bot = message.guild.get_member(owner_id) or await message.guild.fetch_member(owner_id)
                 if temp_bot.id in g_settings.get("blacklist", {}).get("users", []) or any(role.id in g_settings.get("blacklist", {}).get("roles", []) for role in temp_bot.roles):
                     return
             except discord.NotFound:
@@ -126,12 +106,9 @@ class LinkConverter(commands.Cog):
             if message.author.id in blacklist.get("users", []) or (hasattr(message.author, "roles") and any(role.id in blacklist.get("roles", []) for role in message.author.roles)):
                 return
 
-        urls = re.findall(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', remove_extras_after_status(message.content))
-
         # conversion setting check
-        conversion_map = g_settings.get("conversion", {})
-        if len(conversion_map.keys()) > 0 and urls:
-            converted_domains_message = await self.convert_domains_in_message(message, guild_id, urls)
+        if rewriter:
+            converted_domains_message = await self.convert_domains_in_message(message, rewriter)
             if converted_domains_message == message.content:
                 return
                 
@@ -151,66 +128,43 @@ class LinkConverter(commands.Cog):
 
             sent_message = None
             webhook_pref = g_settings.get("webhook", {}).get("preference", "webhooks")
-            
-            if webhook_pref == "webhooks":
-                channel_webhooks = None
-                perms = message.channel.permissions_for(message.guild.me)
-                if not perms.manage_webhooks:
-                    # Original raised BotMissingPermissions, log/fail silently here
-                    return
-                    
-                parent_channel = message.channel.parent if isinstance(message.channel, discord.Thread) else message.channel
-                channel_webhooks = await parent_channel.webhooks()
-                
-                matching_webhook = next((w for w in channel_webhooks if self.bot.user.id == w.user.id), None)
-                if not matching_webhook:
-                    matching_webhook = await parent_channel.create_webhook(name="VxT", reason="To send messages with converted links.")
+            if webhook_pref == "webhooks" and not message.channel.permissions_for(message.guild.me).manage_webhooks:
+                # Original raised BotMissingPermissions, log/fail silently here
+                return
 
-                if len(converted_domains_message) >= 2000:
-                    split_converted_message = split_message(converted_domains_message, 2000)
-                    for split_chunk in split_converted_message:
+            if len(converted_domains_message) >= 2000:
+                chunks = split_message(converted_domains_message, 2000)
+            else:
+                chunks = [converted_domains_message]
+
+            # Attachments are downloaded once, then re-sent from the buffers
+            attachments = await self.read_attachments(message.attachments)
+            try:
+                for index, chunk in enumerate(chunks):
+                    files = self.attachment_files(attachments, index, len(chunks))
+                    if webhook_pref == "webhooks":
+                        parent_channel = message.channel.parent if isinstance(message.channel, discord.Thread) else message.channel
                         webhook_params = {
-                            'content': split_chunk,
+                            'content': chunk,
                             'wait': True,
                             'username': message.author.display_name if g_settings.get("name-preference", "display name") == "display name" else message.author.name,
                             'avatar_url': message.author.display_avatar.url,
-                            'files': [await attachment.to_file() for attachment in message.attachments],
+                            'files': files,
                             'allowed_mentions': msg_mentions
                         }
                         if isinstance(message.channel, discord.Thread):
                             webhook_params['thread'] = message.channel
-                        sent_message = await matching_webhook.send(**webhook_params)
-                        if g_settings.get("delete-bot-message", {}).get("toggle", False):
-                            await sent_message.add_reaction("❌")
-                else:
-                    webhook_params = {
-                        'content': converted_domains_message,
-                        'wait': True,
-                        'username': message.author.display_name if g_settings.get("name-preference", "display name") == "display name" else message.author.name,
-                        'avatar_url': message.author.display_avatar.url,
-                        'files': [await attachment.to_file() for attachment in message.attachments],
-                        'allowed_mentions': msg_mentions
-                    }
-                    if isinstance(message.channel, discord.Thread):
-                        webhook_params['thread'] = message.channel
-                    sent_message = await matching_webhook.send(**webhook_params)
-
-            elif webhook_pref == "bot" and g_settings.get("webhook", {}).get("reply", False):
-                if len(converted_domains_message) >= 2000:
-                    for split_chunk in split_message(converted_domains_message, 2000):
-                        sent_message = await message.reply(content=split_chunk, files=[await attachment.to_file() for attachment in message.attachments], allowed_mentions=msg_mentions)
-                        if g_settings.get("delete-bot-message", {}).get("toggle", False):
-                            await sent_message.add_reaction("❌")
-                else:
-                    sent_message = await message.reply(content=converted_domains_message, files=[await attachment.to_file() for attachment in message.attachments], allowed_mentions=msg_mentions)
-            else:
-                if len(converted_domains_message) >= 2000:
-                    for split_chunk in split_message(converted_domains_message, 2000):
-                        sent_message = await message.channel.send(content=split_chunk, files=[await attachment.to_file() for attachment in message.attachments], allowed_mentions=msg_send_mentions)
-                        if g_settings.get("delete-bot-message", {}).get("toggle", False):
-                            await sent_message.add_reaction("❌")
-                else:
-                    sent_message = await message.channel.send(content=converted_domains_message, files=[await attachment.to_file() for attachment in message.attachments], allowed_mentions=msg_send_mentions)
+                        sent_message = await self.send_with_webhook(parent_channel, webhook_params)
+                    elif webhook_pref == "bot" and g_settings.get("webhook", {}).get("reply", False):
+                        sent_message = await message.reply(content=chunk, files=files, allowed_mentions=msg_mentions)
+                    else:
+                        sent_message = await message.channel.send(content=chunk, files=files, allowed_mentions=msg_send_mentions)
+
+                    if len(chunks) > 1 and g_settings.get("delete-bot-message", {}).get("toggle", False):
+                        await sent_message.add_reaction("❌")
+            finally:
+                for _, buffer in attachments:
+                    buffer.close()
 
             if g_settings.get("delete-bot-message", {}).get("toggle", False) and sent_message:
                 await sent_message.add_reaction("❌")
@@ -221,217 +175,210 @@ class LinkConverter(commands.Cog):
                 except discord.NotFound:
                     pass
 
-    async def convert_domains_in_message(self, message, guild_id, urls):
-        processed_message = remove_extras_after_status(message.content)
-        master_settings = vxt_service_global.master_settings
-        g_settings = master_settings.get(guild_id, {})
-        
-        async with aiohttp.ClientSession() as session:
-            domain_groups = defaultdict(list)
-            for url in urls:
-                try:
-                    full_domain = re.search(r'https?://([\w.-]+)/?', url).group(1)
-                    domain_parts = full_domain.split('.')
-                    main_domain = '.'.join(domain_parts[-2:])
-                    if url not in domain_groups[main_domain]:
-                        domain_groups[main_domain].append(url)
-                except AttributeError:
-                    continue
-
-            for domain, domain_urls in domain_groups.items():
-                domain_urls = set(domain_urls)
-                conversion_map = g_settings.get("conversion", {})
-                if domain in conversion_map:
-                    link_responses = {}
-
-                    if (domain == "twitter.com" or domain == "x.com") and conversion_map[domain] == "fxtwitter.com":
-                        processed_message = await self.convert_to_fxtwitter_domain(processed_message, message, guild_id, domain_urls, link_responses, session)  
-                        continue
-
-                    for url in domain_urls:
-                        converted_url = url.replace(domain, conversion_map[domain])
-                        processed_message = processed_message.replace(url, converted_url)
-
-            return processed_message
-
-    async def convert_to_fxtwitter_domain(self, processed_message, message, guild_id, domain_urls, link_responses, session):
-        master_settings = vxt_service_global.master_settings
-        g_settings = master_settings[guild_id]
+    @commands.Cog.listener()
+    async def on_webhooks_update(self, channel):
+        self.bot.webhook_registry.invalidate_channel(channel.id)
+
+    async def send_with_webhook(self, channel, webhook_params):
+        """Sends through the bot's cached webhook of channel, recreating it once if it was deleted."""
+        webhook = await self.bot.webhook_registry.get_channel_webhook(channel)
+        try:
+            return await webhook.send(**webhook_params)
+        except discord.NotFound:
+            self.bot.webhook_registry.invalidate_channel(channel.id)
+            for file in webhook_params.get('files') or []:
+                file.reset()  # Rewind the attachment buffers for the retry
+            webhook = await self.bot.webhook_registry.get_channel_webhook(channel)
+            return await webhook.send(**webhook_params)
+
+    async def read_attachments(self, attachments):
+        """Downloads attachments once into reusable buffers (spilled to a temp file past attachment_spool_mb)."""
+        spool_size = self.bot.config.get('attachment_spool_mb', 8) * 1024 * 1024
+        session = self.bot.http_service.session
+
+        async def read(attachment):
+            buffer = io.BytesIO()
+            try:
+                async with session.get(attachment.url, timeout=aiohttp.ClientTimeout(total=None, sock_read=self.bot.http_service.timeout)) as resp:
+                    resp.raise_for_status()
+                    async for data in resp.content.iter_chunked(64 * 1024):
+                        if isinstance(buffer, io.BytesIO) and buffer.tell() + len(data) > spool_size:
+                            spooled = tempfile.TemporaryFile()
+                            spooled.write(buffer.getvalue())
+                            buffer = spooled
+                        buffer.write(data)
+            except BaseException:
+                buffer.close()
+                raise
+            return attachment, buffer
+
+        results = await asyncio.gather(*(read(attachment) for attachment in attachments), return_exceptions=True)
+        buffers = [result for result in results if not isinstance(result, BaseException)]
+        for result in results:
+            if isinstance(result, BaseException):
+                for _, buffer in buffers:
+                    buffer.close()
+                raise result
+        return buffers
+
+    def attachment_files(self, attachments, index, count):
+        """Returns fresh discord.File objects for chunk index of count. Attachments go to a single chunk."""
+        target = 0 if self.bot.config.get('attachments_chunk', 'last') == 'first' else count - 1
+        if index != target:
+            return []
+        files = []
+        for attachment, buffer in attachments:
+            buffer.seek(0)
+            # On Windows TemporaryFile is a wrapper, discord.File needs the raw file object
+            files.append(discord.File(getattr(buffer, 'file', buffer), filename=attachment.filename, spoiler=attachment.is_spoiler(), description=attachment.description))
+        return files
+
+    async def convert_domains_in_message(self, message, rewriter):
+        processed_message, tweet_urls = rewriter.rewrite(message.content)
+        if tweet_urls:
+            processed_message = await self.convert_to_fxtwitter_domain(processed_message, message, rewriter.policy, tweet_urls, {})
+        return processed_message
+
+    async def convert_to_fxtwitter_domain(self, processed_message, message, policy, domain_urls, link_responses):
+        """Converts tweet links with the fxtwitter API (only for non-plain policies, see LinkRewriter)."""
+        temp_new_domain_urls = domain_urls.copy()
+        direct_media_urls = set()
+        mosaic_direct_media_urls = set()
+        direct_media = policy.direct_media_in(message.channel.mention)
+
+        # Fetch every status of the message (links and existing fxtwitter links) in one batch
+        fxtwitter_matches = FXTWITTER_URL_PATTERN.findall(processed_message)
+        status_numbers = [match.group(1) for match in (STATUS_ID_PATTERN.search(clean_url(link)) for link in domain_urls) if match]
+        tweets = await self.bot.fxtwitter_service.fetch_many(status_numbers + [status_number for _, status_number in fxtwitter_matches])
         
-        if g_settings.get("toggle") != vxt_service_global.default_settings["toggle-list"] or \
-           g_settings.get("retweet") != vxt_service_global.default_settings["retweet-list"] or \
-           g_settings.get("quote-tweet") != vxt_service_global.default_settings["quote-tweet-list"] or \
-           g_settings.get("direct-media") != vxt_service_global.default_settings["direct-media-list"]:
-            
-            pattern = r"/status/(\d+)"
-            temp_new_domain_urls = domain_urls.copy()
-            direct_media_urls = set()
-            mosaic_direct_media_urls = set()
-            
-            for link in domain_urls:
-                link_clean = clean_url(link)
-                match = re.search(pattern, link_clean)
-                if match:
-                    status_number = match.group(1)
-                    tweet_json = await fetch_fxtwitter(status_number, session)
-                    if tweet_json:
-                        link_responses[link_clean] = tweet_json
-                    else:
-                        continue
-                        
-                    tweet_data = link_responses.get(link_clean)
-                    if not tweet_data:
-                        continue
-
-                # Toggle checks
-                t_set = g_settings.get("toggle", {})
-                if t_set != vxt_service_global.default_settings["toggle-list"]:
-                    if (not t_set.get("text", True) and len(tweet_data.get("text", "")) > 0) or \
-                       (not t_set.get("polls", True) and (("quote" in tweet_data and "polls" in tweet_data["quote"]) or ("polls" in tweet_data))) or \
-                       (not t_set.get("videos", True) and (("quote" in tweet_data and "media" in tweet_data["quote"] and "videos" in tweet_data["quote"]["media"]) or ("media" in tweet_data and "videos" in tweet_data["media"]))) or \
-                       (not t_set.get("images", True) and (("quote" in tweet_data and "media" in tweet_data["quote"] and "photos" in tweet_data["quote"]["media"]) or ("media" in tweet_data and "photos" in tweet_data["media"]))):
-                        temp_new_domain_urls.discard(link_clean)
-                    else:
-                        temp_new_domain_urls.add(link_clean)
-
-                qt_set = g_settings.get("quote-tweet", {}).get("link_conversion", {})
-                if not qt_set.get("follow tweets", True):
-                    if not qt_set.get("all", True) or \
-                       (not qt_set.get("polls", True) and (("quote" in tweet_data and "polls" in tweet_data["quote"]) or "polls" in tweet_data)) or \
-                       (not qt_set.get("videos", True) and (("quote" in tweet_data and "media" in tweet_data["quote"] and "videos" in tweet_data["quote"]["media"]) or ("media" in tweet_data and "videos" in tweet_data["media"]))) or \
-                       (not qt_set.get("images", True) and (("quote" in tweet_data and "media" in tweet_data["quote"] and "photos" in tweet_data["quote"]["media"]) or ("media" in tweet_data and "photos" in tweet_data["media"]))):
-                        temp_new_domain_urls.discard(link_clean)
-                    else:
-                        temp_new_domain_urls.add(link_clean)
-
-                dm_set = g_settings.get("direct-media", {})
-                if dm_set.get("toggle") != vxt_service_global.default_settings["direct-media-list"]["toggle"] and \
-                   ("allow" in dm_set.get("channel", []) or ["allow", message.channel.mention] in dm_set.get("channel", [])):
-                    if (dm_set.get("toggle", {}).get("images", False) and "media" in tweet_data and "photos" in tweet_data["media"]) or \
-                       (dm_set.get("toggle", {}).get("videos", False) and "media" in tweet_data and "videos" in tweet_data["media"]):
-                        direct_media_urls.add(link_clean)
-
-                    mi_set = dm_set.get("multiple_images", {})
-                    if not mi_set.get("convert", True) and (("media" in tweet_data and "mosaic" in tweet_data["media"]) or "quote" in tweet_data and "media" in tweet_data["quote"] and "mosaic" in tweet_data["quote"]["media"]):
-                        direct_media_urls.discard(link_clean)
-
-                    if mi_set.get("convert", True) and mi_set.get("replace_with_mosaic", True) and \
-                       (("media" in tweet_data and "mosaic" in tweet_data["media"]) or "quote" in tweet_data and "media" in tweet_data["quote"] and "mosaic" in tweet_data["quote"]["media"]):
-                        direct_media_urls.discard(link_clean)
-                        mosaic_direct_media_urls.add(link_clean)
-
-                    qt_dm = dm_set.get("quote_tweet", {})
-                    if qt_dm.get("convert", False) and \
-                       ((dm_set.get("toggle", {}).get("images", False) and "quote" in tweet_data and "media" in tweet_data["quote"] and "images" in tweet_data["quote"]["media"]) or \
-                        (dm_set.get("toggle", {}).get("videos", False) and "quote" in tweet_data and "media" in tweet_data["quote"] and "videos" in tweet_data["quote"]["media"])):
-                        direct_media_urls.add(link_clean)
-
-                    if qt_dm.get("convert", False) and mi_set.get("convert", True) and \
-                       (dm_set.get("toggle", {}).get("images", False) and "quote" in tweet_data and "media" in tweet_data["quote"] and "mosaic" in tweet_data["quote"]["media"]) and \
-                       mi_set.get("replace_with_mosaic", True):
-                        mosaic_direct_media_urls.add(link_clean)
-
-            # FXTwitter domain extractions
-            fxtwitter_matches = re.findall(r"(https?://(?:\w+\.)?fxtwitter\.com/(?:\w+/)?status/(\d+)(?:\?\S*)?)", processed_message)
-            for full_url, status_number in fxtwitter_matches:
-                tweet_json = await fetch_fxtwitter(status_number, session)
-                if tweet_json:
-                   link_responses[full_url] = tweet_json
-
-            urls_to_delete = set()
-            if g_settings.get("retweet", {}).get("delete_original_tweet", False):
-                original_tweet_text_to_url = {}
-                for url, response in link_responses.items():
-                    if "RT @" not in response.get("text", ""):
-                        original_tweet_text_to_url[response["text"]] = url
-
-                for url, response in link_responses.items():
-                    tweet_text = response.get("text", "")
-                    if tweet_text.startswith("RT @"):
-                        try:
-                            original_text = tweet_text[tweet_text.index(":") + 2:]
-                            original_text = original_text.replace("...", "").replace("…", "").strip()
-                            for original_tweet_text in original_tweet_text_to_url.keys():
-                                if original_tweet_text.startswith(original_text):
-                                    urls_to_delete.add(original_tweet_text_to_url[original_tweet_text])
-                                    break
-                        except ValueError:
-                            pass
-
-            if g_settings.get("quote-tweet", {}).get("remove quoted tweet", False):
-                original_tweet_id_to_quote_tweet_url = {}
-                for url, response in link_responses.items():
-                    if "quote" in response:
-                        original_tweet_id_to_quote_tweet_url[response["quote"]["id"]] = url
-                for url, response in link_responses.items():
-                    tweet_id = response.get("id")
-                    if tweet_id in original_tweet_id_to_quote_tweet_url:
-                        urls_to_delete.add(url)
-
-            for url in urls_to_delete:
-                processed_message = processed_message.replace(url, '')
-
-            for url in mosaic_direct_media_urls:
-                new_url = ""
-                pref_quote = g_settings.get("direct-media", {}).get("quote_tweet", {}).get("prefer_quoted_tweet", True)
-                if pref_quote and "quote" in link_responses[url]:
-                    new_url = link_responses[url].get("quote", {}).get("media", {}).get('mosaic', {}).get("formats", {}).get("jpeg", "")
-                else:
-                    new_url = link_responses[url].get("media", {}).get('mosaic', {}).get("formats", {}).get("jpeg", "")
-                if new_url:
-                    processed_message = processed_message.replace(url, new_url)
-
-            for url in direct_media_urls:
-                new_url = ""
-                dm_set = g_settings.get("direct-media", {})
-                mi_set = dm_set.get("multiple_images", {})
-                qt_dm = dm_set.get("quote_tweet", {})
-                
-                if mi_set.get("convert", True) and mi_set.get("replace_with_mosaic", True) and qt_dm.get("prefer_quoted_tweet", True) and \
-                   "quote" in link_responses[url] and "media" in link_responses[url]["quote"] and "mosaic" in link_responses[url]["quote"]["media"]:
-                    new_url = link_responses[url].get("quote", {}).get("media", {}).get('mosaic', {}).get("formats", {}).get("jpeg", "")
-                elif mi_set.get("convert", True) and qt_dm.get("prefer_quoted_tweet", True) and \
-                   "quote" in link_responses[url] and "media" in link_responses[url]["quote"] and "mosaic" in link_responses[url]["quote"]["media"]:
-                    new_url = f"https://d.fxtwitter.com/i/status/{link_responses[url]['quote']['id']}/"
-                elif qt_dm.get("prefer_quoted_tweet", True) and "quote" in link_responses[url]:
-                    new_url = f"https://d.fxtwitter.com/i/status/{link_responses[url]['quote']['id']}/"
+        for link in domain_urls:
+            link_clean = clean_url(link)
+            match = STATUS_ID_PATTERN.search(link_clean)
+            if not match:
+                continue
+            tweet_data = tweets.get(match.group(1))
+            if not tweet_data:
+                continue
+            link_responses[link_clean] = tweet_data
+
+            quote = tweet_data.get("quote") or {}
+            media = tweet_data.get("media") or {}
+            quote_media = quote.get("media") or {}
+            has_polls = "polls" in tweet_data or "polls" in quote
+            has_videos = "videos" in media or "videos" in quote_media
+            has_photos = "photos" in media or "photos" in quote_media
+            has_mosaic = "mosaic" in media or "mosaic" in quote_media
+
+            # Toggle checks
+            if policy.filter_content:
+                if (policy.hide_text and len(tweet_data.get("text", "")) > 0) or \
+                   (policy.hide_polls and has_polls) or \
+                   (policy.hide_videos and has_videos) or \
+                   (policy.hide_images and has_photos):
+                    temp_new_domain_urls.discard(link_clean)
                 else:
-                    new_url = f"https://d.fxtwitter.com/i/status/{link_responses[url]['id']}/"
-                processed_message = processed_message.replace(url, new_url)
-
-            for url in temp_new_domain_urls:
-                new_url = ""
-                if url not in link_responses:
-                    continue
-                elif g_settings.get("translate", {}).get("toggle", False):
-                    new_url = f"https://fxtwitter.com/i/status/{link_responses[url]['id']}/{g_settings['translate']['language']}"
+                    temp_new_domain_urls.add(link_clean)
+
+            if policy.filter_quotes:
+                if policy.quote_hide_all or \
+                   (policy.quote_hide_polls and has_polls) or \
+                   (policy.quote_hide_videos and has_videos) or \
+                   (policy.quote_hide_images and has_photos):
+                    temp_new_domain_urls.discard(link_clean)
                 else:
-                    new_url = f"https://fxtwitter.com/i/status/{link_responses[url]['id']}/"
+                    temp_new_domain_urls.add(link_clean)
+
+            if direct_media:
+                if (policy.direct_images and "photos" in media) or (policy.direct_videos and "videos" in media):
+                    direct_media_urls.add(link_clean)
+
+                if not policy.convert_multiple and has_mosaic:
+                    direct_media_urls.discard(link_clean)
+
+                if policy.convert_multiple and policy.prefer_mosaic and has_mosaic:
+                    direct_media_urls.discard(link_clean)
+                    mosaic_direct_media_urls.add(link_clean)
+
+                if policy.convert_quoted_media and \
+                   ((policy.direct_images and "images" in quote_media) or (policy.direct_videos and "videos" in quote_media)):
+                    direct_media_urls.add(link_clean)
+
+                if policy.convert_quoted_media and policy.convert_multiple and policy.prefer_mosaic and \
+                   policy.direct_images and "mosaic" in quote_media:
+                    mosaic_direct_media_urls.add(link_clean)
+
+        # FXTwitter domain extractions
+        for full_url, status_number in fxtwitter_matches:
+            tweet_json = tweets.get(status_number)
+            if tweet_json:
+               link_responses[full_url] = tweet_json
+
+        urls_to_delete = set()
+        if policy.delete_original_tweet:
+            original_tweet_text_to_url = {}
+            for url, response in link_responses.items():
+                if "RT @" not in response.get("text", ""):
+                    original_tweet_text_to_url[response["text"]] = url
+
+            for url, response in link_responses.items():
+                tweet_text = response.get("text", "")
+                if tweet_text.startswith("RT @"):
+                    try:
+                        original_text = tweet_text[tweet_text.index(":") + 2:]
+                        original_text = original_text.replace("...", "").replace("…", "").strip()
+                        for original_tweet_text in original_tweet_text_to_url.keys():
+                            if original_tweet_text.startswith(original_text):
+                                urls_to_delete.add(original_tweet_text_to_url[original_tweet_text])
+                                break
+                    except ValueError:
+                        pass
+
+        if policy.remove_quoted_tweet:
+            original_tweet_id_to_quote_tweet_url = {}
+            for url, response in link_responses.items():
+                if "quote" in response:
+                    original_tweet_id_to_quote_tweet_url[response["quote"]["id"]] = url
+            for url, response in link_responses.items():
+                tweet_id = response.get("id")
+                if tweet_id in original_tweet_id_to_quote_tweet_url:
+                    urls_to_delete.add(url)
+
+        for url in urls_to_delete:
+            processed_message = processed_message.replace(url, '')
+
+        for url in mosaic_direct_media_urls:
+            new_url = ""
+            if policy.prefer_quoted and "quote" in link_responses[url]:
+                new_url = link_responses[url].get("quote", {}).get("media", {}).get('mosaic', {}).get("formats", {}).get("jpeg", "")
+            else:
+                new_url = link_responses[url].get("media", {}).get('mosaic', {}).get("formats", {}).get("jpeg", "")
+            if new_url:
                 processed_message = processed_message.replace(url, new_url)
 
-            return processed_message
-
-        # Fallback
-        translate_toggle = g_settings.get("translate", {}).get("toggle", False)
-        target_lang = g_settings.get("translate", {}).get("language", "en")
-        
-        for url in domain_urls:
-            if url in processed_message:
-                target_domain = g_settings.get("conversion", {}).get("twitter.com", "fxtwitter.com")
-                # Handle both twitter.com and x.com
-                current_domain = "x.com" if "x.com" in url else "twitter.com"
-                
-                if translate_toggle:
-                    match = re.search(r"/status/(\d+)", url)
-                    if match:
-                        new_url = f"https://{target_domain}/i/status/{match.group(1)}/{target_lang}"
-                    else:
-                        new_url = url.replace(current_domain, target_domain)
-                else:
-                    new_url = url.replace(current_domain, target_domain)
-                    if not new_url.endswith('/'): new_url += '/'
-
-                processed_message = processed_message.replace(url, new_url)
+        for url in direct_media_urls:
+            new_url = ""
+            response = link_responses[url]
+            quote_has_mosaic = "quote" in response and "media" in response["quote"] and "mosaic" in response["quote"]["media"]
+            
+            if policy.convert_multiple and policy.prefer_mosaic and policy.prefer_quoted and quote_has_mosaic:
+                new_url = response.get("quote", {}).get("media", {}).get('mosaic', {}).get("formats", {}).get("jpeg", "")
+            elif policy.convert_multiple and policy.prefer_quoted and quote_has_mosaic:
+                new_url = f"https://d.fxtwitter.com/i/status/{response['quote']['id']}/"
+            elif policy.prefer_quoted and "quote" in response:
+                new_url = f"https://d.fxtwitter.com/i/status/{response['quote']['id']}/"
+            else:
+                new_url = f"https://d.fxtwitter.com/i/status/{response['id']}/"
+            processed_message = processed_message.replace(url, new_url)
+
+        for url in temp_new_domain_urls:
+            new_url = ""
+            if url not in link_responses:
+                continue
+            elif policy.translate:
+                new_url = f"https://fxtwitter.com/i/status/{link_responses[url]['id']}/{policy.translate_language}"
+            else:
+                new_url = f"https://fxtwitter.com/i/status/{link_responses[url]['id']}/"
+            processed_message = processed_message.replace(url, new_url)
 
         return processed_message
 
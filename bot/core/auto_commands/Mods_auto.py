@@ -1,11 +1,12 @@
 import discord
-from discord.ext import commands, tasks
+from discord.ext import commands
 from datetime import datetime, timedelta, timezone
 from services.version_service import get_current_version
 from lang.lang_utils import t
-import asyncio
 
 class Mods_auto(commands.Cog):
+    ROLE_RESTORE_RETRY_DELAY = 60  # seconds before retrying a role restore that could not be done
+
     def __init__(self, client):
         self.client = client
         self.moderation_service = client.moderation_service
@@ -13,45 +14,67 @@ class Mods_auto(commands.Cog):
     
     @commands.Cog.listener()
     async def on_ready(self):
-        # Start task to check ended timeouts after a delay
-        await asyncio.sleep(5)
-        if not self.check_timeout_end.is_running():
-            self.check_timeout_end.start()
-    
-    @tasks.loop(minutes=1)
-    async def check_timeout_end(self):
-        """Periodically checks if timeouts are finished and restores roles"""
-        warns = self.moderation_service.warns
-        
-        for guild_id_str, guild_data in warns.items():
-            try:
-                guild = self.client.get_guild(int(guild_id_str))
-                if not guild:
-                    continue
-                
-                role = guild.get_role(self.protected_role_id)
-                if not role:
+        """Rebuilds the timeout expiry schedule from the stored warns"""
+        now = datetime.now(timezone.utc)
+        for guild_id_str, guild_data in self.moderation_service.warns.items():
+            for member_id_str, member_data in guild_data.items():
+                if not member_data.get("role_removed", False):
                     continue
-                
-                for member in guild.members:
-                    member_id_str = str(member.id)
-                    if member_id_str in guild_data:
-                        member_data = guild_data[member_id_str]
-                        
-                        if member.timed_out_until is None or member.timed_out_until < datetime.now(timezone.utc):
-                            if member_data.get("role_removed", False):
-                                    try:
-                                        await member.add_roles(role, reason=t('mods_auto_role_restored_reason', guild_id=guild.id))
-                                        member_data["role_removed"] = False
-                                        self.moderation_service.save_warns()
-                                    except Exception as e:
-                                        print(t('log_err_role_restore', error=e, guild_id=guild.id))
-            except Exception as e:
-                print(t('log_err_timeout_check', error=e)) # Global log, guild_id not strictly needed or known here
-    
-    @check_timeout_end.before_loop
-    async def before_check_timeout_end(self):
-        await self.client.wait_until_ready()
+                # Records without a stored deadline (older data) are checked right away
+                timeout_until = member_data.get("timeout_until")
+                deadline = datetime.fromisoformat(timeout_until) if timeout_until else now
+                self.schedule_role_restore(guild_id_str, member_id_str, deadline)
+
+    def schedule_role_restore(self, guild_id, member_id, deadline):
+        """Schedules the protected role restore at the end of a timeout"""
+        guild_id, member_id = str(guild_id), str(member_id)
+        self.client.scheduler.schedule(
+            ('role_restore', guild_id, member_id),
+            deadline.timestamp(),
+            lambda: self.restore_protected_role(guild_id, member_id)
+        )
+
+    def retry_role_restore(self, guild_id, member_id):
+        """Schedules another attempt of a role restore (guild not ready, transient API error)"""
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=self.ROLE_RESTORE_RETRY_DELAY)
+        self.schedule_role_restore(guild_id, member_id, retry_at)
+
+    async def restore_protected_role(self, guild_id, member_id):
+        """Restores the protected role once the member's timeout is over"""
+        member_data = self.moderation_service.warns.get(guild_id, {}).get(member_id)
+        if not member_data or not member_data.get("role_removed", False):
+            return
+
+        guild = self.client.get_guild(int(guild_id))
+        role = guild.get_role(self.protected_role_id) if guild else None
+        if not role:
+            self.retry_role_restore(guild_id, member_id)
+            return
+        # The member cache may not be filled yet (e.g. right after on_ready)
+        member = guild.get_member(int(member_id))
+        if not member:
+            try:
+                member = await guild.fetch_member(int(member_id))
+            except discord.NotFound:
+                return  # Left the guild
+            except discord.HTTPException as e:
+                print(t('log_err_role_restore', error=e, guild_id=guild.id))
+                self.retry_role_restore(guild_id, member_id)
+                return
+
+        # Timeout extended meanwhile (e.g. by a moderator): wait for the new end
+        if member.timed_out_until is not None and member.timed_out_until > datetime.now(timezone.utc):
+            self.schedule_role_restore(guild_id, member_id, member.timed_out_until)
+            return
+
+        try:
+            await member.add_roles(role, reason=t('mods_auto_role_restored_reason', guild_id=guild.id))
+            member_data["role_removed"] = False
+            member_data.pop("timeout_until", None)
+            self.moderation_service.save_member_warns(guild_id, member_id)
+        except Exception as e:
+            print(t('log_err_role_restore', error=e, guild_id=guild.id))
+            self.retry_role_restore(guild_id, member_id)
     
     async def remove_protected_role(self, member, guild):
         """Removes the protected role"""
@@ -96,16 +119,14 @@ class Mods_auto(commands.Cog):
             await self.remove_protected_role(member, guild)
             try:
                 await guild.ban(member, reason=t('mods_auto_ban_reason', guild_id=guild.id))
-                action_embed = discord.Embed(title=t('mods_auto_action_title', guild_id=guild.id), description=t('mods_auto_ban_desc', member=member.mention, guild_id=guild.id), color=discord.Color.red())
-                action_embed.set_footer(text=get_current_version(self.client, guild_id=guild.id))
+                action_embed = self.client.embed_factory.build(guild.id, 'mods_auto_action_title', 'mods_auto_ban_desc', color=discord.Color.red(), member=member.mention)
                 await channel.send(embed=action_embed)
             except: pass
         elif total_warn_count >= 15:
             await self.remove_protected_role(member, guild)
             try:
                 await guild.kick(member, reason=t('mods_auto_kick_reason', guild_id=guild.id))
-                action_embed = discord.Embed(title=t('mods_auto_action_title', guild_id=guild.id), description=t('mods_auto_kick_desc', member=member.mention, guild_id=guild.id), color=discord.Color.red())
-                action_embed.set_footer(text=get_current_version(self.client, guild_id=guild.id))
+                action_embed = self.client.embed_factory.build(guild.id, 'mods_auto_action_title', 'mods_auto_kick_desc', color=discord.Color.red(), member=member.mention)
                 await channel.send(embed=action_embed)
             except: pass
         elif total_warn_count >= 10 or total_warn_count >= 5:
@@ -116,8 +137,11 @@ class Mods_auto(commands.Cog):
                 await member.edit(timed_out_until=timeout_until, reason=t('mods_auto_timeout_reason', count=total_warn_count, guild_id=guild.id))
                 if role_was_removed:
                     guild_id, member_id = str(guild.id), str(member.id)
-                    self.moderation_service.warns[guild_id][member_id]["role_removed"] = True
-                    self.moderation_service.save_warns()
+                    member_data = self.moderation_service.warns[guild_id][member_id]
+                    member_data["role_removed"] = True
+                    member_data["timeout_until"] = timeout_until.isoformat()
+                    self.moderation_service.save_member_warns(guild_id, member_id)
+                    self.schedule_role_restore(guild_id, member_id, timeout_until)
                 
                 action_desc = t('mods_auto_timeout_desc', member=member.mention, duration=duration, count=total_warn_count, guild_id=guild.id)
                 action_embed = discord.Embed(title=t('mods_auto_action_title', guild_id=guild.id), description=action_desc, color=discord.Color.yellow())
@@ -134,18 +158,13 @@ class Mods_auto(commands.Cog):
         if message.content.startswith("="):
             return
         
-        guild_id = message.guild.id
-        banned_words_list = self.moderation_service.banned_words.get(str(guild_id), [])
-        
-        msg_lower = message.content.lower()
-        for word in banned_words_list:
-            if word.lower() in msg_lower:
-                try:
-                    await message.delete()
-                    await self.auto_warn_for_banned_word(message.author, message.guild, message.channel, word)
-                    break
-                except:
-                    pass
+        banned_word = self.moderation_service.find_banned_word(message.guild.id, message.content)
+        if banned_word:
+            try:
+                await message.delete()
+                await self.auto_warn_for_banned_word(message.author, message.guild, message.channel, banned_word)
+            except:
+                pass
 
 async def setup(client):
     await client.add_cog(Mods_auto(client))
@@ -7,7 +7,6 @@ import os
 import asyncio
 import time
 import sys
-import shutil
 # Add parent directory to path to allow importing modules from root (services, lang, etc.)
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -20,6 +19,18 @@ from lang.lang_utils import t
 from services.moderation_service import ModerationService
 from services.leveling_service import LevelingService
 from services.audio_service import AudioService
+from services.extraction_service import ExtractionService
+from services.audio_cache_service import AudioCacheService
+from services.storage_service import create_storage, migrate_json
+from services.vxt_service import vxt_service_global
+from services.version_service import VersionRegistry
+from services.scheduler_service import DeadlineScheduler
+from services.http_service import HttpService
+from services.fxtwitter_service import FxTwitterService
+from services.webhook_service import WebhookRegistry
+from services.lang_service import LangRegistry
+from services.embed_service import EmbedFactory
+from services.openai_service import OpenAIService
 
 # Centralized configuration
 CONFIG = {
@@ -31,7 +42,52 @@ CONFIG = {
         'app_version': '34.1.2',
         'manifest_app_version': '2023401020',
         'aid': '1180'
-    }
+    },
+    # yt-dlp worker pool (see services/extraction_service.py)
+    'extraction_workers': 4,
+    'extraction_per_guild': 2,
+    'background_downloads_per_guild': 2,  # prefetch and stream-first downloads, outside the slots above
+    'extraction_timeout': 60,
+    'download_timeout': 300,
+    'metadata_cache_ttl': 1800,
+    'metadata_negative_ttl': 60,
+    'metadata_cache_size': 512,
+    'audio_cache_max_mb': 2048,
+    'prefetch_depth': 2,
+    'prefetch_concurrency': 1,
+    'prefetch_budget_mb': 300,
+    'stream_first': True,
+    # Banned words: match whole words only / NFKC + casefold normalization
+    'banned_words_word_boundary': False,
+    'banned_words_normalize': False,
+    # Shared outbound HTTP session (see services/http_service.py)
+    'http_pool_size': 100,
+    'http_per_host': 10,
+    'http_dns_ttl': 300,
+    'http_timeout': 10,
+    # fxtwitter API lookups (see services/fxtwitter_service.py)
+    'fxtwitter_concurrency': 4,
+    'fxtwitter_timeout': 5,
+    'fxtwitter_cache_ttl': 300,
+    'fxtwitter_negative_ttl': 30,
+    'fxtwitter_cache_size': 1024,
+    # Link converter reposts: chunk that carries the attachments ('first' or 'last'),
+    # size above which an attachment is buffered on disk instead of in memory
+    'attachments_chunk': 'last',
+    'attachment_spool_mb': 8,
+    # Language packs: seconds between mtime checks of lang/*.json (0 disables hot reload)
+    'lang_poll_interval': 5,
+    # OpenAI requests (see services/openai_service.py): global and per-guild slots,
+    # timeout in seconds, API endpoint override (None = api.openai.com, or a local mock server)
+    'openai_concurrency': 4,
+    'openai_per_guild': 1,
+    'openai_timeout': 120,
+    'openai_base_url': None,
+    # /gpt: stream the answer into edited messages, seconds between two edits
+    'gpt_stream': True,
+    'gpt_stream_edit_interval': 1.0,
+    # Seconds between two service metrics log lines (0 disables them, /stats still works)
+    'stats_log_interval': 3600
 }
 
 # Helper function to find files (local first, then fallback to hardcoded path)
@@ -73,7 +129,10 @@ PATHS = {
     'update_logs_json': "./json/update_logs.json",
     'logs_bot': "./logs",
     'downloads_dir': "./downloads",
-    'reminders_json': "./json/reminders.json"
+    'reminders_json': "./json/reminders.json",
+    'timezones_json': "./json/user_timezones.json",
+    'vxt_lists_dir': "./json/vxt_lists",
+    'database': "./json/bot.db"
 }
 
 os.environ['PATH'] = os.path.dirname(PATHS['ffmpeg_exe']) + os.pathsep + os.path.dirname(PATHS['node_exe']) + os.pathsep + os.environ.get('PATH', '')
@@ -102,10 +161,25 @@ class DiscordBot(commands.Bot):
         self.paths = PATHS
         self.config = CONFIG
         
+        # Shared storage (imports the legacy JSON files on first start)
+        self.storage = create_storage(self)
+        migrate_json(self.storage, self.paths)
+
         # Initialize services
+        self.version_registry = VersionRegistry(self.paths['update_logs_json'])
+        self.scheduler = DeadlineScheduler()
+        self.lang_registry = LangRegistry(self)
+        self.embed_factory = EmbedFactory(self)
+        self.http_service = HttpService(self)
+        self.fxtwitter_service = FxTwitterService(self)
+        self.webhook_registry = WebhookRegistry(self)
+        self.openai_service = OpenAIService(self)
         self.moderation_service = ModerationService(self)
         self.leveling_service = LevelingService(self)
+        self.extraction_service = ExtractionService(self)
+        self.audio_cache = AudioCacheService(self)
         self.audio_service = AudioService(self)
+        vxt_service_global.attach(self)
         
         self.error_handler_cog = None
         
@@ -125,6 +199,14 @@ class DiscordBot(commands.Bot):
     async def setup_hook(self):
         """Loading extensions and initial synchronization."""
         logger.info(t('extension_loading'))
+
+        # Background persistence for leveling data
+        self.leveling_service.start()
+        self.scheduler.start()
+        self.lang_registry.start()
+        if self.config['stats_log_interval']:
+            self.scheduler.schedule(('stats_log',), time.time() + self.config['stats_log_interval'], self.log_stats)
+        self.http_service.start()
         
         # Load ErrorHandler first
         try:
@@ -165,6 +247,38 @@ class DiscordBot(commands.Bot):
         except Exception as e:
             logger.error(t('slash_sync_error', error=e))
 
+    async def close(self):
+        """Flushes pending data before shutting down."""
+        try:
+            await self.leveling_service.close()
+        except Exception as e:
+            logger.error(t('lvl_save_error', error=e))
+        await super().close()
+        self.scheduler.close()
+        self.extraction_service.close()
+        await self.http_service.close()
+        await self.openai_service.close()
+        await self.storage.close()
+
+    def get_service_stats(self):
+        """Returns the metrics of every service, by service name."""
+        return {
+            "leveling": self.leveling_service.get_flush_stats(),
+            "extraction": self.extraction_service.get_stats(),
+            "audio": self.audio_service.get_stats(),
+            "audio_cache": self.audio_cache.get_stats(),
+            "fxtwitter": self.fxtwitter_service.get_stats(),
+            "openai": self.openai_service.get_stats()
+        }
+
+    async def log_stats(self):
+        """Logs the metrics of every service, then schedules the next report."""
+        try:
+            for service, stats in self.get_service_stats().items():
+                logger.info(t('log_service_stats', service=service, stats=", ".join(f"{key}={value}" for key, value in stats.items())))
+        finally:
+            self.scheduler.schedule(('stats_log',), time.time() + self.config['stats_log_interval'], self.log_stats)
+
     async def on_ready(self):
         logger.info(t('bot_connected', user=self.user))
         logger.info(t('server_count', count=len(self.guilds)))
@@ -235,11 +349,8 @@ sys.excepthook = handle_exception
 
 if __name__ == "__main__":
     try:
-        if os.path.exists(client.paths['downloads_dir']):
-            logger.info(t('bot_starting'))
-            logger.info(t('log_cleanup_downloads', path=client.paths['downloads_dir']))
-            shutil.rmtree(client.paths['downloads_dir'])
-        os.makedirs(client.paths['downloads_dir'], exist_ok=True)
+        logger.info(t('bot_starting'))
+        logger.info(t('log_audio_cache', **client.audio_cache.get_stats()))
 
         logger.info(t('log_ytdlp_runtime', runtime=os.environ.get('YTDLP_JS_RUNTIME')))
         logger.info(t('log_node_path', path=client.paths['node_exe']))
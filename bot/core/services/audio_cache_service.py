@@ -0,0 +1,213 @@
+import asyncio
+import logging
+import os
+import re
+import shutil
+import time
+from collections import OrderedDict
+from lang.lang_utils import t
+
+logger = logging.getLogger('discord_bot')
+
+class AudioCacheService:
+    """Persistent on-disk audio cache keyed by extractor + media id.
+
+    Downloads land in a tmp/ subdirectory and are renamed into the cache only once
+    complete, so a crash never leaves a truncated file behind. File mtimes are bumped
+    on every hit and drive LRU eviction once the cache exceeds its size cap; files
+    pinned by a guild (currently playing) are never evicted.
+
+    The key of every extracted URL is remembered, so replaying a cached track
+    needs no new extraction.
+    """
+    URL_KEYS_SIZE = 4096
+
+    def __init__(self, client):
+        self.client = client
+        self.extraction_service = client.extraction_service
+        self.cache_dir = client.paths['downloads_dir']
+        self.tmp_dir = os.path.join(self.cache_dir, 'tmp')
+        self.max_bytes = client.config.get('audio_cache_max_mb', 2048) * 1024 * 1024
+
+        self._entries = {}  # key -> (path, size)
+        self._refs = {}  # key -> number of holders (playing guilds, prefetches)
+        self._pins = {}  # guild_id -> key
+        self._inflight = {}  # key -> [asyncio.Task, waiters] (shared download)
+        self._url_keys = OrderedDict()  # url -> (key, audio codec), most recently used last
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._scan()
+
+    def _scan(self):
+        """Indexes the cache directory and drops partial downloads left by a crash."""
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+        os.makedirs(self.tmp_dir, exist_ok=True)
+        for filename in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, filename)
+            if os.path.isfile(path):
+                self._entries[os.path.splitext(filename)[0]] = (path, os.path.getsize(path))
+
+    @staticmethod
+    def make_key(info):
+        """Returns the cache key of yt-dlp metadata, or None if it has no id."""
+        media_id = info.get('id')
+        if not media_id:
+            return None
+        extractor = info.get('extractor_key') or info.get('extractor') or 'generic'
+        return re.sub(r'[^A-Za-z0-9_-]', '_', f"{extractor}-{media_id}")
+
+    def remember(self, url, info):
+        """Records the cache key of the metadata extracted from url and returns it (None if it has no id)."""
+        key = self.make_key(info)
+        if key:
+            self._url_keys[url] = (key, info.get('acodec'))
+            self._url_keys.move_to_end(url)
+            while len(self._url_keys) > self.URL_KEYS_SIZE:
+                self._url_keys.popitem(last=False)
+        return key
+
+    def lookup(self, url):
+        """Returns (key, file, audio codec) of a URL already in the cache, or None (no extraction)."""
+        known = self._url_keys.get(url)
+        if known is None:
+            return None
+        key, codec = known
+        path = self.get(key)
+        if path is None:
+            return None
+        self._url_keys.move_to_end(url)
+        self.hits += 1
+        return key, path, codec
+
+    def get(self, key):
+        """Returns the cached file of key (and marks it recently used), or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        path = entry[0]
+        try:
+            os.utime(path)
+        except OSError:
+            del self._entries[key]
+            return None
+        return path
+
+    async def fetch(self, key, url, opts, guild_id=None, background=False):
+        """Returns the local file of key, downloading url into the cache on a miss.
+
+        background downloads run in the guild's background extraction slot.
+        """
+        path = self.get(key)
+        if path:
+            self.hits += 1
+            return path
+
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            self.misses += 1
+            task = asyncio.create_task(self._download(key, url, opts, guild_id, background))
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+            inflight = self._inflight[key] = [task, 0]
+        task = inflight[0]
+        inflight[1] += 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            inflight[1] -= 1
+            # Nobody waits for this download anymore (all callers cancelled)
+            if inflight[1] == 0 and not task.done():
+                task.cancel()
+
+    async def _download(self, key, url, opts, guild_id, background):
+        prefix = f"{key}_{int(time.time() * 1000)}"
+        opts = dict(opts, outtmpl=os.path.join(self.tmp_dir, f"{prefix}.%(ext)s"))
+        try:
+            _, tmp_path = await self.extraction_service.download(url, opts, guild_id=guild_id, background=background)
+            path = os.path.join(self.cache_dir, key + os.path.splitext(tmp_path)[1])
+            os.replace(tmp_path, path)
+        except BaseException:
+            for filename in os.listdir(self.tmp_dir):
+                if filename.startswith(prefix):
+                    try:
+                        os.remove(os.path.join(self.tmp_dir, filename))
+                    except OSError:
+                        pass  # Still written by the worker, dropped at next start
+            raise
+
+        # Eviction runs once the caller pinned the new file (see pin())
+        self._entries[key] = (path, os.path.getsize(path))
+        return path
+
+    def acquire(self, key):
+        """Protects key from eviction until the matching release()."""
+        self._refs[key] = self._refs.get(key, 0) + 1
+
+    def release(self, key, evict=True):
+        """Drops a reference taken with acquire()."""
+        if key not in self._refs:
+            return
+        self._refs[key] -= 1
+        if self._refs[key] <= 0:
+            del self._refs[key]
+        if evict:
+            self.evict()
+
+    def size_of(self, key):
+        entry = self._entries.get(key)
+        return entry[1] if entry else 0
+
+    def pin(self, guild_id, key):
+        """Marks key as playing in a guild, releasing the guild's previous file."""
+        self.acquire(key)
+        previous = self._pins.pop(guild_id, None)
+        if previous is not None:
+            self.release(previous, evict=False)
+        self._pins[guild_id] = key
+        self.evict()
+
+    def unpin(self, guild_id):
+        """Releases the file played by a guild."""
+        key = self._pins.pop(guild_id, None)
+        if key is not None:
+            self.release(key)
+
+    def evict(self):
+        """Removes least recently used unpinned files until the cache fits its size cap."""
+        total = sum(size for _, size in self._entries.values())
+        if total <= self.max_bytes:
+            return
+
+        def last_used(key):
+            try:
+                return os.path.getmtime(self._entries[key][0])
+            except OSError:
+                return 0
+        candidates = sorted((key for key in self._entries if key not in self._refs), key=last_used)
+        for key in candidates:
+            if total <= self.max_bytes:
+                break
+            path, size = self._entries[key]
+            try:
+                if os.path.exists(path):
+                    os.remove(path)
+            except OSError:
+                continue  # Locked (FFmpeg still exiting), retried on the next eviction
+            del self._entries[key]
+            total -= size
+            self.evictions += 1
+            logger.debug(t('log_cache_evicted', file=os.path.basename(path)))
+
+    def get_stats(self):
+        """Returns cache usage metrics."""
+        return {
+            "files": len(self._entries),
+            "size_mb": round(sum(size for _, size in self._entries.values()) / (1024 * 1024), 1),
+            "max_mb": round(self.max_bytes / (1024 * 1024), 1),
+            "pinned": len(self._refs),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
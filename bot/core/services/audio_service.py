@@ -5,6 +5,18 @@ import os
 from lang.lang_utils import t
 
 class AudioService:
+    DEFAULT_VOLUME = 0.3
+    UNITY_VOLUME = 1.0  # Opus sources are passed through untouched at this volume
+    # ffmpeg flags:
+    # -reconnect: keep streams alive
+    # -probesize 32 / -analyzeduration 0: instant start (not for Opus passthrough,
+    #   which needs the stream parameters to copy the packets)
+    # -loglevel panic: no I/O delay from logging
+    # -threads 0: use all CPU cores
+    FFMPEG_RECONNECT = '-reconnect 1 -reconnect_streamed 1 -reconnect_delay_max 5'
+    FFMPEG_FAST_PROBE = '-probesize 32 -analyzeduration 0'
+    FFMPEG_LOGLEVEL = '-loglevel panic'
+
     def __init__(self, client):
         self.client = client
         self.queues: Dict[int, List[Dict[str, Any]]] = {}  # guild_id -> list of videos
@@ -14,18 +26,30 @@ class AudioService:
         self.history: Dict[int, List[Dict[str, Any]]] = {}  # guild_id -> previous songs
         self.current_track: Dict[int, Dict[str, Any]] = {}  # guild_id -> current playing track
         self.ffmpeg_path = client.paths['ffmpeg_exe']
-        # Optimized flags: 
-        # -threads 0: use all CPU cores
-        # -probesize 32 / -analyzeduration 0: instant start
-        # -loglevel panic: no I/O delay from logging
-        # -reconnect: keep streams alive
-        self.ffmpeg_options = {
-            'before_options': '-reconnect 1 -reconnect_streamed 1 -reconnect_delay_max 5 -probesize 32 -analyzeduration 0 -loglevel panic',
-            'options': '-vn -threads 0',
-            'executable': self.ffmpeg_path
-        }
         self._last_play_time: Dict[int, float] = {}
         self._last_seek_offset: Dict[int, int] = {}
+        # Every play_audio call starts a new generation: after-callbacks of replaced
+        # sources (seek, volume change, previous) are ignored
+        self._generations: Dict[int, int] = {}
+        self._after_callbacks: Dict[int, Any] = {}
+        self._sources: Dict[int, discord.AudioSource] = {}  # guild_id -> source of the current track
+        self._baked_volumes: Dict[int, float] = {}  # guild_id -> volume applied by ffmpeg to the current track
+        self._volume_restarts: Dict[int, asyncio.Task] = {}  # guild_id -> restart applying a new volume
+        self.play_modes = {'passthrough': 0, 'opus': 0, 'pcm': 0}  # tracks started per output mode
+        self.volume_restarts = 0
+
+        # Lookahead pipeline: the next queue entries are resolved and downloaded
+        # into the audio cache while the current track plays.
+        self.extraction_service = client.extraction_service
+        self.audio_cache = client.audio_cache
+        self.prefetch_depth = client.config.get('prefetch_depth', 2)
+        self.prefetch_concurrency = client.config.get('prefetch_concurrency', 1)
+        self.prefetch_budget = client.config.get('prefetch_budget_mb', 300) * 1024 * 1024
+        self._prefetches: Dict[int, Dict[int, Any]] = {}  # guild_id -> {id(entry): (entry, task)}
+        self._prefetch_slots: Dict[int, asyncio.Semaphore] = {}
+        self._prefetch_reserved: Dict[int, int] = {}  # guild_id -> estimated bytes of running prefetch downloads
+        self.stream_first = client.config.get('stream_first', True)
+        self._handoffs: Dict[int, Dict[str, Any]] = {}  # guild_id -> background download of the streamed track
 
     def get_queue(self, guild_id: int) -> List[Dict[str, Any]]:
         if guild_id not in self.queues:
@@ -35,21 +59,279 @@ class AudioService:
     def clear_queue(self, guild_id: int):
         if guild_id in self.queues:
             self.queues[guild_id].clear()
+        self.sync_prefetch(guild_id)
+
+    def enqueue(self, guild_id: int, track: Dict[str, Any]) -> int:
+        """Appends a track to the queue and returns its position."""
+        queue = self.get_queue(guild_id)
+        queue.append(track)
+        self.sync_prefetch(guild_id)
+        return len(queue)
+
+    def remove_from_queue(self, guild_id: int, index: int) -> Dict[str, Any]:
+        """Removes and returns the queue entry at index."""
+        removed = self.get_queue(guild_id).pop(index)
+        self.sync_prefetch(guild_id)
+        return removed
+
+    def get_ydl_opts(self, **overrides) -> Dict[str, Any]:
+        """Generate YoutubeDL options with central config and optional overrides."""
+        opts = {
+            'format': 'bestaudio/best',
+            'quiet': True,
+            'no_warnings': True,
+            'js_runtimes': {'node': {'path': self.client.paths['node_exe']}},
+            'extractor_args': {
+                'tiktok': self.client.config.get('tiktok_args', {})
+            }
+        }
+        opts.update(overrides)
+        return opts
+
+    async def _resolve(self, guild_id: int, track: Dict[str, Any]):
+        """Returns (metadata, cache key) of a track."""
+        # Same metadata options as the lookups so the download reuses their cached metadata
+        original_url = track.get('original_url', track['url'])
+        info = await self.extraction_service.extract_info(original_url, self.get_ydl_opts(noplaylist=True), guild_id=guild_id)
+        cache_key = self.audio_cache.remember(original_url, info)
+        if not cache_key:
+            raise ValueError(t('audio_error_no_media_id', guild_id=guild_id))
+        return info, cache_key
+
+    async def prepare_track(self, guild_id: int, track: Dict[str, Any]):
+        """Returns (source, is_local, headers, codec) to play a track.
+
+        Cached (or prefetched) tracks play from the local file, which gets pinned;
+        a URL already in the cache is played without extracting it again. Otherwise, in stream-first mode, playback starts from the extracted stream
+        URL while the file downloads in the background; seeks switch to the local
+        file once it is complete (see _apply_handoff).
+        """
+        original_url = track.get('original_url', track['url'])
+        prefetch = self._take_prefetch(guild_id, track)
+        self.sync_prefetch(guild_id)
+        handoff = self._handoffs.get(guild_id)
+        if handoff and handoff['original_url'] != original_url:
+            self.cancel_handoff(guild_id)
+
+        try:
+            cached = self.audio_cache.lookup(original_url)
+            if cached:
+                cache_key, path, codec = cached
+                self.audio_cache.pin(guild_id, cache_key)
+                return path, True, None, codec
+
+            info, cache_key = await self._resolve(guild_id, track)
+            path = self.audio_cache.get(cache_key)
+            if not path and self.stream_first and info.get('url'):
+                if guild_id not in self._handoffs:
+                    self._handoffs[guild_id] = {
+                        'original_url': original_url,
+                        'cache_key': cache_key,
+                        'path': None,
+                        'task': asyncio.create_task(self._download_handoff(guild_id, track, cache_key, prefetch))
+                    }
+                    prefetch = None  # Now owned by the handoff
+                self.audio_cache.unpin(guild_id)  # The previous track's file is no longer played
+                return info['url'], False, info.get('http_headers'), info.get('acodec')
+
+            if not path:
+                if prefetch and not prefetch.done():
+                    await asyncio.wait([prefetch])
+                path = await self.audio_cache.fetch(cache_key, original_url, self.get_ydl_opts(noplaylist=True), guild_id=guild_id)
+            self.audio_cache.pin(guild_id, cache_key)
+            return path, True, None, info.get('acodec')
+        finally:
+            if prefetch:
+                self._drop_prefetch(prefetch)
+
+    async def _download_handoff(self, guild_id: int, track: Dict[str, Any], cache_key: str, prefetch: Optional[asyncio.Task]):
+        """Downloads the track being streamed, then hands its playback over to the local file."""
+        self.audio_cache.acquire(cache_key)
+        try:
+            path = await self.audio_cache.fetch(cache_key, track.get('original_url', track['url']), self.get_ydl_opts(noplaylist=True),
+                                                guild_id=guild_id, background=True)
+            if prefetch and not prefetch.done():
+                await asyncio.wait([prefetch])
+            handoff = self._handoffs.get(guild_id)
+            if handoff and handoff['task'] is asyncio.current_task():
+                handoff['path'] = path
+                self._apply_handoff(guild_id)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(t('log_err_download', url=track.get('original_url', track['url']), error=str(e)))
+        finally:
+            if prefetch:
+                self._drop_prefetch(prefetch)
+            self.audio_cache.release(cache_key)
+
+    def _apply_handoff(self, guild_id: int):
+        """Switches the current streamed track to its downloaded file (future seeks play locally)."""
+        handoff = self._handoffs.get(guild_id)
+        track = self.current_track.get(guild_id)
+        if not handoff or not handoff['path'] or not track:
+            return
+        if track.get('original_url') != handoff['original_url'] or track.get('is_local'):
+            return
+        self.audio_cache.pin(guild_id, handoff['cache_key'])
+        track['is_local'] = True
+        track['path'] = handoff['path']
+        del self._handoffs[guild_id]
+
+    def cancel_handoff(self, guild_id: int):
+        """Stops the background download of the track streamed in a guild."""
+        handoff = self._handoffs.pop(guild_id, None)
+        if handoff and not handoff['task'].done():
+            handoff['task'].cancel()
+
+    def _prefetch_slot(self, guild_id: int) -> asyncio.Semaphore:
+        if guild_id not in self._prefetch_slots:
+            self._prefetch_slots[guild_id] = asyncio.Semaphore(self.prefetch_concurrency)
+        return self._prefetch_slots[guild_id]
+
+    def _prefetched_bytes(self, guild_id: int) -> int:
+        """Bytes held by the guild's prefetches, downloads still running included (estimated)."""
+        total = self._prefetch_reserved.get(guild_id, 0)
+        for _, task in self._prefetches.get(guild_id, {}).values():
+            if task.done() and not task.cancelled() and not task.exception() and task.result():
+                total += self.audio_cache.size_of(task.result())
+        return total
+
+    async def _prefetch(self, guild_id: int, track: Dict[str, Any]) -> Optional[str]:
+        """Downloads a queued track into the cache and holds it until played or dropped."""
+        async with self._prefetch_slot(guild_id):
+            cached = self.audio_cache.lookup(track.get('original_url', track['url']))
+            if cached:
+                self.audio_cache.acquire(cached[0])
+                return cached[0]
+
+            info, cache_key = await self._resolve(guild_id, track)
+            estimate = 0
+            if not self.audio_cache.get(cache_key):
+                estimate = info.get('filesize') or info.get('filesize_approx') or 0
+                if self._prefetched_bytes(guild_id) + estimate > self.prefetch_budget:
+                    return None  # Over the guild's disk budget, downloaded when played
+            self.audio_cache.acquire(cache_key)
+            self._prefetch_reserved[guild_id] = self._prefetch_reserved.get(guild_id, 0) + estimate
+            try:
+                await self.audio_cache.fetch(cache_key, track.get('original_url', track['url']), self.get_ydl_opts(noplaylist=True),
+                                             guild_id=guild_id, background=True)
+            except BaseException:
+                self.audio_cache.release(cache_key)
+                raise
+            finally:
+                self._prefetch_reserved[guild_id] -= estimate
+            return cache_key
+
+    def _drop_prefetch(self, task: asyncio.Task):
+        if not task.done():
+            task.cancel()
+        elif not task.cancelled() and not task.exception() and task.result():
+            self.audio_cache.release(task.result())
+
+    def _take_prefetch(self, guild_id: int, track: Dict[str, Any]) -> Optional[asyncio.Task]:
+        """Detaches the prefetch of a track that is about to play (the caller awaits it)."""
+        entry = self._prefetches.get(guild_id, {}).pop(id(track), None)
+        return entry[1] if entry else None
+
+    def sync_prefetch(self, guild_id: int):
+        """Prefetches the next queue entries and cancels prefetches of entries no longer ahead."""
+        queue = self.queues.get(guild_id, [])
+        wanted = queue[:self.prefetch_depth]
+        wanted_ids = {id(entry) for entry in wanted}
+        prefetches = self._prefetches.setdefault(guild_id, {})
+
+        for entry_id, (entry, task) in list(prefetches.items()):
+            if entry_id not in wanted_ids:
+                del prefetches[entry_id]
+                self._drop_prefetch(task)
+
+        for entry in wanted:
+            if id(entry) not in prefetches:
+                task = asyncio.create_task(self._prefetch(guild_id, entry))
+                task.add_done_callback(self._log_prefetch_error)
+                prefetches[id(entry)] = (entry, task)
+
+    @staticmethod
+    def _log_prefetch_error(task: asyncio.Task):
+        if not task.cancelled() and task.exception():
+            print(t('log_prefetch_error', error=task.exception()))
+
+    def cancel_prefetches(self, guild_id: int):
+        """Drops every prefetch of a guild (session ended)."""
+        for _, task in self._prefetches.pop(guild_id, {}).values():
+            self._drop_prefetch(task)
 
     def set_volume(self, guild_id: int, volume: float):
         """Set volume for guild (0.0 to 2.0)."""
         new_vol = max(0.0, min(2.0, volume))
         self.volumes[guild_id] = new_vol
         
-        # Apply to active voice client if possible
         voice = discord.utils.get(self.client.voice_clients, guild__id=guild_id)
-        if voice and voice.source:
-            if isinstance(voice.source, discord.PCMVolumeTransformer):
-                voice.source.volume = new_vol
+        if voice and (voice.is_playing() or voice.is_paused()):
+            self._reapply_volume(voice.guild)
+
+    def _reapply_volume(self, guild: discord.Guild):
+        """Applies the guild volume to the current track.
+
+        PCM sources change volume live. Opus sources have their volume applied
+        by ffmpeg: they are restarted once at their position, as a PCM source
+        unless the new volume is 100% or the default. While paused, the restart
+        waits for resume().
+        """
+        source = self._sources.get(guild.id)
+        if source is None or not self.current_track.get(guild.id):
+            return
+        volume = self.get_volume(guild.id)
+        if isinstance(source, discord.PCMVolumeTransformer):
+            source.volume = volume
+            return
+        voice = discord.utils.get(self.client.voice_clients, guild=guild)
+        if self._baked_volumes.get(guild.id) == volume or guild.id in self._volume_restarts or not (voice and voice.is_playing()):
+            return
+        # The restart reads the volume when it starts, so later changes need no other task
+        task = asyncio.get_running_loop().create_task(self.seek(guild, self.get_current_position(guild.id)))
+        self._volume_restarts[guild.id] = task
+        task.add_done_callback(lambda _: self._volume_restarts.pop(guild.id, None))
+        self.volume_restarts += 1
 
     def get_volume(self, guild_id: int) -> float:
         """Get current volume for guild (default 0.3)."""
-        return self.volumes.get(guild_id, 0.3)
+        return self.volumes.get(guild_id, self.DEFAULT_VOLUME)
+
+    def get_stats(self):
+        """Returns playback output metrics."""
+        started = sum(self.play_modes.values())
+        return {
+            **self.play_modes,
+            "passthrough_rate": f"{self.play_modes['passthrough'] / started * 100:.1f}%" if started else "0.0%",
+            "volume_restarts": self.volume_restarts
+        }
+
+    def _ffmpeg_options(self, is_local: bool, start_time: int = 0, headers: Dict[str, str] = None, fast_probe: bool = True) -> Dict[str, str]:
+        """Builds the ffmpeg options of a track."""
+        before = []
+        if start_time > 0:
+            before.append(f'-ss {start_time}')
+        if not is_local:
+            before.append(self.FFMPEG_RECONNECT)
+        if fast_probe:
+            before.append(self.FFMPEG_FAST_PROBE)
+        before.append(self.FFMPEG_LOGLEVEL)
+
+        # Add headers if provided (User-Agent and Referer are most critical)
+        # Most streaming sites only need UA and Referer.
+        if headers and not is_local:
+            if 'User-Agent' in headers:
+                before.append(f'-user_agent "{headers["User-Agent"]}"')
+            if 'Referer' in headers:
+                before.append(f'-headers "Referer: {headers["Referer"]}\r\n"')
+
+        return {
+            'before_options': ' '.join(before),
+            'options': '-vn -threads 0' if is_local else '-vn',
+            'executable': self.ffmpeg_path
+        }
 
     def add_to_history(self, guild_id: int, track: Dict[str, Any]):
         """Add track to history."""
@@ -88,12 +370,22 @@ class AudioService:
                     await asyncio.sleep(1.5 * (i + 1))
             return None
 
-    async def play_audio(self, guild: discord.Guild, source_url: str, is_local: bool = False, after_cb=None, title: str = None, start_time: int = 0, duration: int = None, headers: Dict[str, str] = None, original_url: str = None):
-        """Plays audio from a URL or local path."""
+    async def play_audio(self, guild: discord.Guild, source_url: str, is_local: bool = False, after_cb=None, title: str = None, start_time: int = 0, duration: int = None, headers: Dict[str, str] = None, original_url: str = None, codec: str = None):
+        """Plays audio from a URL or local path.
+
+        At 100% and at the default volume, audio is sent as Opus produced by ffmpeg:
+        Opus sources at 100% are passed through without re-encoding, others are
+        encoded by ffmpeg with a volume filter. Other volumes use PCM with a volume
+        adjustable while playing.
+        """
         voice = discord.utils.get(self.client.voice_clients, guild=guild)
         if not voice:
             return
 
+        generation = self._generations.get(guild.id, 0) + 1
+        self._generations[guild.id] = generation
+        self._after_callbacks[guild.id] = after_cb
+
         # Add to history if starting a NEW track (not seeking)
         if guild.id in self.current_track and self.current_track[guild.id] and start_time == 0:
             # Check if it's actually different from what we are starting
@@ -105,41 +397,35 @@ class AudioService:
             voice.stop()
             await asyncio.sleep(0.5)
 
+        # Output mode: Opus packets copied as-is (Opus source at 100%), Opus encoded by
+        # ffmpeg (100% or default volume), or PCM with a live volume in Python
         volume = self.get_volume(guild.id)
-
-        if is_local:
-            # For local files, we still want performance flags
-            options = {
-                'before_options': '-probesize 32 -analyzeduration 0 -loglevel panic',
-                'options': '-vn -threads 0',
-                'executable': self.ffmpeg_path
-            }
-            if start_time > 0:
-                options['before_options'] = f'-ss {start_time} {options["before_options"]}'
+        if volume == self.UNITY_VOLUME and codec == 'opus':
+            mode = 'passthrough'
+        elif volume in (self.UNITY_VOLUME, self.DEFAULT_VOLUME):
+            mode = 'opus'
+        else:
+            mode = 'pcm'
+        options = self._ffmpeg_options(is_local, start_time, headers, fast_probe=mode != 'passthrough')
+
+        if mode == 'passthrough':
+            ffmpeg_source = discord.FFmpegOpusAudio(source_url, codec='copy', **options)
+        elif mode == 'opus':
+            if volume != self.UNITY_VOLUME:
+                options['options'] += f' -filter:a volume={volume}'
+            ffmpeg_source = discord.FFmpegOpusAudio(source_url, **options)
         else:
-            before_opts = self.ffmpeg_options['before_options']
-            if start_time > 0:
-                before_opts = f'-ss {start_time} {before_opts}'
-
-            # Add headers if provided (User-Agent and Referer are most critical)
-            if headers:
-                if 'User-Agent' in headers:
-                    before_opts += f' -user_agent "{headers["User-Agent"]}"'
-                if 'Referer' in headers:
-                    before_opts += f' -headers "Referer: {headers["Referer"]}\r\n"'
-                # For others, we try to pass them but carefully. 
-                # Most streaming sites only need UA and Referer.
+            ffmpeg_source = discord.PCMVolumeTransformer(discord.FFmpegPCMAudio(source_url, **options), volume=volume)
+        self.play_modes[mode] += 1
 
-            options = {
-                'before_options': before_opts,
-                'options': '-vn',
-                'executable': self.ffmpeg_path
-            }
+        def after(error):
+            # Ignore sources replaced by a newer play_audio call
+            if after_cb and self._generations.get(guild.id) == generation:
+                after_cb(error)
 
-        ffmpeg_source = discord.FFmpegPCMAudio(source_url, **options)
-        volume_source = discord.PCMVolumeTransformer(ffmpeg_source, volume=volume)
-        
-        voice.play(volume_source, after=after_cb)
+        voice.play(ffmpeg_source, after=after)
+        self._sources[guild.id] = ffmpeg_source
+        self._baked_volumes[guild.id] = volume
         self.pause_states[guild.id] = False
 
         # Position tracking
@@ -156,10 +442,12 @@ class AudioService:
                 'headers': headers,
                 'is_local': is_local,
                 'path': source_url if is_local else None,
-                'original_url': original_url or source_url
+                'original_url': original_url or source_url,
+                'codec': codec
             }
         elif duration is not None:
             self.current_track[guild.id]['duration'] = duration
+        self._apply_handoff(guild.id)
 
     def stop(self, guild: discord.Guild):
         voice = discord.utils.get(self.client.voice_clients, guild=guild)
@@ -192,6 +480,8 @@ class AudioService:
             # Update play time on resume
             import time
             self._last_play_time[guild.id] = time.time()
+            # Apply a volume changed while paused
+            self._reapply_volume(guild)
             return True
         return False
 
@@ -241,9 +531,9 @@ class AudioService:
         # For local files, the URL is the local path
         url = track.get('path') if is_local else track['url']
         
-        await self.play_audio(guild, url, is_local=is_local, after_cb=after_cb,
+        await self.play_audio(guild, url, is_local=is_local, after_cb=after_cb or self._after_callbacks.get(guild.id),
                              title=track['title'], start_time=max(0, seconds), duration=track.get('duration'),
-                             headers=track.get('headers'))
+                             headers=track.get('headers'), codec=track.get('codec'))
         return True
 
     async def dc_if_empty(self, voice_client: discord.VoiceClient):
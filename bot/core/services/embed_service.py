@@ -0,0 +1,44 @@
+import discord
+from lang import lang_utils
+from services.version_service import get_current_version
+
+class EmbedFactory:
+    """Builds the bot's standard response embeds: a translated title and
+    description, an optional "requested by" author and the version footer.
+
+    The texts that only depend on the template and the language are resolved
+    once per (template, language) and kept as a skeleton; a call only renders
+    the templates that take arguments. Skeletons remember the bundle they were
+    built from, so a language reload or a guild language change rebuilds them.
+    """
+
+    def __init__(self, client):
+        self.client = client
+        self._skeletons = {}  # (lang, title_key, description_key) -> (bundle, title, description)
+
+    def _skeleton(self, tr, title_key, description_key):
+        key = (tr.lang, title_key, description_key)
+        skeleton = self._skeletons.get(key)
+        if skeleton is None or skeleton[0] is not tr:
+            # None marks a template rendered per call
+            title = tr(title_key) if tr.is_static(title_key) else None
+            description = None
+            if description_key is not None and tr.is_static(description_key):
+                description = tr(description_key)
+            skeleton = self._skeletons[key] = (tr, title, description)
+        return skeleton
+
+    def build(self, guild_id, title_key, description_key=None, *, color=None, author=None, footer=True, **kwargs):
+        """Returns a new embed. kwargs fill the placeholders of the title and description templates."""
+        tr, title, description = self._skeleton(lang_utils.get_bundle(guild_id=guild_id), title_key, description_key)
+        if title is None:
+            title = tr(title_key, **kwargs)
+        if description is None and description_key is not None:
+            description = tr(description_key, **kwargs)
+
+        embed = discord.Embed(title=title, description=description, color=color)
+        if author is not None:
+            embed.set_author(name=tr('help_requested_by', user=author.name), icon_url=author.avatar)
+        if footer:
+            embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+        return embed
@@ -0,0 +1,275 @@
+import asyncio
+import concurrent.futures
+import copy
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from yt_dlp import YoutubeDL
+from lang.lang_utils import t
+
+logger = logging.getLogger('discord_bot')
+
+class ExtractionCancelled(Exception):
+    """Raised inside a worker when its job was cancelled or timed out."""
+
+
+class ExtractionService:
+    """Runs blocking yt-dlp calls in a bounded worker pool.
+
+    A job first takes a slot of its guild (per_guild_limit), then a global worker
+    slot, so a single guild cannot occupy the whole pool. Background downloads
+    (prefetch, stream-first handoff) take a separate guild slot
+    (background_per_guild) and never the last worker, so they cannot delay the
+    lookups a user is waiting for. Worker slots are only
+    released once the thread really finished, and downloads stop at the next
+    progress hook after a timeout or cancellation.
+
+    Metadata lookups go through a TTL + LRU cache shared by all guilds. Failures
+    are cached for a shorter time, and entries never outlive the expiry of the
+    signed stream URLs they contain.
+    """
+    EXPIRE_PATTERN = re.compile(r'[?&/]expire[=/](\d+)')
+    EXPIRE_MARGIN = 60  # seconds kept before a signed URL expires
+
+    def __init__(self, client):
+        self.client = client
+        self.max_workers = client.config.get('extraction_workers', 4)
+        self.per_guild_limit = client.config.get('extraction_per_guild', 2)
+        self.extract_timeout = client.config.get('extraction_timeout', 60)
+        self.download_timeout = client.config.get('download_timeout', 300)
+
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="ytdlp")
+        self._workers = asyncio.Semaphore(self.max_workers)
+        self._guild_slots = {}  # guild_id -> asyncio.Semaphore
+        self.background_per_guild = client.config.get('background_downloads_per_guild', 2)
+        self._background_slots = {}  # guild_id -> asyncio.Semaphore
+        self._background_workers = asyncio.Semaphore(max(1, self.max_workers - 1))
+
+        # Metadata cache: key -> (expires_at, info or exception)
+        self.cache_ttl = client.config.get('metadata_cache_ttl', 1800)
+        self.negative_ttl = client.config.get('metadata_negative_ttl', 60)
+        self.cache_size = client.config.get('metadata_cache_size', 512)
+        self._cache = OrderedDict()
+        self._inflight = {}  # key -> [asyncio.Task, waiter count] shared by identical lookups
+
+        # Metrics
+        self.queued = 0  # jobs waiting for a slot
+        self.running = 0
+        self.completed = 0
+        self.failed = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.total_latency = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def _guild_slot(self, guild_id):
+        slot = self._guild_slots.get(guild_id)
+        if slot is None:
+            slot = self._guild_slots[guild_id] = asyncio.Semaphore(self.per_guild_limit)
+        return slot
+
+    def _background_slot(self, guild_id):
+        slot = self._background_slots.get(guild_id)
+        if slot is None:
+            slot = self._background_slots[guild_id] = asyncio.Semaphore(self.background_per_guild)
+        return slot
+
+    async def _run(self, guild_id, job, timeout, background=False):
+        """Runs job(cancel_event) in the pool with fairness, timeout and cancellation."""
+        loop = asyncio.get_running_loop()
+        cancel_event = threading.Event()
+        queued_at = time.perf_counter()
+        guild_slot = self._background_slot(guild_id) if background else self._guild_slot(guild_id)
+
+        self.queued += 1
+        try:
+            async with guild_slot:
+                if background:
+                    await self._background_workers.acquire()
+                try:
+                    await self._workers.acquire()
+                except BaseException:
+                    if background:
+                        self._background_workers.release()
+                    raise
+                self.queued -= 1
+                started_at = time.perf_counter()
+                self.total_wait += started_at - queued_at
+                self.running += 1
+
+                def release(_):
+                    try:
+                        loop.call_soon_threadsafe(self._workers.release)
+                        if background:
+                            loop.call_soon_threadsafe(self._background_workers.release)
+                    except RuntimeError:
+                        pass  # Event loop already closed (shutdown)
+
+                future = self._executor.submit(job, cancel_event)
+                future.add_done_callback(release)
+                try:
+                    result = await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+                except asyncio.TimeoutError:
+                    cancel_event.set()
+                    future.cancel()
+                    self.timeouts += 1
+                    self.failed += 1
+                    logger.warning(t('audio_extraction_timeout', seconds=timeout))
+                    raise TimeoutError(t('audio_extraction_timeout', seconds=timeout))
+                except asyncio.CancelledError:
+                    cancel_event.set()
+                    future.cancel()
+                    raise
+                except Exception:
+                    self.failed += 1
+                    raise
+                finally:
+                    self.running -= 1
+                    self.total_latency += time.perf_counter() - started_at
+
+                self.completed += 1
+                return result
+        except asyncio.CancelledError:
+            if cancel_event.is_set():
+                raise
+            # Cancelled while still waiting for a slot
+            self.queued -= 1
+            raise
+
+    @staticmethod
+    def _with_cancel_hook(opts, cancel_event):
+        def hook(_):
+            if cancel_event.is_set():
+                raise ExtractionCancelled()
+        opts = dict(opts)
+        opts['progress_hooks'] = list(opts.get('progress_hooks', [])) + [hook]
+        return opts
+
+    @staticmethod
+    def _cache_key(url, opts):
+        """Only the options that change the extracted metadata are part of the key."""
+        return (url, opts.get('format'), bool(opts.get('extract_flat')), bool(opts.get('noplaylist')))
+
+    def _cache_get(self, key):
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return entry[1]
+
+    def _cache_put(self, key, value, ttl):
+        if ttl <= 0:
+            return
+        self._cache[key] = (time.monotonic() + ttl, value)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _ttl_for(self, info):
+        """Caps the cache TTL to the earliest expiry of the signed stream URLs in info."""
+        ttl = self.cache_ttl
+        urls = [info.get('url')] + [f.get('url') for f in info.get('requested_formats') or []]
+        for url in urls:
+            match = self.EXPIRE_PATTERN.search(url or '')
+            if match:
+                ttl = min(ttl, int(match.group(1)) - time.time() - self.EXPIRE_MARGIN)
+        return ttl
+
+    async def extract_info(self, url, opts, guild_id=None, timeout=None):
+        """Returns yt-dlp metadata for url (no download). The result is shared and must not be mutated."""
+        key = self._cache_key(url, opts)
+        cached = self._cache_get(key)
+        if cached is not None:
+            self.cache_hits += 1
+            if isinstance(cached, Exception):
+                raise cached
+            return cached
+
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            self.cache_misses += 1
+            task = asyncio.get_running_loop().create_task(self._extract(key, url, opts, guild_id, timeout))
+            inflight = self._inflight[key] = [task, 0]
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.cache_hits += 1
+
+        task = inflight[0]
+        inflight[1] += 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            # A cancelled waiter only stops the extraction nobody else waits for
+            if inflight[1] == 1 and not task.done():
+                task.cancel()
+            raise
+        finally:
+            inflight[1] -= 1
+
+    async def _extract(self, key, url, opts, guild_id, timeout):
+        """Runs one extraction shared by the waiters of extract_info and caches its result."""
+        def job(cancel_event):
+            with YoutubeDL(opts) as ydl:
+                return ydl.extract_info(url, download=False)
+
+        try:
+            info = await self._run(guild_id, job, timeout or self.extract_timeout)
+        except Exception as e:
+            # Timeouts are transient (pool saturation), only extraction errors are cached
+            if not isinstance(e, TimeoutError):
+                self._cache_put(key, e, self.negative_ttl)
+            raise
+
+        if info:
+            self._cache_put(key, info, self._ttl_for(info))
+        return info
+
+    async def download(self, url, opts, guild_id=None, timeout=None, background=False):
+        """Downloads url and returns (info, file path), reusing cached metadata when available.
+
+        background downloads run in the guild's background slot.
+        """
+        cached = self._cache_get(self._cache_key(url, opts))
+        cached = cached if isinstance(cached, dict) else None
+
+        def job(cancel_event):
+            with YoutubeDL(self._with_cancel_hook(opts, cancel_event)) as ydl:
+                info = None
+                if cached:
+                    try:
+                        info = ydl.process_ie_result(copy.deepcopy(cached), download=True)
+                    except Exception:
+                        if cancel_event.is_set():
+                            raise
+                        info = None  # Stale metadata, extract again
+                if info is None:
+                    info = ydl.extract_info(url, download=True)
+                return info, ydl.prepare_filename(info)
+        return await self._run(guild_id, job, timeout or self.download_timeout, background)
+
+    def get_stats(self):
+        """Returns queue depth and latency metrics."""
+        finished = self.completed + self.failed
+        return {
+            "workers": self.max_workers,
+            "queued": self.queued,
+            "running": self.running,
+            "completed": self.completed,
+            "failed": self.failed,
+            "timeouts": self.timeouts,
+            "avg_wait_ms": round(self.total_wait / finished * 1000, 2) if finished else 0.0,
+            "avg_latency_ms": round(self.total_latency / finished * 1000, 2) if finished else 0.0,
+            "cache_entries": len(self._cache),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses
+        }
+
+    def close(self):
+        """Drops queued jobs and stops the pool without waiting for running ones."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
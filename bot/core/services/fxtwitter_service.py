@@ -0,0 +1,91 @@
+import asyncio
+import time
+from collections import OrderedDict
+import aiohttp
+
+class FxTwitterService:
+    """Fetches tweet JSON from the fxtwitter API through the shared HTTP session.
+
+    Responses are kept in a TTL + LRU cache keyed by status id, and concurrent
+    lookups of the same status share one request. Batches run concurrently
+    under a global request limit.
+    """
+    API_URL = "https://api.fxtwitter.com/status/{}"
+
+    def __init__(self, client):
+        self.client = client
+        self.request_timeout = client.config.get('fxtwitter_timeout', 5)
+        self.cache_ttl = client.config.get('fxtwitter_cache_ttl', 300)
+        self.negative_ttl = client.config.get('fxtwitter_negative_ttl', 30)
+        self.cache_size = client.config.get('fxtwitter_cache_size', 1024)
+
+        self._limit = asyncio.Semaphore(client.config.get('fxtwitter_concurrency', 4))
+        self._cache = OrderedDict()  # status_id -> (expires_at, tweet or None)
+        self._inflight = {}  # status_id -> asyncio.Task shared by identical lookups
+
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def _cache_get(self, status_id):
+        entry = self._cache.get(status_id)
+        if entry is None:
+            return False, None
+        if entry[0] <= time.monotonic():
+            del self._cache[status_id]
+            return False, None
+        self._cache.move_to_end(status_id)
+        return True, entry[1]
+
+    def _cache_put(self, status_id, tweet, ttl):
+        self._cache[status_id] = (time.monotonic() + ttl, tweet)
+        self._cache.move_to_end(status_id)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    async def _request(self, status_id):
+        tweet = None
+        try:
+            async with self._limit:
+                session = self.client.http_service.session
+                async with session.get(self.API_URL.format(status_id), timeout=aiohttp.ClientTimeout(total=self.request_timeout)) as resp:
+                    if resp.status == 200:
+                        data = await resp.json()
+                        tweet = data["tweet"]
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            pass
+        self._cache_put(status_id, tweet, self.cache_ttl if tweet else self.negative_ttl)
+        return tweet
+
+    async def fetch(self, status_id):
+        """Returns the tweet JSON of a status id, or None if unavailable."""
+        status_id = str(status_id)
+        found, tweet = self._cache_get(status_id)
+        if found:
+            self.cache_hits += 1
+            return tweet
+
+        task = self._inflight.get(status_id)
+        if task is None:
+            self.cache_misses += 1
+            task = asyncio.create_task(self._request(status_id))
+            self._inflight[status_id] = task
+            task.add_done_callback(lambda _: self._inflight.pop(status_id, None))
+        else:
+            self.cache_hits += 1
+        return await asyncio.shield(task)
+
+    async def fetch_many(self, status_ids):
+        """Fetches several statuses concurrently. Returns {status_id: tweet or None}."""
+        status_ids = list(dict.fromkeys(str(status_id) for status_id in status_ids))
+        tweets = await asyncio.gather(*(self.fetch(status_id) for status_id in status_ids))
+        return dict(zip(status_ids, tweets))
+
+    def get_stats(self):
+        return {
+            "cache_entries": len(self._cache),
+            "inflight": len(self._inflight),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses
+        }
@@ -0,0 +1,39 @@
+import aiohttp
+
+class HttpService:
+    """Bot-wide aiohttp session for outbound HTTP (fxtwitter API, report webhook...).
+
+    One pooled connector keeps connections alive between requests, limits
+    connections per host and caches DNS lookups. Pool sizes and timeouts come
+    from the bot config. Opened in setup_hook, closed on shutdown.
+    """
+    USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+    def __init__(self, client):
+        self.client = client
+        self.pool_size = client.config.get('http_pool_size', 100)
+        self.per_host = client.config.get('http_per_host', 10)
+        self.dns_ttl = client.config.get('http_dns_ttl', 300)
+        self.timeout = client.config.get('http_timeout', 10)
+        self._session = None
+
+    def start(self):
+        """Opens the shared session. Must be called from the event loop."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.pool_size, limit_per_host=self.per_host, ttl_dns_cache=self.dns_ttl)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={"User-Agent": self.USER_AGENT}
+            )
+        return self._session
+
+    @property
+    def session(self):
+        """The shared session (opened on first use if start() was not called yet)."""
+        return self.start()
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
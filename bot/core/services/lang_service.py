@@ -0,0 +1,61 @@
+import logging
+import time
+from lang import lang_utils
+from lang.lang_utils import t
+
+logger = logging.getLogger('discord_bot')
+
+class LangRegistry:
+    """Hot reload of the language packs, without restarting the bot.
+
+    The lang/ directory is polled by mtime on the shared scheduler. When a file
+    changes, every pack is re-read, validated and swapped in at once (see
+    lang_utils.load_languages); placeholder mismatches with the default
+    language are logged.
+    """
+    JOB_KEY = ('lang_reload',)
+
+    def __init__(self, client):
+        self.client = client
+        self.interval = client.config['lang_poll_interval']
+        self._mtimes = lang_utils.get_pack_mtimes()
+
+    def start(self):
+        """Starts polling (disabled when lang_poll_interval is 0)."""
+        if self.interval:
+            self._schedule()
+
+    def _schedule(self):
+        self.client.scheduler.schedule(self.JOB_KEY, time.time() + self.interval, self._poll)
+
+    async def _poll(self):
+        try:
+            if lang_utils.get_pack_mtimes() != self._mtimes:
+                self.reload()
+        finally:
+            self._schedule()
+
+    def reload(self):
+        """Reloads every language pack.
+
+        Returns (rejected, issues): {lang: error} of the files that kept their
+        previous pack, and {lang: {key: (missing, unknown)}} placeholder mismatches.
+        """
+        # Taken before reading, so a file written during the reload triggers another one
+        self._mtimes = lang_utils.get_pack_mtimes()
+        rejected = lang_utils.load_languages()
+
+        reference = lang_utils.get_pack(lang_utils.DEFAULT_LANG)
+        issues = {}
+        for lang_code in lang_utils.get_available_languages():
+            if lang_code == lang_utils.DEFAULT_LANG:
+                continue
+            lang_issues = lang_utils.check_placeholders(lang_utils.get_pack(lang_code), reference)
+            for key, (missing, unknown) in lang_issues.items():
+                logger.warning(t('lang_placeholder_mismatch', lang=lang_code, entry=key,
+                                 missing=', '.join(missing) or '-', unknown=', '.join(unknown) or '-'))
+            if lang_issues:
+                issues[lang_code] = lang_issues
+
+        logger.info(t('lang_reloaded', langs=', '.join(sorted(lang_utils.get_available_languages())), rejected=len(rejected)))
+        return rejected, issues
@@ -1,90 +1,242 @@
-import json
-import os
-import threading
+import asyncio
+import bisect
+import logging
+import time
 from lang.lang_utils import t
 
+logger = logging.getLogger('discord_bot')
+
 class LevelingService:
     def __init__(self, client):
         self.client = client
-        self.levels_path = client.paths['levels_json']
-        self.levels = {}
+        self.storage = client.storage
+        self.levels = {}  # {guild_id: {user_id: {"level", "experience"}}}
+        self._rank_index = {}  # {guild_id: sorted [(-level, -experience, user_id)]}
+        self._legacy_levels = {}  # global XP from before the per-guild ledger, adopted on ready
         self.is_leveling_enabled = False # Default is false as in Leveling.py
-        self._lock = threading.Lock()
+
+        # Write-behind persistence: XP changes only mark users dirty,
+        # a background task flushes them in batches to the storage writer thread.
+        self.flush_interval = 30  # seconds between periodic flushes
+        self.flush_threshold = 100  # dirty users that trigger an early flush
+        self._dirty = set()
+        self._pending_writes = 0  # mutations since the last flush
+        self._flush_lock = asyncio.Lock()
+        self._flush_task = None
+        self._early_flush = None
+
+        # Persistence metrics
+        self.flush_count = 0
+        self.coalesced_writes = 0  # mutations absorbed by batching (saved writes)
+        self.last_flush_latency = 0.0  # seconds
+        self.total_flush_latency = 0.0
+
         self.load_levels()
 
     def load_levels(self):
-        """Loads leveling data from JSON file."""
-        if os.path.exists(self.levels_path):
-            try:
-                with open(self.levels_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    # Support for potential structure change if we want to save 'enabled' state
-                    if isinstance(data, dict) and "users" in data:
-                        self.levels = data.get("users", {})
-                        self.is_leveling_enabled = data.get("enabled", False)
-                    else:
-                        self.levels = data
-            except Exception as e:
-                print(t('lvl_load_error', error=e))
-                self.levels = {}
-        else:
+        """Loads leveling data from storage and builds the rank indexes."""
+        try:
+            data = self.storage.load_namespace('levels')
+            self._legacy_levels = data.pop('', {})
+            self.levels = data
+            settings = self.storage.load_namespace('settings').get('leveling', {})
+            self.is_leveling_enabled = settings.get('enabled', False)
+        except Exception as e:
+            print(t('lvl_load_error', error=e))
             self.levels = {}
-            self.save_levels()
+            self._legacy_levels = {}
+        self._rank_index = {
+            guild_id: sorted(self._rank_key(user_id, stats) for user_id, stats in users.items() if self._is_ranked(stats))
+            for guild_id, users in self.levels.items()
+        }
 
-    def save_levels(self):
-        """Saves leveling data to JSON file."""
-        with self._lock:
+    async def adopt_legacy_levels(self, guilds):
+        """Copies legacy global XP into the ledger of every guild the user is a member of.
+
+        The legacy rows are deleted once the flush persisting the copies succeeded.
+        """
+        if not self._legacy_levels:
+            return 0
+        adopted = set()
+        for guild in guilds:
+            guild_id = str(guild.id)
+            users = self.levels.setdefault(guild_id, {})
+            for user_id, stats in self._legacy_levels.items():
+                if user_id in users or guild.get_member(int(user_id)) is None:
+                    continue
+                users[user_id] = dict(stats)
+                if self._is_ranked(stats):
+                    bisect.insort(self._rank_index.setdefault(guild_id, []), self._rank_key(user_id, stats))
+                self._mark_dirty(guild_id, user_id)
+                adopted.add(user_id)
+        for user_id in adopted:
+            del self._legacy_levels[user_id]
+        if adopted and await self.flush():
+            for user_id in adopted:
+                self.storage.delete_nowait('levels', '', user_id)
+        return len(adopted)
+
+    def _mark_dirty(self, guild_id, user_id):
+        """Records a pending change and triggers an early flush when the batch is full."""
+        self._dirty.add((guild_id, user_id))
+        self._pending_writes += 1
+        if len(self._dirty) >= self.flush_threshold:
+            self.request_flush()
+
+    def request_flush(self):
+        """Schedules a flush as soon as possible (no-op outside the event loop)."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if self._early_flush is None or self._early_flush.done():
+            self._early_flush = loop.create_task(self.flush())
+
+    async def flush(self):
+        """Writes the dirty users to storage in a single batch. Returns False if the write failed."""
+        async with self._flush_lock:
+            if not self._pending_writes:
+                return True
+            pending = self._pending_writes
+            dirty = self._dirty
+            items = [
+                (guild_id, user_id, dict(self.levels[guild_id][user_id]))
+                for guild_id, user_id in dirty
+                if user_id in self.levels.get(guild_id, {})
+            ]
+            self._dirty = set()
+            self._pending_writes = 0
+
+            start = time.perf_counter()
             try:
-                # We save both users and enabled state to make it persistent
-                data = {
-                    "enabled": self.is_leveling_enabled,
-                    "users": self.levels
-                }
-                with open(self.levels_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=4)
+                if items:
+                    await self.storage.put_many('levels', items)
             except Exception as e:
+                # Keep the changes pending so the next flush retries them
+                self._pending_writes += pending
+                self._dirty |= dirty
                 print(t('lvl_save_error', error=e))
+                return False
+
+            latency = time.perf_counter() - start
+            self.flush_count += 1
+            self.coalesced_writes += pending - 1
+            self.last_flush_latency = latency
+            self.total_flush_latency += latency
+            logger.debug(f"Levels flushed: {pending} change(s), {len(items)} row(s) in one batch ({latency * 1000:.1f} ms)")
+            return True
 
-    def get_stats(self, user_id):
-        """Returns stats for a user."""
-        user_id = str(user_id)
-        return self.levels.get(user_id, {"level": 0, "experience": 0})
+    async def _flush_loop(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
 
-    def add_xp(self, user_id, amount=1):
-        """Adds XP to a user and returns (new_level, leveled_up)."""
+    def start(self):
+        """Starts the periodic background flush. Must be called from the event loop."""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_loop())
+
+    async def close(self):
+        """Stops the background flush and persists everything still pending."""
+        if self._flush_task:
+            self._flush_task.cancel()
+            self._flush_task = None
+        await self.flush()
+
+    def get_flush_stats(self):
+        """Returns write-behind persistence metrics."""
+        return {
+            "flushes": self.flush_count,
+            "coalesced_writes": self.coalesced_writes,
+            "pending_writes": self._pending_writes,
+            "dirty_users": len(self._dirty),
+            "last_flush_ms": round(self.last_flush_latency * 1000, 2),
+            "avg_flush_ms": round(self.total_flush_latency / self.flush_count * 1000, 2) if self.flush_count else 0.0
+        }
+
+    @staticmethod
+    def _rank_key(user_id, stats):
+        return (-stats.get("level", 0), -stats.get("experience", 0), user_id)
+
+    @staticmethod
+    def _is_ranked(stats):
+        return stats.get("level", 0) > 0 or stats.get("experience", 0) > 0
+
+    def get_stats(self, guild_id, user_id):
+        """Returns stats for a user in a guild."""
+        return self.levels.get(str(guild_id), {}).get(str(user_id), {"level": 0, "experience": 0})
+
+    def get_rank(self, guild_id, user_id):
+        """Returns (rank, ranked_count) of a user in a guild, rank is None if unranked."""
+        guild_id, user_id = str(guild_id), str(user_id)
+        index = self._rank_index.get(guild_id, [])
+        stats = self.levels.get(guild_id, {}).get(user_id)
+        if not stats or not self._is_ranked(stats):
+            return None, len(index)
+        return bisect.bisect_left(index, self._rank_key(user_id, stats)) + 1, len(index)
+
+    def get_leaderboard(self, guild_id, page=1, per_page=10):
+        """Returns ([(rank, user_id, level, experience)], ranked_count) for one page of the guild leaderboard."""
+        index = self._rank_index.get(str(guild_id), [])
+        start = (page - 1) * per_page
+        entries = [
+            (start + offset + 1, user_id, -neg_level, -neg_xp)
+            for offset, (neg_level, neg_xp, user_id) in enumerate(index[start:start + per_page])
+        ]
+        return entries, len(index)
+
+    def add_xp(self, guild_id, user_id, amount=1):
+        """Adds XP to a user in a guild and returns (new_level, leveled_up)."""
         if not self.is_leveling_enabled:
             return None, False
 
-        user_id = str(user_id)
-        if user_id not in self.levels:
-            self.levels[user_id] = {"level": 0, "experience": 0}
+        guild_id, user_id = str(guild_id), str(user_id)
+        users = self.levels.setdefault(guild_id, {})
+        index = self._rank_index.setdefault(guild_id, [])
+        stats = users.get(user_id)
+        if stats is None:
+            stats = users[user_id] = {"level": 0, "experience": 0}
+        elif self._is_ranked(stats):
+            # Drop the old position from the rank index, re-inserted below with the new score
+            key = self._rank_key(user_id, stats)
+            pos = bisect.bisect_left(index, key)
+            if pos < len(index) and index[pos] == key:
+                del index[pos]
+
+        stats["experience"] += amount
+
+        current_xp = stats["experience"]
+        current_lvl = stats["level"]
 
-        self.levels[user_id]["experience"] += amount
-        
-        current_xp = self.levels[user_id]["experience"]
-        current_lvl = self.levels[user_id]["level"]
-        
         # Level formula: XP >= (level + 1) ** 2
         leveled_up = False
         new_lvl = current_lvl
         while current_xp >= (new_lvl + 1) ** 2:
             new_lvl += 1
             leveled_up = True
-        
+
         if leveled_up:
-            self.levels[user_id]["level"] = new_lvl
-        
-        self.save_levels()
+            stats["level"] = new_lvl
+
+        if self._is_ranked(stats):
+            bisect.insort(index, self._rank_key(user_id, stats))
+        self._mark_dirty(guild_id, user_id)
         return new_lvl, leveled_up
 
-    def reset_all(self):
-        """Resets all leveling data."""
-        self.levels = {}
-        self.save_levels()
+    def reset_all(self, guild_id):
+        """Resets all leveling data of a guild."""
+        guild_id = str(guild_id)
+        self.levels.pop(guild_id, None)
+        self._rank_index.pop(guild_id, None)
+        dropped = {entry for entry in self._dirty if entry[0] == guild_id}
+        self._dirty -= dropped
+        if not self._dirty:
+            self._pending_writes = 0
+        self.storage.delete_scope_nowait('levels', guild_id)
         return True
 
     def toggle_system(self):
         """Toggles the leveling system status."""
         self.is_leveling_enabled = not self.is_leveling_enabled
-        self.save_levels()
+        self.storage.put_nowait('settings', 'leveling', 'enabled', self.is_leveling_enabled)
         return self.is_leveling_enabled
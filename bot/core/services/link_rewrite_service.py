@@ -0,0 +1,124 @@
+import re
+
+# Compiled once for every message of every guild
+URL_PATTERN = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+HOST_PATTERN = re.compile(r'https?://([\w.-]+)/?')
+STATUS_EXTRAS_PATTERN = re.compile(r'(https?://(?:twitter\.com|x\.com)/[^/]+/status/\d+)\S*')
+STATUS_ID_PATTERN = re.compile(r"/status/(\d+)")
+
+def remove_extras_after_status(text):
+    """Strips tracking parameters and paths after twitter/x status ids."""
+    return STATUS_EXTRAS_PATTERN.sub(r'\1', text)
+
+
+class FxTwitterPolicy:
+    """fxtwitter conversion settings of a guild, flattened into flags when its settings change.
+
+    plain is True when toggle, retweet, quote-tweet and direct-media are all at
+    their defaults: tweet links are then a plain domain swap and need no API call.
+    """
+
+    def __init__(self, settings, defaults):
+        toggle = settings.get("toggle", {})
+        quote_tweet = settings.get("quote-tweet", {})
+        direct_media = settings.get("direct-media", {})
+        translate = settings.get("translate", {})
+
+        self.plain = settings.get("toggle") == defaults["toggle-list"] and \
+            settings.get("retweet") == defaults["retweet-list"] and \
+            settings.get("quote-tweet") == defaults["quote-tweet-list"] and \
+            settings.get("direct-media") == defaults["direct-media-list"]
+
+        self.translate = translate.get("toggle", False)
+        self.translate_language = translate.get("language", "en")
+        self.twitter_target = settings.get("conversion", {}).get("twitter.com", "fxtwitter.com")
+
+        # Tweets filtered out by content type
+        self.filter_content = toggle != defaults["toggle-list"]
+        self.hide_text = not toggle.get("text", True)
+        self.hide_polls = not toggle.get("polls", True)
+        self.hide_videos = not toggle.get("videos", True)
+        self.hide_images = not toggle.get("images", True)
+
+        link_conversion = quote_tweet.get("link_conversion", {})
+        self.filter_quotes = not link_conversion.get("follow tweets", True)
+        self.quote_hide_all = not link_conversion.get("all", True)
+        self.quote_hide_polls = not link_conversion.get("polls", True)
+        self.quote_hide_videos = not link_conversion.get("videos", True)
+        self.quote_hide_images = not link_conversion.get("images", True)
+        self.remove_quoted_tweet = quote_tweet.get("remove quoted tweet", False)
+
+        self.delete_original_tweet = settings.get("retweet", {}).get("delete_original_tweet", False)
+
+        # Direct media links (d.fxtwitter.com / mosaic images)
+        channels = direct_media.get("channel", [])
+        self.direct_media = direct_media.get("toggle") != defaults["direct-media-list"]["toggle"]
+        self.direct_media_everywhere = "allow" in channels
+        self.direct_media_channels = frozenset(c[1] for c in channels if isinstance(c, list) and len(c) == 2 and c[0] == "allow")
+        self.direct_images = direct_media.get("toggle", {}).get("images", False)
+        self.direct_videos = direct_media.get("toggle", {}).get("videos", False)
+        multiple_images = direct_media.get("multiple_images", {})
+        self.convert_multiple = multiple_images.get("convert", True)
+        self.prefer_mosaic = multiple_images.get("replace_with_mosaic", True)
+        quote_direct = direct_media.get("quote_tweet", {})
+        self.convert_quoted_media = quote_direct.get("convert", False)
+        self.prefer_quoted = quote_direct.get("prefer_quoted_tweet", True)
+
+    def direct_media_in(self, channel_mention):
+        """Returns whether direct media conversion applies in a channel."""
+        return self.direct_media and (self.direct_media_everywhere or channel_mention in self.direct_media_channels)
+
+    def plain_tweet_url(self, url, domain):
+        """Converts a tweet URL without the fxtwitter API (plain policy)."""
+        if self.translate:
+            match = STATUS_ID_PATTERN.search(url)
+            if match:
+                return f"https://{self.twitter_target}/i/status/{match.group(1)}/{self.translate_language}"
+            return url.replace(domain, self.twitter_target)
+        new_url = url.replace(domain, self.twitter_target)
+        return new_url if new_url.endswith('/') else new_url + '/'
+
+
+class LinkRewriter:
+    """Domain conversions of a guild, compiled from its conversion-list.
+
+    URLs are found with one precompiled scanner and rewritten in a single pass:
+    each URL costs one dict lookup on its main domain (last two host labels).
+    Twitter/x links converted to fxtwitter are swapped directly when the guild
+    policy is plain, otherwise they are left untouched and returned to the
+    caller, which handles them with the fxtwitter API.
+    """
+    FXTWITTER_DOMAINS = ("twitter.com", "x.com")
+
+    def __init__(self, settings, defaults):
+        self.targets = dict(settings.get("conversion") or {})
+        self.fxtwitter_domains = frozenset(d for d in self.FXTWITTER_DOMAINS if self.targets.get(d) == "fxtwitter.com")
+        self.policy = FxTwitterPolicy(settings, defaults)
+
+    def __bool__(self):
+        return bool(self.targets)
+
+    def rewrite(self, text):
+        """Returns (rewritten text, set of tweet URLs left for the fxtwitter conversion)."""
+        text = remove_extras_after_status(text)
+        tweet_urls = set()
+        targets = self.targets
+        policy = self.policy
+
+        def replace(match):
+            url = match.group(0)
+            host = HOST_PATTERN.match(url)
+            if host is None:
+                return url
+            domain = '.'.join(host.group(1).split('.')[-2:])
+            target = targets.get(domain)
+            if target is None:
+                return url
+            if domain in self.fxtwitter_domains:
+                if policy.plain:
+                    return policy.plain_tweet_url(url, domain)
+                tweet_urls.add(url)
+                return url
+            return url.replace(domain, target)
+
+        return URL_PATTERN.sub(replace, text), tweet_urls
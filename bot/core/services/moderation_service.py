@@ -1,5 +1,5 @@
-import json
-import os
+import re
+import unicodedata
 from datetime import datetime
 from lang.lang_utils import t
 
@@ -8,62 +8,101 @@ class ModerationService:
         self.client = client
         self.warns = {}
         self.banned_words = {}
+        self._banned_order = {}  # guild_id -> order stored with the next banned word (never reused)
         self.protected_role_id = 1236660715151167548
         self.blocked_user_id = 440168985615400984
         self.mp_conversations = {}
+        # Banned word matching: one compiled trie regex per guild, rebuilt when the list changes
+        self.word_boundary = client.config.get('banned_words_word_boundary', False)
+        self.normalize = client.config.get('banned_words_normalize', False)
+        self._banned_sets = {}  # guild_id -> set of folded words
+        self._matchers = {}  # guild_id -> compiled pattern (None if no words)
         self.load_data()
 
     def load_data(self):
-        """Loads warns and banned words from JSON files"""
-        # Load warns
-        warns_path = self.client.paths['warns_json']
-        if os.path.exists(warns_path):
-            try:
-                with open(warns_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    if isinstance(data, dict):
-                        self.warns = data
-                    else:
-                        self.warns = {}
-            except Exception as e:
-                print(t('mods_warns_load_error', error=e))
-                self.warns = {}
-        else:
-            self.warns = {}
-
-        # Load banned words
-        banned_words_path = self.client.paths['banned_words_json']
-        if os.path.exists(banned_words_path):
-            try:
-                with open(banned_words_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    if isinstance(data, dict):
-                        self.banned_words = data
-                    else:
-                        self.banned_words = {}
-            except Exception as e:
-                print(t('mods_banned_words_load_error', error=e))
-                self.banned_words = {}
-        else:
-            self.banned_words = {}
-
-    def save_warns(self):
-        """Saves warns to JSON file"""
-        warns_path = self.client.paths['warns_json']
+        """Loads warns and banned words from storage"""
+        storage = self.client.storage
         try:
-            with open(warns_path, 'w', encoding='utf-8') as f:
-                json.dump(self.warns, f, indent=2)
+            self.warns = storage.load_namespace('warns')
         except Exception as e:
-            print(t('mods_warns_save_error', error=e))
+            print(t('mods_warns_load_error', error=e))
+            self.warns = {}
 
-    def save_banned_words(self):
-        """Saves banned words to JSON file"""
-        banned_words_path = self.client.paths['banned_words_json']
         try:
-            with open(banned_words_path, 'w', encoding='utf-8') as f:
-                json.dump(self.banned_words, f, ensure_ascii=False, indent=2)
+            stored = storage.load_namespace('banned_words')
+            self.banned_words = {
+                guild_id: [word for word, _ in sorted(words.items(), key=lambda item: item[1])]
+                for guild_id, words in stored.items()
+            }
+            self._banned_order = {guild_id: max(words.values(), default=-1) + 1 for guild_id, words in stored.items()}
         except Exception as e:
-            print(t('mods_banned_words_save_error', error=e))
+            print(t('mods_banned_words_load_error', error=e))
+            self.banned_words = {}
+            self._banned_order = {}
+
+        for guild_id in self.banned_words:
+            self._rebuild_matcher(guild_id)
+
+    def _fold(self, text):
+        """Case folding used for matching (plus NFKC normalization in normalize mode)."""
+        if self.normalize:
+            return unicodedata.normalize('NFKC', text).casefold()
+        return text.lower()
+
+    @staticmethod
+    def _trie_pattern(words):
+        """Builds a regex from a prefix trie of words, so a scan costs O(text) whatever the list size."""
+        trie = {}
+        for word in words:
+            node = trie
+            for char in word:
+                node = node.setdefault(char, {})
+            node[''] = True
+
+        def build(node):
+            branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+            if not branches:
+                return ''
+            if len(branches) == 1 and '' not in node:
+                return branches[0]
+            pattern = '(?:' + '|'.join(branches) + ')'
+            # Longer words first: the optional suffix is tried greedily
+            return pattern + '?' if '' in node else pattern
+
+        return build(trie)
+
+    def _rebuild_matcher(self, guild_id):
+        words = {self._fold(word) for word in self.banned_words.get(guild_id, []) if word}
+        self._banned_sets[guild_id] = words
+        if not words:
+            self._matchers[guild_id] = None
+            return
+        pattern = self._trie_pattern(words)
+        if self.word_boundary:
+            pattern = rf'(?<!\w)(?:{pattern})(?!\w)'
+        self._matchers[guild_id] = re.compile(pattern)
+
+    def find_banned_word(self, guild_id, text):
+        """Returns the first banned word found in text, or None."""
+        matcher = self._matchers.get(str(guild_id))
+        if matcher is None:
+            return None
+        match = matcher.search(self._fold(text))
+        return match.group(0) if match else None
+
+    def save_member_warns(self, guild_id, member_id):
+        """Persists the warn record of a single member"""
+        guild_id, member_id = str(guild_id), str(member_id)
+        future = self.client.storage.put_nowait('warns', guild_id, member_id, self.warns[guild_id][member_id])
+        future.add_done_callback(self._log_warns_save_error)
+
+    def _log_warns_save_error(self, future):
+        if future.exception():
+            print(t('mods_warns_save_error', error=future.exception()))
+
+    def _log_banned_words_save_error(self, future):
+        if future.exception():
+            print(t('mods_banned_words_save_error', error=future.exception()))
 
     def get_warn_count(self, guild_id, member_id):
         guild_id, member_id = str(guild_id), str(member_id)
@@ -85,23 +124,19 @@ class ModerationService:
                 "moderator": moderator_name,
                 "timestamp": datetime.now().isoformat()
             })
-        self.save_warns()
+        self.save_member_warns(guild_id, member_id)
         return self.warns[guild_id][member_id]["count"]
 
     def reset_warns(self, guild_id, member_id):
         guild_id, member_id = str(guild_id), str(member_id)
         if guild_id in self.warns and member_id in self.warns[guild_id]:
             self.warns[guild_id][member_id] = {"count": 0, "warnings": []}
-            self.save_warns()
+            self.save_member_warns(guild_id, member_id)
             return True
         return False
 
     def is_word_banned(self, guild_id, word):
-        guild_id = str(guild_id)
-        word = word.lower().strip()
-        if guild_id in self.banned_words:
-            return word in [w.lower() for w in self.banned_words[guild_id]]
-        return False
+        return self._fold(word.strip()) in self._banned_sets.get(str(guild_id), ())
 
     def add_banned_word(self, guild_id, word):
         guild_id = str(guild_id)
@@ -110,7 +145,11 @@ class ModerationService:
             self.banned_words[guild_id] = []
         if word not in self.banned_words[guild_id]:
             self.banned_words[guild_id].append(word)
-            self.save_banned_words()
+            self._rebuild_matcher(guild_id)
+            order = self._banned_order.get(guild_id, 0)
+            self._banned_order[guild_id] = order + 1
+            future = self.client.storage.put_nowait('banned_words', guild_id, word, order)
+            future.add_done_callback(self._log_banned_words_save_error)
             return True
         return False
 
@@ -119,7 +158,9 @@ class ModerationService:
         word = word.lower().strip()
         if guild_id in self.banned_words and word in self.banned_words[guild_id]:
             self.banned_words[guild_id].remove(word)
-            self.save_banned_words()
+            self._rebuild_matcher(guild_id)
+            future = self.client.storage.delete_nowait('banned_words', guild_id, word)
+            future.add_done_callback(self._log_banned_words_save_error)
             return True
         return False
 
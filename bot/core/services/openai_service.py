@@ -0,0 +1,150 @@
+import asyncio
+import contextlib
+import time
+from openai import AsyncOpenAI, APITimeoutError
+from lang.lang_utils import t
+
+class OpenAIService:
+    """Async access to the OpenAI API for the GPT and DALL-E commands.
+
+    A request takes a slot of its guild (per_guild_limit), then a global slot,
+    so one guild cannot hold every slot. Requests that have to wait are told
+    their position in the queue. openai_base_url points the client to another
+    endpoint, e.g. a local mock server.
+    """
+    CHAT_MODEL = "gpt-4o"
+    IMAGE_MODEL = "dall-e-3"
+
+    def __init__(self, client):
+        self.client = client
+        self.per_guild_limit = client.config.get('openai_per_guild', 1)
+        self.timeout = client.config.get('openai_timeout', 120)
+        self.base_url = client.config.get('openai_base_url')
+
+        self._slots = asyncio.Semaphore(client.config.get('openai_concurrency', 4))
+        self._guild_slots = {}  # guild_id -> asyncio.Semaphore
+        self._waiting = []  # tickets of the requests waiting for a slot, oldest first
+        self._api = None
+
+        # Metrics
+        self.running = 0
+        self.completed = 0
+        self.failed = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+
+    @property
+    def api(self):
+        """The AsyncOpenAI client, created on first use."""
+        if self._api is None:
+            with open(self.client.paths['gpt_token_file'], "r") as f:
+                api_key = f.read().strip()
+            self._api = AsyncOpenAI(api_key=api_key, base_url=self.base_url, timeout=self.timeout)
+        return self._api
+
+    def _guild_slot(self, guild_id):
+        slot = self._guild_slots.get(guild_id)
+        if slot is None:
+            slot = self._guild_slots[guild_id] = asyncio.Semaphore(self.per_guild_limit)
+        return slot
+
+    @contextlib.asynccontextmanager
+    async def slot(self, guild_id, on_queued=None):
+        """Holds a guild slot and a global slot for the duration of a request.
+
+        When no slot is free, on_queued(position) is awaited first (1 = next in line).
+        """
+        guild_slot = self._guild_slot(guild_id)
+        ticket = object()
+        queued_at = time.perf_counter()
+        if guild_slot.locked() or self._slots.locked():
+            self._waiting.append(ticket)
+            if on_queued:
+                await on_queued(len(self._waiting))
+        try:
+            async with guild_slot:
+                async with self._slots:
+                    if ticket in self._waiting:
+                        self._waiting.remove(ticket)
+                    self.total_wait += time.perf_counter() - queued_at
+                    self.running += 1
+                    try:
+                        yield
+                        self.completed += 1
+                    except BaseException:
+                        self.failed += 1
+                        raise
+                    finally:
+                        self.running -= 1
+        finally:
+            # Cancelled while still waiting for a slot
+            if ticket in self._waiting:
+                self._waiting.remove(ticket)
+
+    async def _call(self, request):
+        """Awaits an API call, turning timeouts into TimeoutError with a readable message."""
+        try:
+            return await asyncio.wait_for(request, self.timeout)
+        except (asyncio.TimeoutError, APITimeoutError):
+            self.timeouts += 1
+            raise TimeoutError(t('openai_timeout', seconds=self.timeout))
+
+    async def chat(self, messages, max_tokens=4000, temperature=1):
+        """Returns the completion text of a chat."""
+        response = await self._call(self.api.chat.completions.create(
+            model=self.CHAT_MODEL,
+            messages=messages,
+            max_completion_tokens=max_tokens,
+            temperature=temperature
+        ))
+        return response.choices[0].message.content or ""
+
+    async def stream_chat(self, messages, max_tokens=4000, temperature=1):
+        """Yields the completion text of a chat as it is generated.
+
+        The client timeout applies between two chunks, so a long answer is not cut.
+        """
+        stream = await self._call(self.api.chat.completions.create(
+            model=self.CHAT_MODEL,
+            messages=messages,
+            max_completion_tokens=max_tokens,
+            temperature=temperature,
+            stream=True
+        ))
+        try:
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except APITimeoutError:
+            self.timeouts += 1
+            raise TimeoutError(t('openai_timeout', seconds=self.timeout))
+        finally:
+            await stream.close()
+
+    async def image(self, prompt):
+        """Returns the URL of an image generated from prompt."""
+        response = await self._call(self.api.images.generate(
+            model=self.IMAGE_MODEL,
+            prompt=prompt,
+            n=1,
+            size="1024x1024",
+            quality="standard"
+        ))
+        return response.data[0].url
+
+    def get_stats(self):
+        """Returns queue depth and request metrics."""
+        finished = self.completed + self.failed
+        return {
+            "queued": len(self._waiting),
+            "running": self.running,
+            "completed": self.completed,
+            "failed": self.failed,
+            "timeouts": self.timeouts,
+            "avg_wait_ms": round(self.total_wait / finished * 1000, 2) if finished else 0.0
+        }
+
+    async def close(self):
+        if self._api is not None:
+            await self._api.close()
+            self._api = None
@@ -0,0 +1,91 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from lang.lang_utils import t
+
+logger = logging.getLogger('discord_bot')
+
+class DeadlineScheduler:
+    """Runs coroutines at absolute deadlines (epoch seconds).
+
+    Jobs sit in a heap ordered by deadline; a single task sleeps until the
+    earliest one and is woken early when a sooner job is scheduled. Jobs are
+    addressed by key: scheduling an existing key replaces it.
+    """
+
+    def __init__(self):
+        self._heap = []  # [deadline, seq, key, callback]
+        self._jobs = {}  # key -> heap entry
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task = None
+        self._running = set()  # tasks of the jobs being executed
+
+    def schedule(self, key, deadline, callback):
+        """Runs callback() (a coroutine function) at deadline, replacing any job with the same key."""
+        self.cancel(key)
+        entry = [deadline, next(self._seq), key, callback]
+        self._jobs[key] = entry
+        heapq.heappush(self._heap, entry)
+        if self._heap[0] is entry:
+            self._wakeup.set()
+
+    def cancel(self, key):
+        """Cancels a pending job (lazy removal from the heap)."""
+        entry = self._jobs.pop(key, None)
+        if entry:
+            entry[3] = None
+
+    def get_deadline(self, key):
+        entry = self._jobs.get(key)
+        return entry[0] if entry else None
+
+    def __len__(self):
+        return len(self._jobs)
+
+    async def _run(self):
+        while True:
+            # Drop cancelled entries at the top of the heap
+            while self._heap and self._heap[0][3] is None:
+                heapq.heappop(self._heap)
+
+            self._wakeup.clear()
+            if not self._heap:
+                await self._wakeup.wait()
+                continue
+
+            delay = self._heap[0][0] - time.time()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            _, _, key, callback = heapq.heappop(self._heap)
+            del self._jobs[key]
+            task = asyncio.create_task(self._execute(key, callback))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    @staticmethod
+    async def _execute(key, callback):
+        try:
+            await callback()
+        except Exception as e:
+            logger.error(t('scheduler_job_error', job=key, error=e))
+
+    def start(self):
+        """Starts the scheduler loop. Must be called from the event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def close(self):
+        """Stops the scheduler loop and cancels the jobs still running."""
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        for task in self._running:
+            task.cancel()
@@ -0,0 +1,344 @@
+import abc
+import asyncio
+import concurrent.futures
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+from lang.lang_utils import t
+
+logger = logging.getLogger('discord_bot')
+
+# Data is stored as JSON values addressed by (namespace, scope, key):
+#   levels        scope=''           key=user_id     -> {"level", "experience"}
+#   settings      scope=<component>  key=<setting>   -> any
+#   warns         scope=guild_id     key=member_id   -> {"count", "warnings", ...}
+#   banned_words  scope=guild_id     key=word        -> insertion order
+#   reminders     scope=user_id      key=reminder_id -> reminder dict
+#   timezones     scope=''           key=user_id     -> timezone name
+#   vxt           scope=<list name>  key=guild_id    -> guild settings
+
+class StorageBackend(abc.ABC):
+    """Interface for the bot's persistent storage.
+
+    Writes are executed in order by the backend. Each operation exists as a
+    coroutine (waits for completion) and as a *_nowait variant that returns a
+    concurrent.futures.Future, for synchronous callers running on the event loop.
+    """
+
+    @abc.abstractmethod
+    def _submit(self, func, *args) -> concurrent.futures.Future:
+        ...
+
+    # --- Operations executed by the backend (connection is backend-specific) ---
+
+    @abc.abstractmethod
+    def _load(self, conn, namespace):
+        ...
+
+    @abc.abstractmethod
+    def _put_many(self, conn, namespace, rows):
+        """rows: list of (scope, key, serialized JSON value)."""
+
+    @abc.abstractmethod
+    def _delete(self, conn, namespace, scope, key):
+        ...
+
+    @abc.abstractmethod
+    def _delete_scope(self, conn, namespace, scope):
+        ...
+
+    @abc.abstractmethod
+    def _clear(self, conn, namespace):
+        ...
+
+    @abc.abstractmethod
+    def _get_meta(self, conn, key):
+        ...
+
+    @abc.abstractmethod
+    def _set_meta(self, conn, key, value):
+        ...
+
+    # --- Public API ---
+
+    def load_namespace(self, namespace):
+        """Blocking read of a whole namespace as {scope: {key: value}} (startup only)."""
+        return self._submit(self._load, namespace).result()
+
+    async def fetch_namespace(self, namespace):
+        return await asyncio.wrap_future(self._submit(self._load, namespace))
+
+    def put_nowait(self, namespace, scope, key, value):
+        return self.put_many_nowait(namespace, [(scope, key, value)])
+
+    async def put(self, namespace, scope, key, value):
+        await asyncio.wrap_future(self.put_nowait(namespace, scope, key, value))
+
+    def put_many_nowait(self, namespace, items):
+        """items: iterable of (scope, key, value)."""
+        # Serialize now: values are live objects that the event loop may keep mutating
+        rows = [(str(scope), str(key), json.dumps(value, ensure_ascii=False)) for scope, key, value in items]
+        return self._submit(self._put_many, namespace, rows)
+
+    async def put_many(self, namespace, items):
+        await asyncio.wrap_future(self.put_many_nowait(namespace, items))
+
+    def delete_nowait(self, namespace, scope, key):
+        return self._submit(self._delete, namespace, scope, key)
+
+    async def delete(self, namespace, scope, key):
+        await asyncio.wrap_future(self.delete_nowait(namespace, scope, key))
+
+    def delete_scope_nowait(self, namespace, scope):
+        return self._submit(self._delete_scope, namespace, scope)
+
+    async def delete_scope(self, namespace, scope):
+        await asyncio.wrap_future(self.delete_scope_nowait(namespace, scope))
+
+    def clear_nowait(self, namespace):
+        return self._submit(self._clear, namespace)
+
+    async def clear(self, namespace):
+        await asyncio.wrap_future(self.clear_nowait(namespace))
+
+    def get_meta(self, key):
+        return self._submit(self._get_meta, key).result()
+
+    def set_meta(self, key, value):
+        return self._submit(self._set_meta, key, value).result()
+
+    async def close(self):
+        pass
+
+
+class SQLiteStorageBackend(StorageBackend):
+    """SQLite storage (WAL mode) owned by a single dedicated writer thread.
+
+    Queued operations are drained in batches and committed in one transaction,
+    so a burst of point updates costs a single fsync.
+    """
+    MAX_BATCH = 500
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._queue = queue.Queue()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="storage-writer", daemon=True)
+        self._ready = concurrent.futures.Future()
+        self._thread.start()
+        self._ready.result()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS kv ("
+            " namespace TEXT NOT NULL,"
+            " scope TEXT NOT NULL,"
+            " key TEXT NOT NULL,"
+            " value TEXT NOT NULL,"
+            " PRIMARY KEY (namespace, scope, key)"
+            ") WITHOUT ROWID"
+        )
+        conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        conn.commit()
+        return conn
+
+    def _run(self):
+        try:
+            conn = self._connect()
+        except Exception as e:
+            self._ready.set_exception(e)
+            return
+        self._ready.set_result(True)
+
+        while True:
+            job = self._queue.get()
+            if job is None:
+                break
+            batch = [job]
+            stop = False
+            while len(batch) < self.MAX_BATCH:
+                try:
+                    job = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if job is None:
+                    stop = True
+                    break
+                batch.append(job)
+            self._execute_batch(conn, batch)
+            if stop:
+                break
+        conn.close()
+
+    def _execute_batch(self, conn, batch):
+        results = []
+        try:
+            for func, args, future in batch:
+                results.append(func(conn, *args))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            # Retry one by one so a single bad operation does not fail the whole batch
+            for func, args, future in batch:
+                try:
+                    result = func(conn, *args)
+                    conn.commit()
+                    future.set_result(result)
+                except Exception as e:
+                    conn.rollback()
+                    logger.error(t('storage_write_error', error=e))
+                    future.set_exception(e)
+            return
+        for (func, args, future), result in zip(batch, results):
+            future.set_result(result)
+
+    def _submit(self, func, *args):
+        future = concurrent.futures.Future()
+        if self._closed:
+            future.set_exception(RuntimeError("Storage is closed"))
+            return future
+        self._queue.put((func, args, future))
+        return future
+
+    def _load(self, conn, namespace):
+        data = {}
+        rows = conn.execute("SELECT scope, key, value FROM kv WHERE namespace = ?", (namespace,))
+        for scope, key, value in rows:
+            data.setdefault(scope, {})[key] = json.loads(value)
+        return data
+
+    def _put_many(self, conn, namespace, rows):
+        conn.executemany(
+            "INSERT INTO kv (namespace, scope, key, value) VALUES (?, ?, ?, ?)"
+            " ON CONFLICT (namespace, scope, key) DO UPDATE SET value = excluded.value",
+            [(namespace, scope, key, value) for scope, key, value in rows]
+        )
+
+    def _delete(self, conn, namespace, scope, key):
+        conn.execute("DELETE FROM kv WHERE namespace = ? AND scope = ? AND key = ?", (namespace, str(scope), str(key)))
+
+    def _delete_scope(self, conn, namespace, scope):
+        conn.execute("DELETE FROM kv WHERE namespace = ? AND scope = ?", (namespace, str(scope)))
+
+    def _clear(self, conn, namespace):
+        conn.execute("DELETE FROM kv WHERE namespace = ?", (namespace,))
+
+    def _get_meta(self, conn, key):
+        row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, conn, key, value):
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def close_sync(self):
+        """Drains pending writes and stops the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+
+    async def close(self):
+        await asyncio.get_running_loop().run_in_executor(None, self.close_sync)
+
+
+BACKENDS = {
+    'sqlite': SQLiteStorageBackend,
+}
+
+def create_storage(client):
+    """Creates the configured storage backend (client.config['storage_backend'], default sqlite)."""
+    backend = client.config.get('storage_backend', 'sqlite')
+    return BACKENDS[backend](client.paths['database'])
+
+
+def _read_json(path, default):
+    if not path or not os.path.exists(path):
+        return default
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        logger.error(t('storage_migration_file_error', file=path, error=e))
+        return default
+
+def _valid_reminders(reminders, path):
+    """Yields the reminders that can be addressed by (user_id, id), logging the others."""
+    for reminder in reminders:
+        if isinstance(reminder, dict) and 'user_id' in reminder and 'id' in reminder:
+            yield reminder
+        else:
+            logger.error(t('storage_migration_entry_error', file=path, entry=reminder))
+
+def migrate_json(storage, paths):
+    """One-shot import of the legacy json/*.json files into the storage backend.
+
+    The import is only marked done once every write succeeded; otherwise it runs again on the next start.
+    """
+    if storage.get_meta('json_migrated'):
+        return False
+
+    logger.info(t('storage_migration_start'))
+    writes = []
+
+    levels = _read_json(paths.get('levels_json'), {})
+    if isinstance(levels, dict):
+        if "users" in levels:
+            writes.append(storage.put_nowait('settings', 'leveling', 'enabled', levels.get("enabled", False)))
+            levels = levels.get("users", {})
+        writes.append(storage.put_many_nowait('levels', [('', user_id, stats) for user_id, stats in levels.items()]))
+
+    warns = _read_json(paths.get('warns_json'), {})
+    if isinstance(warns, dict):
+        writes.append(storage.put_many_nowait('warns', [
+            (guild_id, member_id, data)
+            for guild_id, members in warns.items()
+            for member_id, data in members.items()
+        ]))
+
+    banned_words = _read_json(paths.get('banned_words_json'), {})
+    if isinstance(banned_words, dict):
+        writes.append(storage.put_many_nowait('banned_words', [
+            (guild_id, word, index)
+            for guild_id, words in banned_words.items()
+            for index, word in enumerate(words)
+        ]))
+
+    reminders_path = paths.get('reminders_json')
+    reminders = _read_json(reminders_path, [])
+    if isinstance(reminders, list):
+        writes.append(storage.put_many_nowait('reminders', [
+            (reminder['user_id'], reminder['id'], reminder)
+            for reminder in _valid_reminders(reminders, reminders_path)
+        ]))
+
+    timezones = _read_json(paths.get('timezones_json'), {})
+    if isinstance(timezones, dict):
+        writes.append(storage.put_many_nowait('timezones', [('', user_id, tz) for user_id, tz in timezones.items()]))
+
+    vxt_dir = paths.get('vxt_lists_dir')
+    if vxt_dir and os.path.isdir(vxt_dir):
+        for filename in os.listdir(vxt_dir):
+            if not filename.endswith('.json'):
+                continue
+            content = _read_json(os.path.join(vxt_dir, filename), {})
+            if isinstance(content, dict):
+                writes.append(storage.put_many_nowait('vxt', [(filename[:-5], guild_id, value) for guild_id, value in content.items()]))
+
+    concurrent.futures.wait(writes)
+    errors = [future.exception() for future in writes if future.exception() is not None]
+    if errors:
+        logger.error(t('storage_migration_failed', count=len(errors), error=errors[0]))
+        return False
+
+    storage.set_meta('json_migrated', '1')
+    logger.info(t('storage_migration_done'))
+    return True
@@ -1,32 +1,93 @@
 import os
 import json
+import time
 import traceback
+from lang import lang_utils
 from lang.lang_utils import t
 
-def get_version_info(client, guild_id=None):
-    """Reads version info from update_logs.json file"""
-    try:
-        update_logs_path = client.paths['update_logs_json']
-        if os.path.exists(update_logs_path):
-            with open(update_logs_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return data
+class VersionRegistry:
+    """In-memory cache of update_logs.json.
+
+    The file is re-read only when its mtime changes (checked at most every
+    check_interval seconds) or on an explicit reload(). Embed footers are
+    precomputed per language.
+    """
+
+    def __init__(self, path, check_interval=5.0):
+        self.path = path
+        self.check_interval = check_interval
+        self._data = None
+        self._loaded = False
+        self._mtime = None
+        self._next_check = 0.0
+        self._footers = {}  # lang_code -> (bundle, footer text)
+
+    def reload(self):
+        """Forces a re-read of the file. Returns the loaded data."""
+        try:
+            self._mtime = os.path.getmtime(self.path) if os.path.exists(self.path) else None
+        except OSError:
+            self._mtime = None
+        self._next_check = time.monotonic() + self.check_interval
+        self._footers = {}
+        self._loaded = True
+
+        data = None
+        if self._mtime is not None:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except Exception:
+                traceback.print_exc()
+        self._data = data if isinstance(data, dict) else None
+        return self._data
+
+    def _refresh(self):
+        """Reloads the file if its mtime changed since the last read (throttled)."""
+        now = time.monotonic()
+        if self._next_check > now:
+            return
+        self._next_check = now + self.check_interval
+        try:
+            mtime = os.path.getmtime(self.path) if os.path.exists(self.path) else None
+        except OSError:
+            mtime = None
+        if mtime != self._mtime:
+            self.reload()
+
+    def get_data(self):
+        """Returns the cached file content, or None if missing or invalid."""
+        if not self._loaded:
+            self.reload()
         else:
-            return {
-                "current_version": t('version_null', guild_id=guild_id),
-                "history": []
-            }
-    except Exception:
-        traceback.print_exc()
-        return {
-            "current_version": t('version_null', guild_id=guild_id),
-            "history": []
-        }
+            self._refresh()
+        return self._data
+
+    def get_footer(self, guild_id=None):
+        """Returns the localized current version string for a guild."""
+        data = self.get_data()
+        tr = lang_utils.get_bundle(guild_id=guild_id)
+        cached = self._footers.get(tr.lang)
+        # Bundles are rebuilt when the language packs are reloaded
+        if cached is None or cached[0] is not tr:
+            cached = (tr, (data or {}).get("current_version") or tr('version_null'))
+            self._footers[tr.lang] = cached
+        return cached[1]
+
+
+def get_version_info(client, guild_id=None):
+    """Returns version info from update_logs.json (cached)"""
+    data = client.version_registry.get_data()
+    if data is not None:
+        return data
+    return {
+        "current_version": t('version_null', guild_id=guild_id),
+        "history": []
+    }
 
 def get_current_version(client, guild_id=None):
     """Returns current version"""
-    data = get_version_info(client, guild_id=guild_id)
-    return data.get("current_version", t('version_null', guild_id=guild_id))
+    return client.version_registry.get_footer(guild_id=guild_id)
 
 def get_latest_logs(client, guild_id=None):
     """Returns logs of the latest version"""
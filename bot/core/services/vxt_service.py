@@ -1,6 +1,5 @@
-import json
-import os
 import copy
+from services.link_rewrite_service import LinkRewriter
 
 class VxTService:
     def __init__(self, bot=None):
@@ -22,14 +21,20 @@ class VxTService:
             "blacklist-list": {"users": [], "roles": []}
         }
         
+        # Settings snapshot per guild: {guild_id: {key: settings}}. A write replaces the
+        # guild's snapshot instead of mutating it, readers must treat it as read-only.
         self.master_settings = {}
-        # Make the lists dir local to bot/json
-        # __file__ is in bot/core/services -> dirname is services -> dirname is core -> dirname is bot
-        self.base_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "json", "vxt_lists")
-        os.makedirs(self.base_dir, exist_ok=True)
+        self.rewriters = {}  # guild_id -> LinkRewriter compiled from its snapshot
+        self.storage = None
+        # Authoritative stored content per list: {list_name: {guild_id (str): settings}}
+        self._lists = {}
 
-    def get_file_path(self, file_name):
-        return os.path.join(self.base_dir, f"{file_name}.json" if not file_name.endswith('.json') else file_name)
+    def attach(self, bot):
+        """Binds the service to the bot and loads every list from storage."""
+        self.bot = bot
+        self.storage = bot.storage
+        self._lists = self.storage.load_namespace('vxt')
+        self.load_settings()
 
     def convert_str_to_int(self, data):
         if isinstance(data, dict):
@@ -54,58 +59,79 @@ class VxTService:
         else:
             return data
 
-    def read_file_content(self, file_name, empty_value=None):
-        if empty_value is None:
-            empty_value = {}
-            
-        file_path = self.get_file_path(file_name)
-        if os.path.exists(file_path):
-            with open(file_path, 'r', encoding='utf-8') as file:
-                try:
-                    content = json.load(file)
-                    return self.convert_str_to_int(content)
-                except json.JSONDecodeError:
-                    return copy.deepcopy(empty_value)
-        else:
-            with open(file_path, 'w', encoding='utf-8') as file:
-                json.dump(empty_value, file)
-            return copy.deepcopy(empty_value)
+    def _build_snapshot(self, guild_id):
+        """Builds the settings dict of a guild from the stored lists."""
+        key = str(guild_id)
+        snapshot = {}
+        for list_name in self.default_settings:
+            value = self._lists.get(list_name, {}).get(key)
+            if value is not None:
+                snapshot[list_name[:-5]] = self.convert_str_to_int(value)
+        return snapshot
 
-    async def write_file_content(self, file_name, modified_content):
-        file_path = self.get_file_path(file_name)
-        modified_content = self.convert_set_to_list(modified_content)
+    def _publish(self, guild_id):
+        """Replaces the snapshot of a guild (never mutated in place, readers keep a consistent view)."""
+        snapshot = self._build_snapshot(guild_id)
+        self.master_settings[guild_id] = snapshot
+        self.rewriters[guild_id] = LinkRewriter(snapshot, self.default_settings)
 
-        with open(file_path, 'w', encoding='utf-8') as file:
-            json.dump(modified_content, file, indent=4)
-        
-        # update master_settings in memory
-        await self.load_settings()
-        return True
+    def get_guild_settings(self, guild_id):
+        """Returns the read-only settings snapshot of a guild ({} if unknown)."""
+        return self.master_settings.get(guild_id, {})
+
+    def get_setting(self, guild_id, list_name):
+        """Returns a private copy of one setting of a guild (default if unset), safe to mutate."""
+        value = self._lists.get(list_name, {}).get(str(guild_id))
+        if value is None:
+            value = self.default_settings[list_name]
+        # convert_str_to_int builds new containers
+        return self.convert_str_to_int(value)
+
+    async def set_setting(self, guild_id, list_name, value):
+        """Stores one setting of a guild and publishes its new snapshot."""
+        await self.set_settings(guild_id, {list_name: value})
+
+    async def set_settings(self, guild_id, values):
+        """Stores several settings ({list_name: value}) of a guild in one batch."""
+        key = str(guild_id)
+        changed = []
+        for list_name, value in values.items():
+            value = self.convert_set_to_list(value)
+            if self._lists.get(list_name, {}).get(key) != value:
+                changed.append((list_name, key, value))
+        if not changed:
+            return
+        # Persisted first: a failed write leaves the lists and the snapshot untouched
+        await self.storage.put_many('vxt', changed)
+        for list_name, key, value in changed:
+            self._lists.setdefault(list_name, {})[key] = value
+        self._publish(guild_id)
+
+    async def reset_guild(self, guild_id):
+        """Restores every setting of a guild to its default."""
+        await self.set_settings(guild_id, copy.deepcopy(self.default_settings))
+
+    def load_settings(self):
+        """Builds the snapshots of every stored guild."""
+        guild_ids = {guild_id for values in self._lists.values() for guild_id in values}
+        for guild_id in guild_ids:
+            self._publish(int(guild_id) if guild_id.isdigit() else guild_id)
 
-    async def load_settings(self):
-        for filename, default_val in self.default_settings.items():
-            temp_file = self.read_file_content(filename, {})
-            for guild_id, settings in temp_file.items():
-                if guild_id not in self.master_settings:
-                    self.master_settings[guild_id] = {}
-                key = filename[:-5] if filename.endswith('-list') else filename
-                self.master_settings[guild_id][key] = settings
+    def get_rewriter(self, guild_id):
+        """Returns the compiled link conversions (and fxtwitter policy) of a guild, or None."""
+        return self.rewriters.get(guild_id)
 
     async def initialize_guilds(self, guilds):
-        for filename in self.default_settings.keys():
-            temp_list = self.read_file_content(filename, {})
-            changed = False
+        missing = []
+        for list_name, default in self.default_settings.items():
+            current = self._lists.setdefault(list_name, {})
             for guild in guilds:
-                if guild.id not in temp_list:
-                    temp_list[guild.id] = self.default_settings[filename]
-                    changed = True
-            
-            if changed:
-                file_path = self.get_file_path(filename)
-                mod_content = self.convert_set_to_list(temp_list)
-                with open(file_path, 'w', encoding='utf-8') as file:
-                    json.dump(mod_content, file, indent=4)
-                    
-        await self.load_settings()
+                if str(guild.id) not in current:
+                    current[str(guild.id)] = copy.deepcopy(default)
+                    missing.append((list_name, str(guild.id), current[str(guild.id)]))
+        if missing:
+            await self.storage.put_many('vxt', missing)
+            for guild_id in {int(guild_id) for _, guild_id, _ in missing}:
+                self._publish(guild_id)
 
 vxt_service_global = VxTService()
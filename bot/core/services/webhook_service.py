@@ -0,0 +1,52 @@
+import asyncio
+import discord
+
+class WebhookRegistry:
+    """Caches the bot's webhook of each channel and the owner of foreign webhooks.
+
+    Entries of a channel are dropped on on_webhooks_update, and a webhook that
+    answers 404 is dropped by its caller through invalidate_channel().
+    """
+
+    def __init__(self, client):
+        self.client = client
+        self._channel_webhooks = {}  # channel_id -> discord.Webhook owned by the bot
+        self._owners = {}  # webhook_id -> (channel_id, owner user id or None)
+        self._locks = {}  # channel_id -> asyncio.Lock (one creation at a time)
+
+    async def get_channel_webhook(self, channel):
+        """Returns the bot's webhook of channel, creating it if needed."""
+        webhook = self._channel_webhooks.get(channel.id)
+        if webhook is not None:
+            return webhook
+
+        lock = self._locks.setdefault(channel.id, asyncio.Lock())
+        async with lock:
+            webhook = self._channel_webhooks.get(channel.id)
+            if webhook is None:
+                channel_webhooks = await channel.webhooks()
+                webhook = next((w for w in channel_webhooks if w.user and w.user.id == self.client.user.id), None)
+                if webhook is None:
+                    webhook = await channel.create_webhook(name="VxT", reason="To send messages with converted links.")
+                self._channel_webhooks[channel.id] = webhook
+        return webhook
+
+    async def get_owner_id(self, webhook_id):
+        """Returns the id of the user who created a webhook, or None if it cannot be fetched."""
+        entry = self._owners.get(webhook_id)
+        if entry is not None:
+            return entry[1]
+        try:
+            webhook = await self.client.fetch_webhook(webhook_id)
+        except (discord.Forbidden, discord.NotFound):
+            self._owners[webhook_id] = (None, None)
+            return None
+        owner_id = webhook.user.id if webhook.user else None
+        self._owners[webhook_id] = (webhook.channel_id, owner_id)
+        return owner_id
+
+    def invalidate_channel(self, channel_id):
+        """Forgets every cached webhook of a channel."""
+        self._channel_webhooks.pop(channel_id, None)
+        for webhook_id in [wid for wid, (cid, _) in self._owners.items() if cid == channel_id or cid is None]:
+            del self._owners[webhook_id]
@@ -1,12 +1,9 @@
 import discord
 import os
-import shutil
 from typing import Dict, Any, Optional
 from discord import app_commands
 from discord.ext import commands
-from yt_dlp import YoutubeDL
 import asyncio
-import time
 from lang.lang_utils import t
 from services.version_service import get_current_version
 
@@ -147,8 +144,8 @@ class MusicControlView(discord.ui.View):
             del self.cog.progress_tasks[guild_id]
         
         self.cog.audio_service.stop(interaction.guild)
-        # Session cleanup (bridging to async loop)
-        asyncio.run_coroutine_threadsafe(self.cog._robust_session_cleanup(), self.cog.client.loop)
+        # Session cleanup
+        self.cog._release_session(guild_id)
         
         await interaction.response.send_message(t('music_btn_stopped', guild_id=guild_id), ephemeral=True)
         
@@ -190,13 +187,13 @@ class AudioPlayerSearchSelect(discord.ui.Select):
         )
         try:
             video_url = selected.get('webpage_url', f"https://www.youtube.com/watch?v={selected['id']}")
-            with YoutubeDL(play_options) as ydl:
-                v_info = ydl.extract_info(video_url, download=False)
+            v_info = await self.cog.extraction_service.extract_info(video_url, play_options, guild_id=guild_id)
+            self.cog.audio_cache.remember(video_url, v_info)
             audio_url = v_info['url']
             title = v_info.get('title', selected.get('title', video_url))
             queue = self.cog.audio_service.get_queue(interaction.guild.id)
             if self.cog.audio_service.is_playing(interaction.guild) or self.cog.audio_service.is_paused(interaction.guild):
-                queue.append({
+                self.cog.audio_service.enqueue(interaction.guild.id, {
                     'title': title, 
                     'url': audio_url, 
                     'headers': v_info.get('http_headers'),
@@ -233,49 +230,19 @@ class AudioPlayerSearchSelect(discord.ui.Select):
                 )
             self.view.stop()
         except Exception as e:
-            embed = discord.Embed(title=t('audio_error_title', guild_id=guild_id), description=t('audio_search_error_general', error=str(e), guild_id=guild_id), color=discord.Color.red())
-            embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=guild_id), icon_url=interaction.user.avatar)
-            embed.set_footer(text=get_current_version(self.cog.client, guild_id=guild_id))
+            embed = self.cog.client.embed_factory.build(guild_id, 'audio_error_title', 'audio_search_error_general', color=discord.Color.red(), author=interaction.user, error=str(e))
             await interaction.followup.send(embed=embed, ephemeral=True)
             print(t('log_err_search', error=e, guild_id=guild_id))
 
 class AudioPlayer(commands.Cog):
-    async def _robust_session_cleanup(self, retries: int = 15, delay: float = 1.5):
-        """Async cleanup of the downloads directory with retries."""
-        downloads_dir = self.client.paths.get('downloads_dir', 'downloads')
-        if not os.path.exists(downloads_dir):
-            return
-
-        print(t('log_cleanup_start'))
-        
-        for i in range(retries):
-            try:
-                # Try to delete the whole directory or its contents
-                for filename in os.listdir(downloads_dir):
-                    file_path = os.path.join(downloads_dir, filename)
-                    try:
-                        if os.path.isfile(file_path) or os.path.islink(file_path):
-                            os.unlink(file_path)
-                        elif os.path.isdir(file_path):
-                            shutil.rmtree(file_path)
-                        print(t('log_cleanup_success', file=filename))
-                    except Exception:
-                        # Skip files that are still locked (expected if FFmpeg is still exiting)
-                        continue
-                
-                # If directory is empty, we are done
-                if not os.listdir(downloads_dir):
-                    return
-            except Exception:
-                pass
-            await asyncio.sleep(delay)
-        
-        # Final check
-        if os.listdir(downloads_dir):
-            print(t('log_cleanup_failure', path=downloads_dir, retries=retries))
+    def _release_session(self, guild_id):
+        """Releases the cached files held by a guild's session (allows their eviction)."""
+        self.audio_service.cancel_prefetches(guild_id)
+        self.audio_service.cancel_handoff(guild_id)
+        self.audio_cache.unpin(guild_id)
 
     async def _play_track(self, interaction: discord.Interaction, track_info: Dict[str, Any]):
-        """Centralized method to play a track, universally using the download strategy for maximum stability."""
+        """Centralized method to play a track (stream-first, local file once downloaded)."""
         guild_id = interaction.guild.id
         url = track_info['url']
         title = track_info['title']
@@ -283,42 +250,24 @@ class AudioPlayer(commands.Cog):
         headers = track_info.get('headers')
         original_url = track_info.get('original_url', url)
 
-        # Download Strategy (Universal)
-        downloads_dir = self.client.paths.get('downloads_dir', 'downloads')
-        os.makedirs(downloads_dir, exist_ok=True)
-        
-        # Use unique ID + timestamp to avoid collisions
-        track_id = track_info.get('id', str(hash(original_url)))
-        timestamp = int(time.time())
-        outtmpl = os.path.join(downloads_dir, f'{track_id}_{timestamp}.%(ext)s')
-        
-        ydl_opts = self._get_ydl_opts(outtmpl=outtmpl)
-        loop = asyncio.get_event_loop()
+        # Hybrid strategy: local file from the persistent audio cache when available,
+        # otherwise stream at once while the file downloads in the background
+        ydl_opts = self._get_ydl_opts(noplaylist=True)
         
         try:
-            # Offload blocking extraction and download to executor
-            def download():
-                with YoutubeDL(ydl_opts) as ydl_down:
-                    info = ydl_down.extract_info(original_url, download=True)
-                    return ydl_down.prepare_filename(info)
-
-            audio_path = await loop.run_in_executor(None, download)
+            source, is_local, stream_headers, codec = await self.audio_service.prepare_track(guild_id, track_info)
             
             # Simple callback: just check the queue
             def voice_after(error):
                 self.check_queue(interaction)
 
-            await self.audio_service.play_audio(interaction.guild, audio_path, is_local=True, after_cb=voice_after, title=title, duration=duration, original_url=original_url)
+            await self.audio_service.play_audio(interaction.guild, source, is_local=is_local, after_cb=voice_after, title=title, duration=duration, headers=stream_headers, original_url=original_url, codec=codec)
         except Exception as e:
             print(t('log_err_download', url=original_url, error=str(e)))
             # Fallback to streaming if download fails (safety net)
-            def stream_download():
-                with YoutubeDL(ydl_opts) as ydl_down:
-                    return ydl_down.extract_info(url, download=False)
-            
             try:
-                # Even fallback extraction should be in executor
-                await loop.run_in_executor(None, stream_download)
+                # Even fallback extraction goes through the worker pool
+                await self.extraction_service.extract_info(url, ydl_opts, guild_id=guild_id)
                 await self.audio_service.play_audio(interaction.guild, url, after_cb=lambda e: self.check_queue(interaction), title=title, duration=duration, headers=headers, original_url=original_url)
             except Exception as e2:
                 print(f"Fallback extraction failed: {e2}")
@@ -326,6 +275,8 @@ class AudioPlayer(commands.Cog):
     def __init__(self, client):
         self.client = client
         self.audio_service = client.audio_service
+        self.extraction_service = client.extraction_service
+        self.audio_cache = client.audio_cache
         self.progress_tasks = {}  # guild_id -> asyncio.Task
         self.active_messages = {}  # guild_id -> discord.Message
 
@@ -336,21 +287,11 @@ class AudioPlayer(commands.Cog):
             # Bot was in a channel but is no longer in one
             if before.channel is not None and after.channel is None:
                 # Disconnected
-                asyncio.create_task(self._robust_session_cleanup())
+                self._release_session(before.channel.guild.id)
 
     def _get_ydl_opts(self, **overrides) -> Dict[str, Any]:
         """Generate YoutubeDL options with central config and optional overrides."""
-        opts = {
-            'format': 'bestaudio/best',
-            'quiet': True,
-            'no_warnings': True,
-            'js_runtimes': {'node': {'path': self.client.paths['node_exe']}},
-            'extractor_args': {
-                'tiktok': self.client.config.get('tiktok_args', {})
-            }
-        }
-        opts.update(overrides)
-        return opts
+        return self.audio_service.get_ydl_opts(**overrides)
     
     def check_queue(self, interaction: discord.Interaction):
         """Thread-safe call to process the next track in queue."""
@@ -436,9 +377,7 @@ class AudioPlayer(commands.Cog):
 
         if not interaction.user.voice:
             guild_id = interaction.guild.id if interaction.guild else None
-            embed = discord.Embed(title=t('audio_error_title', guild_id=guild_id), description=t('audio_error_not_in_voice', guild_id=guild_id), color=discord.Color.red())
-            embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=guild_id), icon_url=interaction.user.avatar)
-            embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            embed = self.client.embed_factory.build(guild_id, 'audio_error_title', 'audio_error_not_in_voice', color=discord.Color.red(), author=interaction.user)
             return await interaction.response.send_message(embed=embed, ephemeral=True)
 
         await interaction.response.defer(ephemeral=False)
@@ -448,8 +387,8 @@ class AudioPlayer(commands.Cog):
 
         ydl_options = self._get_ydl_opts(noplaylist=True)
         try:
-            with YoutubeDL(ydl_options) as ydl:
-                info = ydl.extract_info(url, download=False)
+            info = await self.extraction_service.extract_info(url, ydl_options, guild_id=interaction.guild.id)
+            self.audio_cache.remember(url, info)
             audio_url = info['url']
             title = info.get('title', url)
 
@@ -483,7 +422,7 @@ class AudioPlayer(commands.Cog):
                     self.progress_tasks[interaction.guild.id].cancel()
                 self.progress_tasks[interaction.guild.id] = asyncio.create_task(self._update_progress_loop(interaction.guild.id, message, embed))
             else:
-                queue.append({
+                self.audio_service.enqueue(interaction.guild.id, {
                     'title': title, 
                     'url': audio_url, 
                     'duration': info.get('duration'), 
@@ -491,15 +430,11 @@ class AudioPlayer(commands.Cog):
                     'original_url': url,
                     'id': info.get('id')
                 })
-                embed = discord.Embed(title=t('audio_queue_add_title', guild_id=interaction.guild.id), description=t('audio_queue_add_desc', title=title, guild_id=interaction.guild.id), color=discord.Color.blue())
-                embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=interaction.guild.id), icon_url=interaction.user.avatar)
-                embed.set_footer(text=get_current_version(self.client, guild_id=interaction.guild.id))
+                embed = self.client.embed_factory.build(interaction.guild.id, 'audio_queue_add_title', 'audio_queue_add_desc', color=discord.Color.blue(), author=interaction.user, title=title)
                 await interaction.followup.send(embed=embed)
 
         except Exception as e:
-            embed = discord.Embed(title=t('audio_error_title', guild_id=interaction.guild.id), description=t('audio_error_general', error=str(e), guild_id=interaction.guild.id), color=discord.Color.red())
-            embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=interaction.guild.id), icon_url=interaction.user.avatar)
-            embed.set_footer(text=get_current_version(self.client, guild_id=interaction.guild.id))
+            embed = self.client.embed_factory.build(interaction.guild.id, 'audio_error_title', 'audio_error_general', color=discord.Color.red(), author=interaction.user, error=str(e))
             await interaction.followup.send(embed=embed, ephemeral=True)
 
     @app_commands.command(name="msearch", description="Search for a video or audio (YouTube, TikTok, X, etc.)")
@@ -507,9 +442,7 @@ class AudioPlayer(commands.Cog):
     async def msearch(self, interaction: discord.Interaction, query: str):
         if not interaction.user.voice:
             guild_id = interaction.guild.id if interaction.guild else None
-            embed = discord.Embed(title=t('audio_error_title', guild_id=guild_id), description=t('audio_error_not_in_voice', guild_id=guild_id), color=discord.Color.red())
-            embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=guild_id), icon_url=interaction.user.avatar)
-            embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            embed = self.client.embed_factory.build(guild_id, 'audio_error_title', 'audio_error_not_in_voice', color=discord.Color.red(), author=interaction.user)
             return await interaction.response.send_message(embed=embed, ephemeral=True)
             
         await interaction.response.defer(ephemeral=False)
@@ -522,21 +455,16 @@ class AudioPlayer(commands.Cog):
         )
         # ...
         try:
-            with YoutubeDL(search_options) as ydl:
-                info = ydl.extract_info(f'ytsearch10:{query}', download=False)
+            info = await self.extraction_service.extract_info(f'ytsearch10:{query}', search_options, guild_id=interaction.guild.id)
             
             if not info or 'entries' not in info:
-                embed = discord.Embed(title=t('audio_search_results_title', guild_id=interaction.guild.id), description=t('audio_search_no_results', guild_id=interaction.guild.id), color=discord.Color.orange())
-                embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=interaction.guild.id), icon_url=interaction.user.avatar)
-                embed.set_footer(text=get_current_version(self.client, guild_id=interaction.guild.id))
+                embed = self.client.embed_factory.build(interaction.guild.id, 'audio_search_results_title', 'audio_search_no_results', color=discord.Color.orange(), author=interaction.user)
                 return await interaction.followup.send(embed=embed, ephemeral=True)
 
             videos = [v for v in info.get('entries', []) if v]
             
             if not videos:
-                embed = discord.Embed(title=t('audio_search_results_title', guild_id=interaction.guild.id), description=t('audio_search_invalid_video', guild_id=interaction.guild.id), color=discord.Color.orange())
-                embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=interaction.guild.id), icon_url=interaction.user.avatar)
-                embed.set_footer(text=get_current_version(self.client, guild_id=interaction.guild.id))
+                embed = self.client.embed_factory.build(interaction.guild.id, 'audio_search_results_title', 'audio_search_invalid_video', color=discord.Color.orange(), author=interaction.user)
                 return await interaction.followup.send(embed=embed, ephemeral=True)
 
 
@@ -547,9 +475,7 @@ class AudioPlayer(commands.Cog):
             )
 
         except Exception as e:
-            embed = discord.Embed(title=t('audio_error_title', guild_id=interaction.guild.id if interaction.guild else None), description=t('audio_search_error_general', error=str(e), guild_id=interaction.guild.id if interaction.guild else None), color=discord.Color.red())
-            embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=interaction.guild.id if interaction.guild else None), icon_url=interaction.user.avatar)
-            embed.set_footer(text=get_current_version(self.client, guild_id=interaction.guild.id if interaction.guild else None))
+            embed = self.client.embed_factory.build(interaction.guild.id if interaction.guild else None, 'audio_error_title', 'audio_search_error_general', color=discord.Color.red(), author=interaction.user, error=str(e))
             await interaction.followup.send(embed=embed, ephemeral=True)
             print(t('log_err_search', error=e, guild_id=interaction.guild.id if interaction.guild else None))
 
@@ -575,9 +501,7 @@ class AudioPlayer(commands.Cog):
             embed.set_footer(text=get_current_version(self.client, guild_id=interaction.guild.id))
             await interaction.response.send_message(embed=embed)
         else:
-            embed = discord.Embed(title=t('audio_error_title', guild_id=interaction.guild.id), description=t('audio_error_playing_none', guild_id=interaction.guild.id), color=discord.Color.red())
-            embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=interaction.guild.id), icon_url=interaction.user.avatar)
-            embed.set_footer(text=get_current_version(self.client, guild_id=interaction.guild.id))
+            embed = self.client.embed_factory.build(interaction.guild.id, 'audio_error_title', 'audio_error_playing_none', color=discord.Color.red(), author=interaction.user)
             await interaction.response.send_message(embed=embed, ephemeral=True)
 
     @app_commands.command(name="mstop", description="Stop playback")
@@ -590,7 +514,7 @@ class AudioPlayer(commands.Cog):
 
             self.audio_service.stop(interaction.guild)
             # Session cleanup
-            asyncio.create_task(self._robust_session_cleanup())
+            self._release_session(guild_id)
             
             # Delete active message if tracked (Stop button behavior)
             if guild_id in self.active_messages:
@@ -600,9 +524,7 @@ class AudioPlayer(commands.Cog):
                     pass
                 del self.active_messages[guild_id]
 
-            embed = discord.Embed(title=t('audio_stop_title', guild_id=guild_id), description=t('audio_stop_desc', guild_id=guild_id), color=discord.Color.red())
-            embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=guild_id), icon_url=interaction.user.avatar)
-            embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            embed = self.client.embed_factory.build(guild_id, 'audio_stop_title', 'audio_stop_desc', color=discord.Color.red(), author=interaction.user)
             await interaction.response.send_message(embed=embed)
         else:
             await interaction.response.send_message(t('music_btn_nothing_playing', guild_id=guild_id), ephemeral=True)
@@ -610,27 +532,19 @@ class AudioPlayer(commands.Cog):
     @app_commands.command(name="mpause", description="Pause the video/audio")
     async def mpause(self, interaction: discord.Interaction):
         if self.audio_service.pause(interaction.guild):
-            embed = discord.Embed(title=t('audio_pause_title', guild_id=interaction.guild.id), description=t('audio_pause_desc', guild_id=interaction.guild.id), color=discord.Color.orange())
-            embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=interaction.guild.id), icon_url=interaction.user.avatar)
-            embed.set_footer(text=get_current_version(self.client, guild_id=interaction.guild.id))
+            embed = self.client.embed_factory.build(interaction.guild.id, 'audio_pause_title', 'audio_pause_desc', color=discord.Color.orange(), author=interaction.user)
             await interaction.response.send_message(embed=embed)
         else:
-            embed = discord.Embed(title=t('audio_error_title', guild_id=interaction.guild.id), description=t('audio_error_already_paused', guild_id=interaction.guild.id), color=discord.Color.red())
-            embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=interaction.guild.id), icon_url=interaction.user.avatar)
-            embed.set_footer(text=get_current_version(self.client, guild_id=interaction.guild.id))
+            embed = self.client.embed_factory.build(interaction.guild.id, 'audio_error_title', 'audio_error_already_paused', color=discord.Color.red(), author=interaction.user)
             await interaction.response.send_message(embed=embed, ephemeral=True)
 
     @app_commands.command(name="mresume", description="Resume the video/audio")
     async def mresume(self, interaction: discord.Interaction):
         if self.audio_service.resume(interaction.guild):
-            embed = discord.Embed(title=t('audio_resume_title', guild_id=interaction.guild.id), description=t('audio_resume_desc', guild_id=interaction.guild.id), color=discord.Color.green())
-            embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=interaction.guild.id), icon_url=interaction.user.avatar)
-            embed.set_footer(text=get_current_version(self.client, guild_id=interaction.guild.id))
+            embed = self.client.embed_factory.build(interaction.guild.id, 'audio_resume_title', 'audio_resume_desc', color=discord.Color.green(), author=interaction.user)
             await interaction.response.send_message(embed=embed)
         else:
-            embed = discord.Embed(title=t('audio_error_title', guild_id=interaction.guild.id), description=t('audio_error_not_paused', guild_id=interaction.guild.id), color=discord.Color.red())
-            embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=interaction.guild.id), icon_url=interaction.user.avatar)
-            embed.set_footer(text=get_current_version(self.client, guild_id=interaction.guild.id))
+            embed = self.client.embed_factory.build(interaction.guild.id, 'audio_error_title', 'audio_error_not_paused', color=discord.Color.red(), author=interaction.user)
             await interaction.response.send_message(embed=embed, ephemeral=True)
 
     @app_commands.command(name="mqueue", description="Display the queue")
@@ -649,9 +563,7 @@ class AudioPlayer(commands.Cog):
     @app_commands.command(name="mclearqueue", description="Clear the queue")
     async def mclearqueue(self, interaction: discord.Interaction):
         self.audio_service.clear_queue(interaction.guild.id)
-        embed = discord.Embed(title=t('audio_queue_add_title', guild_id=interaction.guild.id), description=t('audio_queue_cleared', guild_id=interaction.guild.id), color=discord.Color.green())
-        embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=interaction.guild.id), icon_url=interaction.user.avatar)
-        embed.set_footer(text=get_current_version(self.client, guild_id=interaction.guild.id))
+        embed = self.client.embed_factory.build(interaction.guild.id, 'audio_queue_add_title', 'audio_queue_cleared', color=discord.Color.green(), author=interaction.user)
         await interaction.response.send_message(embed=embed)
 
 
@@ -672,13 +584,12 @@ class AudioPlayer(commands.Cog):
 
         ydl_options = self._get_ydl_opts(noplaylist=True)
         try:
-            with YoutubeDL(ydl_options) as ydl:
-                info = ydl.extract_info(url, download=False)
+            info = await self.extraction_service.extract_info(url, ydl_options, guild_id=interaction.guild.id)
+            self.audio_cache.remember(url, info)
             audio_url = info['url']
             title = info.get('title', url)
 
-            queue = self.audio_service.get_queue(interaction.guild.id)
-            queue.append({
+            position = self.audio_service.enqueue(interaction.guild.id, {
                 'title': title, 
                 'url': audio_url, 
                 'headers': info.get('http_headers'),
@@ -686,15 +597,11 @@ class AudioPlayer(commands.Cog):
                 'id': info.get('id')
             })
 
-            embed = discord.Embed(title=t('music_addqueue_title', guild_id=interaction.guild.id), description=t('music_addqueue_desc', title=title, position=len(queue), guild_id=interaction.guild.id), color=discord.Color.blue())
-            embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=interaction.guild.id), icon_url=interaction.user.avatar)
-            embed.set_footer(text=get_current_version(self.client, guild_id=interaction.guild.id))
+            embed = self.client.embed_factory.build(interaction.guild.id, 'music_addqueue_title', 'music_addqueue_desc', color=discord.Color.blue(), author=interaction.user, title=title, position=position)
             await interaction.followup.send(embed=embed)
 
         except Exception as e:
-            embed = discord.Embed(title=t('audio_error_title', guild_id=interaction.guild.id), description=t('audio_error_general', error=str(e), guild_id=interaction.guild.id), color=discord.Color.red())
-            embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=interaction.guild.id), icon_url=interaction.user.avatar)
-            embed.set_footer(text=get_current_version(self.client, guild_id=interaction.guild.id))
+            embed = self.client.embed_factory.build(interaction.guild.id, 'audio_error_title', 'audio_error_general', color=discord.Color.red(), author=interaction.user, error=str(e))
             await interaction.followup.send(embed=embed, ephemeral=True)
 
     @app_commands.command(name="mremovequeue", description="Remove a song from the queue")
@@ -702,21 +609,15 @@ class AudioPlayer(commands.Cog):
     async def mremovequeue(self, interaction: discord.Interaction, position: int):
         queue = self.audio_service.get_queue(interaction.guild.id)
         if not queue:
-            embed = discord.Embed(title=t('audio_queue_add_title', guild_id=interaction.guild.id), description=t('audio_queue_empty', guild_id=interaction.guild.id), color=discord.Color.orange())
-            embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=interaction.guild.id), icon_url=interaction.user.avatar)
-            embed.set_footer(text=get_current_version(self.client, guild_id=interaction.guild.id))
+            embed = self.client.embed_factory.build(interaction.guild.id, 'audio_queue_add_title', 'audio_queue_empty', color=discord.Color.orange(), author=interaction.user)
             return await interaction.response.send_message(embed=embed, ephemeral=True)
 
         if position < 1 or position > len(queue):
-            embed = discord.Embed(title=t('music_removequeue_title', guild_id=interaction.guild.id), description=t('music_removequeue_error_invalid', count=len(queue), guild_id=interaction.guild.id), color=discord.Color.red())
-            embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=interaction.guild.id), icon_url=interaction.user.avatar)
-            embed.set_footer(text=get_current_version(self.client, guild_id=interaction.guild.id))
+            embed = self.client.embed_factory.build(interaction.guild.id, 'music_removequeue_title', 'music_removequeue_error_invalid', color=discord.Color.red(), author=interaction.user, count=len(queue))
             return await interaction.response.send_message(embed=embed, ephemeral=True)
 
-        removed = queue.pop(position - 1)
-        embed = discord.Embed(title=t('music_removequeue_title', guild_id=interaction.guild.id), description=t('music_removequeue_desc', title=removed['title'], guild_id=interaction.guild.id), color=discord.Color.green())
-        embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=interaction.guild.id), icon_url=interaction.user.avatar)
-        embed.set_footer(text=get_current_version(self.client, guild_id=interaction.guild.id))
+        removed = self.audio_service.remove_from_queue(interaction.guild.id, position - 1)
+        embed = self.client.embed_factory.build(interaction.guild.id, 'music_removequeue_title', 'music_removequeue_desc', color=discord.Color.green(), author=interaction.user, title=removed['title'])
         await interaction.response.send_message(embed=embed)
 
     @app_commands.command(name="mseek", description="Seek to a specific time in the current track")
@@ -724,9 +625,7 @@ class AudioPlayer(commands.Cog):
     async def mseek(self, interaction: discord.Interaction, minutes: int = 0, seconds: int = 0):
         total_seconds = (minutes * 60) + seconds
         if not self.audio_service.is_playing(interaction.guild) and not self.audio_service.is_paused(interaction.guild):
-            embed = discord.Embed(title=t('audio_error_title', guild_id=interaction.guild.id), description=t('audio_error_playing_none', guild_id=interaction.guild.id), color=discord.Color.red())
-            embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=interaction.guild.id), icon_url=interaction.user.avatar)
-            embed.set_footer(text=get_current_version(self.client, guild_id=interaction.guild.id))
+            embed = self.client.embed_factory.build(interaction.guild.id, 'audio_error_title', 'audio_error_playing_none', color=discord.Color.red(), author=interaction.user)
             return await interaction.response.send_message(embed=embed, ephemeral=True)
 
         await interaction.response.defer()
@@ -759,9 +658,7 @@ class AudioPlayer(commands.Cog):
         previous = self.audio_service.get_previous(interaction.guild.id)
         if previous:
             await self._play_track(interaction, previous)
-            embed = discord.Embed(title=t('music_previous_title', guild_id=interaction.guild.id), description=t('music_previous_desc', title=previous['title'], guild_id=interaction.guild.id), color=discord.Color.green())
-            embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=interaction.guild.id), icon_url=interaction.user.avatar)
-            embed.set_footer(text=get_current_version(self.client, guild_id=interaction.guild.id))
+            embed = self.client.embed_factory.build(interaction.guild.id, 'music_previous_title', 'music_previous_desc', color=discord.Color.green(), author=interaction.user, title=previous['title'])
             await interaction.followup.send(embed=embed)
         else:
             # Fallback: Restart current if no history
@@ -772,17 +669,13 @@ class AudioPlayer(commands.Cog):
     @app_commands.describe(volume="Volume level (0-200, default is 100)")
     async def mvolume(self, interaction: discord.Interaction, volume: int):
         if volume < 0 or volume > 200:
-            embed = discord.Embed(title=t('music_volume_error_title', guild_id=interaction.guild.id), description=t('music_volume_error_range', guild_id=interaction.guild.id), color=discord.Color.red())
-            embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=interaction.guild.id), icon_url=interaction.user.avatar)
-            embed.set_footer(text=get_current_version(self.client, guild_id=interaction.guild.id))
+            embed = self.client.embed_factory.build(interaction.guild.id, 'music_volume_error_title', 'music_volume_error_range', color=discord.Color.red(), author=interaction.user)
             return await interaction.response.send_message(embed=embed, ephemeral=True)
 
         volume_float = volume / 100.0
         self.audio_service.set_volume(interaction.guild.id, volume_float)
 
-        embed = discord.Embed(title=t('music_volume_title', guild_id=interaction.guild.id), description=t('music_volume_desc', volume=volume, guild_id=interaction.guild.id), color=discord.Color.green())
-        embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=interaction.guild.id), icon_url=interaction.user.avatar)
-        embed.set_footer(text=get_current_version(self.client, guild_id=interaction.guild.id))
+        embed = self.client.embed_factory.build(interaction.guild.id, 'music_volume_title', 'music_volume_desc', color=discord.Color.green(), author=interaction.user, volume=volume)
         await interaction.response.send_message(embed=embed)
 
 
@@ -3,13 +3,14 @@ from discord import app_commands
 from discord.ext import commands
 from discord.ui import View, Button
 import io
-import requests
+import asyncio
+import aiohttp
 from datetime import datetime
 import os
 import json
 import traceback
 from services.version_service import get_current_version, get_version_info, get_latest_logs, get_all_history
-from lang.lang_utils import t
+from lang.lang_utils import t, get_bundle
 
 class HelpPaginatorView(View):
     """Pagination view for the help menu"""
@@ -93,116 +94,117 @@ class Help_slash(commands.Cog):
         """Creates all help embeds"""
         embeds = []
         files = []
+        tr = get_bundle(guild_id=guild_id)
         
         # Page 1: Main Helps
-        embed1 = discord.Embed(title=t('help_title', guild_id=guild_id), description=t('help_all_commands', guild_id=guild_id), color=discord.Color.random())
-        embed1.set_author(name=t('help_requested_by', user=user.name, guild_id=guild_id), icon_url=user.avatar)
-        embed1.add_field(name="helps", value=t('help_all_commands', guild_id=guild_id))
-        embed1.add_field(name="ping", value=t('help_ping_desc', guild_id=guild_id))
-        embed1.add_field(name="version", value=t('help_version_desc', guild_id=guild_id))
-        embed1.add_field(name="report", value=t('help_report_desc', guild_id=guild_id))
+        embed1 = discord.Embed(title=tr('help_title'), description=tr('help_all_commands'), color=discord.Color.random())
+        embed1.set_author(name=tr('help_requested_by', user=user.name), icon_url=user.avatar)
+        embed1.add_field(name="helps", value=tr('help_all_commands'))
+        embed1.add_field(name="ping", value=tr('help_ping_desc'))
+        embed1.add_field(name="version", value=tr('help_version_desc'))
+        embed1.add_field(name="report", value=tr('help_report_desc'))
         embeds.append(embed1)
         files.append(None)
 
         # Page 2: Mods
-        embed2 = discord.Embed(title=t('help_mods_title', guild_id=guild_id), description=t('help_mods_desc', guild_id=guild_id), color=discord.Color.random())
-        embed2.set_author(name=t('help_requested_by', user=user.name, guild_id=guild_id), icon_url=user.avatar)
-        embed2.add_field(name="clear", value=t('help_clear_messages_desc', guild_id=guild_id))
-        embed2.add_field(name="cleanraidsimple", value=t('help_cleanraidsimple_desc', guild_id=guild_id))
-        embed2.add_field(name="cleanraidmultiple", value=t('help_cleanraidmultiple_desc', guild_id=guild_id))
-        embed2.add_field(name="warn", value=t('help_warn_desc', guild_id=guild_id))
-        embed2.add_field(name="resetwarn", value=t('help_resetwarn_desc', guild_id=guild_id))
-        embed2.add_field(name="warnboard", value=t('help_warnboard_desc', guild_id=guild_id))
-        embed2.add_field(name="kick", value=t('help_kick_desc', guild_id=guild_id))
-        embed2.add_field(name="ban", value=t('help_ban_desc', guild_id=guild_id))
-        embed2.add_field(name="unban", value=t('help_unban_desc', guild_id=guild_id))
-        embed2.add_field(name="giverole", value=t('help_giverole_desc', guild_id=guild_id))
-        embed2.add_field(name="removerole", value=t('help_removerole_desc', guild_id=guild_id))
-        embed2.add_field(name="mp", value=t('help_mp_desc', guild_id=guild_id))
-        embed2.add_field(name="spam", value=t('help_spam_desc', guild_id=guild_id))
-        embed2.add_field(name="banword", value=t('help_banword_desc', guild_id=guild_id))
-        embed2.add_field(name="unbanword", value=t('help_unbanword_desc', guild_id=guild_id))
-        embed2.add_field(name="listbannedwords", value=t('help_listbannedwords_desc', guild_id=guild_id))
-        embed2.add_field(name=t('help_server_system_title', guild_id=guild_id), value=t('help_server_system_val', guild_id=guild_id), inline=False)
-        embed2.add_field(name=t('help_auto_detect_title', guild_id=guild_id), value=t('help_auto_detect_val', guild_id=guild_id), inline=False)
-        embed2.add_field(name=t('help_auto_sanctions_title', guild_id=guild_id), value=t('help_auto_sanctions_val', guild_id=guild_id), inline=False)
+        embed2 = discord.Embed(title=tr('help_mods_title'), description=tr('help_mods_desc'), color=discord.Color.random())
+        embed2.set_author(name=tr('help_requested_by', user=user.name), icon_url=user.avatar)
+        embed2.add_field(name="clear", value=tr('help_clear_messages_desc'))
+        embed2.add_field(name="cleanraidsimple", value=tr('help_cleanraidsimple_desc'))
+        embed2.add_field(name="cleanraidmultiple", value=tr('help_cleanraidmultiple_desc'))
+        embed2.add_field(name="warn", value=tr('help_warn_desc'))
+        embed2.add_field(name="resetwarn", value=tr('help_resetwarn_desc'))
+        embed2.add_field(name="warnboard", value=tr('help_warnboard_desc'))
+        embed2.add_field(name="kick", value=tr('help_kick_desc'))
+        embed2.add_field(name="ban", value=tr('help_ban_desc'))
+        embed2.add_field(name="unban", value=tr('help_unban_desc'))
+        embed2.add_field(name="giverole", value=tr('help_giverole_desc'))
+        embed2.add_field(name="removerole", value=tr('help_removerole_desc'))
+        embed2.add_field(name="mp", value=tr('help_mp_desc'))
+        embed2.add_field(name="spam", value=tr('help_spam_desc'))
+        embed2.add_field(name="banword", value=tr('help_banword_desc'))
+        embed2.add_field(name="unbanword", value=tr('help_unbanword_desc'))
+        embed2.add_field(name="listbannedwords", value=tr('help_listbannedwords_desc'))
+        embed2.add_field(name=tr('help_server_system_title'), value=tr('help_server_system_val'), inline=False)
+        embed2.add_field(name=tr('help_auto_detect_title'), value=tr('help_auto_detect_val'), inline=False)
+        embed2.add_field(name=tr('help_auto_sanctions_title'), value=tr('help_auto_sanctions_val'), inline=False)
         embeds.append(embed2)
         files.append(None)
 
         # Page 3: Utility
-        embed3 = discord.Embed(title=t('help_utility_title', guild_id=guild_id), description=t('help_utility_desc', guild_id=guild_id), color=discord.Color.random())
-        embed3.set_author(name=t('help_requested_by', user=user.name, guild_id=guild_id), icon_url=user.avatar)
-        embed3.add_field(name="gpt", value=t('help_gpt_desc', guild_id=guild_id))
-        embed3.add_field(name="dalle", value=t('help_dalle_desc', guild_id=guild_id))
-        embed3.add_field(name="say", value=t('help_repeat_desc', guild_id=guild_id))
-        embed3.add_field(name="8ball", value=t('help_8ball_desc', guild_id=guild_id))
-        embed3.add_field(name="hilaire", value=t('help_hilaire_desc', guild_id=guild_id))
-        embed3.add_field(name="deldms", value=t('help_deldms_desc', guild_id=guild_id))
-        embed3.add_field(name="leave", value=t('help_leave_desc', guild_id=guild_id))
-        embed3.add_field(name=t('help_auto_conv_title', guild_id=guild_id), value=t('help_auto_conv_val', guild_id=guild_id), inline=False)
+        embed3 = discord.Embed(title=tr('help_utility_title'), description=tr('help_utility_desc'), color=discord.Color.random())
+        embed3.set_author(name=tr('help_requested_by', user=user.name), icon_url=user.avatar)
+        embed3.add_field(name="gpt", value=tr('help_gpt_desc'))
+        embed3.add_field(name="dalle", value=tr('help_dalle_desc'))
+        embed3.add_field(name="say", value=tr('help_repeat_desc'))
+        embed3.add_field(name="8ball", value=tr('help_8ball_desc'))
+        embed3.add_field(name="hilaire", value=tr('help_hilaire_desc'))
+        embed3.add_field(name="deldms", value=tr('help_deldms_desc'))
+        embed3.add_field(name="leave", value=tr('help_leave_desc'))
+        embed3.add_field(name=tr('help_auto_conv_title'), value=tr('help_auto_conv_val'), inline=False)
         embeds.append(embed3)
         files.append(None)
 
         # Page 4: Videos & Audio (yt-dlp)
-        embed4 = discord.Embed(title=t('help_music_title', guild_id=guild_id), description=t('help_music_desc', guild_id=guild_id), color=discord.Color.random())
-        embed4.set_author(name=t('help_requested_by', user=user.name, guild_id=guild_id), icon_url=user.avatar)
-        embed4.add_field(name="mplay", value=t('help_mplay_desc', guild_id=guild_id))
-        embed4.add_field(name="msearch", value=t('help_msearch_desc', guild_id=guild_id))
-        embed4.add_field(name="mskip", value=t('help_mskip_desc', guild_id=guild_id))
-        embed4.add_field(name="mstop", value=t('help_mstop_desc', guild_id=guild_id))
-        embed4.add_field(name="mpause", value=t('help_mpause_desc', guild_id=guild_id))
-        embed4.add_field(name="mresume", value=t('help_mresume_desc', guild_id=guild_id))
-        embed4.add_field(name="mqueue", value=t('help_mqueue_desc', guild_id=guild_id))
-        embed4.add_field(name="mclearqueue", value=t('help_mclearqueue_desc', guild_id=guild_id))
-        embed4.add_field(name="mloop", value=t('help_mloop_desc', guild_id=guild_id))
-        embed4.add_field(name="mprevious", value=t('help_mprevious_desc', guild_id=guild_id))
-        embed4.add_field(name="maddqueue", value=t('help_maddqueue_desc', guild_id=guild_id))
-        embed4.add_field(name="mremovequeue", value=t('help_mremovequeue_desc', guild_id=guild_id))
-        embed4.add_field(name="mseek", value=t('help_mseek_desc', guild_id=guild_id))
-        embed4.add_field(name="mvolume", value=t('help_mvolume_desc', guild_id=guild_id))
+        embed4 = discord.Embed(title=tr('help_music_title'), description=tr('help_music_desc'), color=discord.Color.random())
+        embed4.set_author(name=tr('help_requested_by', user=user.name), icon_url=user.avatar)
+        embed4.add_field(name="mplay", value=tr('help_mplay_desc'))
+        embed4.add_field(name="msearch", value=tr('help_msearch_desc'))
+        embed4.add_field(name="mskip", value=tr('help_mskip_desc'))
+        embed4.add_field(name="mstop", value=tr('help_mstop_desc'))
+        embed4.add_field(name="mpause", value=tr('help_mpause_desc'))
+        embed4.add_field(name="mresume", value=tr('help_mresume_desc'))
+        embed4.add_field(name="mqueue", value=tr('help_mqueue_desc'))
+        embed4.add_field(name="mclearqueue", value=tr('help_mclearqueue_desc'))
+        embed4.add_field(name="mloop", value=tr('help_mloop_desc'))
+        embed4.add_field(name="mprevious", value=tr('help_mprevious_desc'))
+        embed4.add_field(name="maddqueue", value=tr('help_maddqueue_desc'))
+        embed4.add_field(name="mremovequeue", value=tr('help_mremovequeue_desc'))
+        embed4.add_field(name="mseek", value=tr('help_mseek_desc'))
+        embed4.add_field(name="mvolume", value=tr('help_mvolume_desc'))
 
-        embed4.add_field(name=t('help_music_controls_title', guild_id=guild_id), value=t('help_music_controls_desc', guild_id=guild_id), inline=False)
+        embed4.add_field(name=tr('help_music_controls_title'), value=tr('help_music_controls_desc'), inline=False)
         embeds.append(embed4)
         files.append(None)
 
         # Page 5: Soundboard
-        embed5 = discord.Embed(title=t('help_soundboard_title', guild_id=guild_id), description=t('help_soundboard_desc', guild_id=guild_id), color=discord.Color.random())
-        embed5.set_author(name=t('help_requested_by', user=user.name, guild_id=guild_id), icon_url=user.avatar)
-        embed5.add_field(name="slist", value=t('help_slist_desc', guild_id=guild_id))
-        embed5.add_field(name="splay", value=t('help_splay_desc', guild_id=guild_id))
+        embed5 = discord.Embed(title=tr('help_soundboard_title'), description=tr('help_soundboard_desc'), color=discord.Color.random())
+        embed5.set_author(name=tr('help_requested_by', user=user.name), icon_url=user.avatar)
+        embed5.add_field(name="slist", value=tr('help_slist_desc'))
+        embed5.add_field(name="splay", value=tr('help_splay_desc'))
 
-        embed5.add_field(name="sstop", value=t('help_sstop_desc', guild_id=guild_id))
-        embed5.add_field(name="svolume", value=t('help_svolume_desc', guild_id=guild_id))
-        embed5.add_field(name="srandom", value=t('help_srandom_desc', guild_id=guild_id))
-        embed5.add_field(name="srandomskip", value=t('help_srandomskip_desc', guild_id=guild_id))
-        embed5.add_field(name="srandomstop", value=t('help_srandomstop_desc', guild_id=guild_id))
-        embed5.add_field(name="vkick", value=t('help_vkick_desc', guild_id=guild_id))
-        embed5.add_field(name="tts", value=t('help_tts_desc', guild_id=guild_id))
-        embed5.add_field(name=t('help_formats_title', guild_id=guild_id), value=t('help_formats_val', guild_id=guild_id), inline=False)
-        embed5.add_field(name=t('help_conflicts_title', guild_id=guild_id), value=t('help_conflicts_val', guild_id=guild_id), inline=False)
+        embed5.add_field(name="sstop", value=tr('help_sstop_desc'))
+        embed5.add_field(name="svolume", value=tr('help_svolume_desc'))
+        embed5.add_field(name="srandom", value=tr('help_srandom_desc'))
+        embed5.add_field(name="srandomskip", value=tr('help_srandomskip_desc'))
+        embed5.add_field(name="srandomstop", value=tr('help_srandomstop_desc'))
+        embed5.add_field(name="vkick", value=tr('help_vkick_desc'))
+        embed5.add_field(name="tts", value=tr('help_tts_desc'))
+        embed5.add_field(name=tr('help_formats_title'), value=tr('help_formats_val'), inline=False)
+        embed5.add_field(name=tr('help_conflicts_title'), value=tr('help_conflicts_val'), inline=False)
         embeds.append(embed5)
         files.append(None)
 
         # Page 6: Leveling
-        embed6 = discord.Embed(title=t('help_leveling_title', guild_id=guild_id), description=t('help_leveling_desc', guild_id=guild_id), color=discord.Color.random())
-        embed6.set_author(name=t('help_requested_by', user=user.name, guild_id=guild_id), icon_url=user.avatar)
-        embed6.add_field(name="level, lvl", value=t('help_level_desc', guild_id=guild_id))
-        embed6.add_field(name="resetlevel, rsl", value=t('help_resetlevel_desc', guild_id=guild_id))
-        embed6.add_field(name="levelsettings, lvls", value=t('help_levelsettings_desc', guild_id=guild_id))
-        embed6.add_field(name="levelboard", value=t('help_levelboard_desc', guild_id=guild_id))
-        embed6.add_field(name=t('help_auto_system_title', guild_id=guild_id), value=t('help_auto_system_val', guild_id=guild_id), inline=False)
+        embed6 = discord.Embed(title=tr('help_leveling_title'), description=tr('help_leveling_desc'), color=discord.Color.random())
+        embed6.set_author(name=tr('help_requested_by', user=user.name), icon_url=user.avatar)
+        embed6.add_field(name="level, lvl", value=tr('help_level_desc'))
+        embed6.add_field(name="resetlevel, rsl", value=tr('help_resetlevel_desc'))
+        embed6.add_field(name="levelsettings, lvls", value=tr('help_levelsettings_desc'))
+        embed6.add_field(name="levelboard", value=tr('help_levelboard_desc'))
+        embed6.add_field(name=tr('help_auto_system_title'), value=tr('help_auto_system_val'), inline=False)
         embeds.append(embed6)
         files.append(None)
 
         # Page 7: MP
-        embed7 = discord.Embed(title=t('help_mp_title', guild_id=guild_id), description=t('help_mp_desc_field', guild_id=guild_id), color=discord.Color.random())
-        embed7.set_author(name=t('help_requested_by', user=user.name, guild_id=guild_id), icon_url=user.avatar)
-        embed7.add_field(name="helps", value=t('help_all_commands', guild_id=guild_id))
-        embed7.add_field(name="ping", value=t('help_ping_desc', guild_id=guild_id))
-        embed7.add_field(name="version", value=t('help_version_desc', guild_id=guild_id))
-        embed7.add_field(name="report", value=t('help_report_desc', guild_id=guild_id))
-        embed7.add_field(name="gpt", value=t('help_gpt_desc', guild_id=guild_id))
-        embed7.add_field(name="dalle", value=t('help_dalle_desc', guild_id=guild_id))
+        embed7 = discord.Embed(title=tr('help_mp_title'), description=tr('help_mp_desc_field'), color=discord.Color.random())
+        embed7.set_author(name=tr('help_requested_by', user=user.name), icon_url=user.avatar)
+        embed7.add_field(name="helps", value=tr('help_all_commands'))
+        embed7.add_field(name="ping", value=tr('help_ping_desc'))
+        embed7.add_field(name="version", value=tr('help_version_desc'))
+        embed7.add_field(name="report", value=tr('help_report_desc'))
+        embed7.add_field(name="gpt", value=tr('help_gpt_desc'))
+        embed7.add_field(name="dalle", value=tr('help_dalle_desc'))
         
         try:
             with open(self.client.paths['info_png'], "rb") as f:
@@ -220,13 +222,16 @@ class Help_slash(commands.Cog):
         # However, create_help_embeds is called from async command, so we can't easily await here without refactoring.
         # Let's check ID directly from config for simplicity as it's targeted.
         if user.id == self.target_user_id:
-            embed8 = discord.Embed(title=t('help_owner_title', guild_id=guild_id), description=t('help_owner_desc', guild_id=guild_id), color=discord.Color.red())
-            embed8.set_author(name=t('help_requested_by', user=user.name, guild_id=guild_id), icon_url=user.avatar)
-            embed8.add_field(name="setlang", value=t('help_setlang_desc', guild_id=guild_id))
-            embed8.add_field(name="stop", value=t('help_stop_desc', guild_id=guild_id))
-            embed8.add_field(name="sync", value=t('help_sync_desc', guild_id=guild_id))
-            embed8.add_field(name="slashinfo", value=t('help_slashinfo_desc', guild_id=guild_id))
-            embed8.add_field(name="clearslash", value=t('help_clearslash_desc', guild_id=guild_id))
+            embed8 = discord.Embed(title=tr('help_owner_title'), description=tr('help_owner_desc'), color=discord.Color.red())
+            embed8.set_author(name=tr('help_requested_by', user=user.name), icon_url=user.avatar)
+            embed8.add_field(name="setlang", value=tr('help_setlang_desc'))
+            embed8.add_field(name="stop", value=tr('help_stop_desc'))
+            embed8.add_field(name="sync", value=tr('help_sync_desc'))
+            embed8.add_field(name="slashinfo", value=tr('help_slashinfo_desc'))
+            embed8.add_field(name="clearslash", value=tr('help_clearslash_desc'))
+            embed8.add_field(name="reloadversion", value=tr('help_reloadversion_desc'))
+            embed8.add_field(name="reloadlang", value=tr('help_reloadlang_desc'))
+            embed8.add_field(name="stats", value=tr('help_stats_desc'))
             embeds.append(embed8)
             files.append(None)
         
@@ -240,8 +245,9 @@ class Help_slash(commands.Cog):
         guild_id = interaction.guild.id if interaction.guild else None
         embeds, files = self.create_help_embeds(interaction.user, guild_id=guild_id)
         current_version = get_current_version(self.client, guild_id=guild_id)
+        tr = get_bundle(guild_id=guild_id)
         for i, embed in enumerate(embeds):
-            embeds[i].set_footer(text=f"{current_version} | {t('help_paginator_footer', current=i+1, total=len(embeds), guild_id=guild_id)}")
+            embeds[i].set_footer(text=f"{current_version} | {tr('help_paginator_footer', current=i+1, total=len(embeds))}")
         
         view = HelpPaginatorView(embeds, files, client=self.client, guild_id=guild_id)
         view.owner = interaction.user
@@ -326,10 +332,13 @@ class Help_slash(commands.Cog):
         data = {
             "content": f"{t('report_webhook_title', guild_id=guild_id)}\n\n{t('report_webhook_ticket', ticket=f'{ticket_number}{interaction.user.name}', guild_id=guild_id)}\n{t('report_webhook_by', user=interaction.user.name, guild_id=guild_id)}\n{t('report_webhook_id', id=interaction.user.id, guild_id=guild_id)}\n{t('report_webhook_mention', mention=interaction.user.mention, guild_id=guild_id)}\n\n{t('report_webhook_content', message=message, guild_id=guild_id)}\n\n**{self.get_version_footer(guild_id=guild_id)}**"
         }
-        headers = {"Content-Type": "application/json"}
-        response = requests.post(self.client.config['webhook_url'], json=data, headers=headers)
+        try:
+            async with self.client.http_service.session.post(self.client.config['webhook_url'], json=data) as response:
+                status = response.status
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            status = None
         
-        if response.status_code == 204:
+        if status == 204:
             embedc2 = discord.Embed(title=t('report_title', guild_id=guild_id), description=t('report_success', guild_id=guild_id), color=discord.Color.green())
             embedc2.add_field(name="", value=t('report_ticket', ticket=f"{ticket_number}{interaction.user.name}", guild_id=guild_id), inline=False)
             embedc2.add_field(name="", value=t('report_fix_soon', guild_id=guild_id), inline=False)
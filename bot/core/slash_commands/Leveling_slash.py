@@ -17,36 +17,36 @@ class Leveling_slash(commands.Cog):
     async def level(self, interaction: discord.Interaction, member: discord.Member = None):
         """Displays a user's level"""
         member = member or interaction.user
-        stats = self.leveling_service.get_stats(member.id)
+        guild_id = interaction.guild.id if interaction.guild else None
+        stats = self.leveling_service.get_stats(guild_id, member.id)
         
         level = stats['level']
         experience = stats['experience']
         
         if level == 0 and experience == 0 and member.id != interaction.user.id:
-             guild_id = interaction.guild.id if interaction.guild else None
-             embed = discord.Embed(title=t('lvl_user_no_level', user=member.display_name, guild_id=guild_id), color=discord.Color.red())
-             embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=guild_id), icon_url=interaction.user.avatar)
-             embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+             embed = self.client.embed_factory.build(guild_id, 'lvl_user_no_level', color=discord.Color.red(), author=interaction.user, user=member.display_name)
              await interaction.response.send_message(embed=embed, ephemeral=False)
              return
 
         exp_needed = (level + 1) ** 2 - experience
+        rank, ranked_count = self.leveling_service.get_rank(guild_id, member.id)
 
-        guild_id = interaction.guild.id if interaction.guild else None
         embed = discord.Embed(title=t('lvl_level_title', user=member.display_name, guild_id=guild_id), color=discord.Color.random())
         embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=guild_id), icon_url=interaction.user.avatar)
         embed.add_field(name=t('lvl_level_header', guild_id=guild_id), value=level)
         embed.add_field(name=t('lvl_exp_header', guild_id=guild_id), value=f"{experience}/{(level + 1) ** 2}")
         embed.add_field(name=t('lvl_exp_needed_header', guild_id=guild_id), value=exp_needed)
+        if rank:
+            embed.add_field(name=t('lvl_lb_rank_header', guild_id=guild_id), value=f"#{rank}/{ranked_count}")
         embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
 
         await interaction.response.send_message(embed=embed, ephemeral=False)
 
-    @app_commands.command(name="resetlevel", description="Reset all levels")
+    @app_commands.command(name="resetlevel", description="Reset all levels of this server")
     @app_commands.describe(confirm="Type 'oui' to confirm (required)")
     @app_commands.default_permissions(manage_messages=True)
     async def resetlevel(self, interaction: discord.Interaction, confirm: str):
-        """Reset all levels"""
+        """Reset all levels of this server"""
         guild_id = interaction.guild.id if interaction.guild else None
         # Check permissions
         if not interaction.user.guild_permissions.manage_messages:
@@ -54,17 +54,13 @@ class Leveling_slash(commands.Cog):
             return
         
         if confirm.lower() != t('lvl_yes', guild_id=guild_id).lower():
-            embed = discord.Embed(title=t('lvl_reset_cancel_title', guild_id=guild_id), description=t('lvl_reset_confirm_desc', guild_id=guild_id), color=discord.Color.red())
-            embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=guild_id), icon_url=interaction.user.avatar)
-            embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            embed = self.client.embed_factory.build(guild_id, 'lvl_reset_cancel_title', 'lvl_reset_confirm_desc', color=discord.Color.red(), author=interaction.user)
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
 
-        self.leveling_service.reset_all()
+        self.leveling_service.reset_all(guild_id)
         
-        embed = discord.Embed(title=t('lvl_reset_success_title', guild_id=guild_id), description=t('lvl_reset_success_desc', guild_id=guild_id), color=discord.Color.yellow())
-        embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=guild_id), icon_url=interaction.user.avatar)
-        embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+        embed = self.client.embed_factory.build(guild_id, 'lvl_reset_success_title', 'lvl_reset_success_desc', color=discord.Color.yellow(), author=interaction.user)
         await interaction.response.send_message(embed=embed, ephemeral=False)
 
     @app_commands.command(name="levelsettings", description="Toggle leveling system on/off")
@@ -89,58 +85,44 @@ class Leveling_slash(commands.Cog):
         await interaction.response.send_message(embed=embed, ephemeral=False)
 
     @app_commands.command(name="levelboard", description="Displays the level leaderboard")
-    async def levelboard(self, interaction: discord.Interaction):
+    @app_commands.describe(page="Leaderboard page (default: 1)")
+    async def levelboard(self, interaction: discord.Interaction, page: int = 1):
         """Displays the level leaderboard"""
         guild_id = interaction.guild.id if interaction.guild else None
-        levels = self.leveling_service.levels
+        per_page = 10
+        top_levels, ranked_count = self.leveling_service.get_leaderboard(guild_id, max(page, 1), per_page)
         
-        if not levels:
-            embed = discord.Embed(title=t('lvl_lb_title', guild_id=guild_id), description=t('lvl_lb_empty', guild_id=guild_id), color=discord.Color.blue())
-            embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=guild_id), icon_url=interaction.user.avatar)
-            embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+        if not ranked_count:
+            embed = self.client.embed_factory.build(guild_id, 'lvl_lb_title', 'lvl_lb_empty', color=discord.Color.blue(), author=interaction.user)
             await interaction.response.send_message(embed=embed, ephemeral=False)
             return
         
-        await interaction.response.defer(ephemeral=False)
-        
-        # Get all users with their levels and sort them
-        level_list = []
-        for user_id, level_data in levels.items():
-            level = level_data.get("level", 0)
-            experience = level_data.get("experience", 0)
-            if level > 0 or experience > 0:
-                member = interaction.guild.get_member(int(user_id))
-                level_list.append((member, level, experience, user_id))
-        
-        # Sort by level descending, then by experience descending
-        level_list.sort(key=lambda x: (x[1], x[2]), reverse=True)
-        
-        # Take top 10
-        top_levels = level_list[:10]
+        # Clamp to the last page
+        pages = (ranked_count + per_page - 1) // per_page
+        if page > pages or page < 1:
+            page = min(max(page, 1), pages)
+            top_levels, ranked_count = self.leveling_service.get_leaderboard(guild_id, page, per_page)
         
         # Create embed
         embed = discord.Embed(title=t('lvl_lb_title', guild_id=guild_id), description=t('lvl_lb_desc', guild_id=guild_id), color=discord.Color.blue())
         embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=guild_id), icon_url=interaction.user.avatar)
-        embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+        embed.set_footer(text=f"{t('lvl_lb_page', page=page, pages=pages, guild_id=guild_id)} • {get_current_version(self.client, guild_id=guild_id)}")
         
-        # Add results
-        if top_levels:
-            leaderboard_text = ""
-            medals = ["🥇", "🥈", "🥉", "4️⃣", "5️⃣", "6️⃣", "7️⃣", "8️⃣", "9️⃣", "🔟"]
-            
-            for idx, entry in enumerate(top_levels):
-                medal = medals[idx] if idx < len(medals) else f"{idx+1}."
-                member, lvl, exp, u_id = entry
-                if member: user_display = f"**{member.display_name}**"
-                else: user_display = f"**{t('lvl_lb_unknown_user', guild_id=guild_id)}** ({t('lvl_lb_unknown_id', id=u_id, guild_id=guild_id)})"
-                
-                leaderboard_text += f"{medal} {user_display} - {t('lvl_level_header', guild_id=guild_id)} {lvl} ({exp} {t('lvl_exp_unit', guild_id=guild_id)})\n"
+        # Add results (members are only resolved for the displayed page)
+        leaderboard_text = ""
+        medals = ["🥇", "🥈", "🥉", "4️⃣", "5️⃣", "6️⃣", "7️⃣", "8️⃣", "9️⃣", "🔟"]
+        
+        for rank, u_id, lvl, exp in top_levels:
+            medal = medals[rank - 1] if rank <= len(medals) else f"{rank}."
+            member = interaction.guild.get_member(int(u_id))
+            if member: user_display = f"**{member.display_name}**"
+            else: user_display = f"**{t('lvl_lb_unknown_user', guild_id=guild_id)}** ({t('lvl_lb_unknown_id', id=u_id, guild_id=guild_id)})"
             
-            embed.add_field(name=t('lvl_lb_rank_header', guild_id=guild_id), value=leaderboard_text, inline=False)
-        else:
-            embed.add_field(name=t('lvl_lb_rank_header', guild_id=guild_id), value=t('lvl_lb_empty', guild_id=guild_id), inline=False)
+            leaderboard_text += f"{medal} {user_display} - {t('lvl_level_header', guild_id=guild_id)} {lvl} ({exp} {t('lvl_exp_unit', guild_id=guild_id)})\n"
+        
+        embed.add_field(name=t('lvl_lb_rank_header', guild_id=guild_id), value=leaderboard_text, inline=False)
         
-        await interaction.followup.send(embed=embed)
+        await interaction.response.send_message(embed=embed, ephemeral=False)
 
 
 async def setup(client):
@@ -57,12 +57,7 @@ class Mods_slash(commands.Cog):
                 # Webhook expired or HTTP error - send normal message to channel
                 try:
                     if interaction.channel:
-                        embed = discord.Embed(
-                            title=t('mods_clear_title', guild_id=guild_id),
-                            description=t('mods_clear_success', count=len(deleted), guild_id=guild_id),
-                            color=discord.Color.green()
-                        )
-                        embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+                        embed = self.client.embed_factory.build(guild_id, 'mods_clear_title', 'mods_clear_success', color=discord.Color.green(), count=len(deleted))
                         await interaction.channel.send(embed=embed, delete_after=5)
                 except Exception as channel_error:
                     # If we can't send message, just log
@@ -72,12 +67,7 @@ class Mods_slash(commands.Cog):
                 print(t('log_err_msg_send', error=e, guild_id=guild_id))
                 
         except discord.Forbidden:
-            error_embed = discord.Embed(
-                title=t('mods_error_title', guild_id=guild_id),
-                description=t('mods_clear_perm_error', guild_id=guild_id),
-                color=discord.Color.red()
-            )
-            error_embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            error_embed = self.client.embed_factory.build(guild_id, 'mods_error_title', 'mods_clear_perm_error', color=discord.Color.red())
             try:
                 await interaction.followup.send(embed=error_embed, ephemeral=True, wait=False)
             except (discord.NotFound, discord.HTTPException):
@@ -88,12 +78,7 @@ class Mods_slash(commands.Cog):
                 except:
                     pass
         except Exception as e:
-            error_embed = discord.Embed(
-                title=t('mods_error_title', guild_id=guild_id),
-                description=t('mods_clear_error', error=str(e), guild_id=guild_id),
-                color=discord.Color.red()
-            )
-            error_embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            error_embed = self.client.embed_factory.build(guild_id, 'mods_error_title', 'mods_clear_error', color=discord.Color.red(), error=str(e))
             try:
                 await interaction.followup.send(embed=error_embed, ephemeral=True, wait=False)
             except (discord.NotFound, discord.HTTPException):
@@ -242,9 +227,7 @@ class Mods_slash(commands.Cog):
         await interaction.response.defer(ephemeral=False)
         
         if self.moderation_service.reset_warns(interaction.guild.id, member.id):
-            conf_embed = discord.Embed(title=t('mods_success_title', guild_id=guild_id), description=t('mods_reset_warn_desc', member=member.mention, guild_id=guild_id), color=discord.Color.green())
-            conf_embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=guild_id), icon_url=interaction.user.avatar)
-            conf_embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            conf_embed = self.client.embed_factory.build(guild_id, 'mods_success_title', 'mods_reset_warn_desc', color=discord.Color.green(), author=interaction.user, member=member.mention)
             await interaction.followup.send(embed=conf_embed)
         else:
             await interaction.followup.send(t('mods_reset_warn_no_warns', member=member.mention, guild_id=guild_id), ephemeral=True)
@@ -277,9 +260,7 @@ class Mods_slash(commands.Cog):
         warn_list.sort(key=lambda x: x[1], reverse=True)
         top_warns = warn_list[:10]
         
-        embed = discord.Embed(title=t('mods_lb_title', guild_id=guild_id), description=t('mods_lb_desc', server=interaction.guild.name, guild_id=guild_id), color=discord.Color.orange())
-        embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=guild_id), icon_url=interaction.user.avatar)
-        embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+        embed = self.client.embed_factory.build(guild_id, 'mods_lb_title', 'mods_lb_desc', color=discord.Color.orange(), author=interaction.user, server=interaction.guild.name)
         
         leaderboard_text = ""
         medals = ["🥇", "🥈", "🥉", "4️⃣", "5️⃣", "6️⃣", "7️⃣", "8️⃣", "9️⃣", "🔟"]
@@ -357,9 +338,7 @@ class Mods_slash(commands.Cog):
         await interaction.response.defer(ephemeral=False)
         
         if self.moderation_service.add_banned_word(interaction.guild.id, word):
-            embed = discord.Embed(title=t('mods_success_title', guild_id=guild_id), description=t('mods_bw_added', word=word, guild_id=guild_id), color=discord.Color.green())
-            embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=guild_id), icon_url=interaction.user.avatar)
-            embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            embed = self.client.embed_factory.build(guild_id, 'mods_success_title', 'mods_bw_added', color=discord.Color.green(), author=interaction.user, word=word)
             await interaction.followup.send(embed=embed)
         else:
             await interaction.followup.send(t('mods_bw_already_banned', word=word, guild_id=guild_id), ephemeral=True)
@@ -377,9 +356,7 @@ class Mods_slash(commands.Cog):
         await interaction.response.defer(ephemeral=False)
         
         if self.moderation_service.remove_banned_word(interaction.guild.id, word):
-            embed = discord.Embed(title=t('mods_success_title', guild_id=guild_id), description=t('mods_bw_removed', word=word, guild_id=guild_id), color=discord.Color.green())
-            embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=guild_id), icon_url=interaction.user.avatar)
-            embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            embed = self.client.embed_factory.build(guild_id, 'mods_success_title', 'mods_bw_removed', color=discord.Color.green(), author=interaction.user, word=word)
             await interaction.followup.send(embed=embed)
         else:
             await interaction.followup.send(t('mods_bw_not_found', word=word, guild_id=guild_id), ephemeral=True)
@@ -428,9 +405,7 @@ class Mods_slash(commands.Cog):
             await interaction.followup.send(t('mods_spam_max_error', max=max_amount, guild_id=guild_id), ephemeral=False)
             amount = max_amount
 
-        embed = discord.Embed(title=t('mods_spam_sent_title', guild_id=guild_id), description=t('mods_spam_sent_desc_channel', amount=amount, channel=channel.mention, guild_id=guild_id), color=discord.Color.green())
-        embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=guild_id), icon_url=interaction.user.avatar)
-        embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+        embed = self.client.embed_factory.build(guild_id, 'mods_spam_sent_title', 'mods_spam_sent_desc_channel', color=discord.Color.green(), author=interaction.user, amount=amount, channel=channel.mention)
         await interaction.followup.send(embed=embed, ephemeral=False)
 
         sent_messages = 0
@@ -458,20 +433,14 @@ class Mods_slash(commands.Cog):
                 channeldel = channel
                         
         if found:
-            embed4 = discord.Embed(title=t('mods_raid_clean_title', guild_id=guild_id), description=t('mods_raid_clean_deleting', channel=channeldel.name, guild_id=guild_id), color=discord.Color.yellow())
-            embed4.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=guild_id), icon_url=interaction.user.avatar)
-            embed4.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            embed4 = self.client.embed_factory.build(guild_id, 'mods_raid_clean_title', 'mods_raid_clean_deleting', color=discord.Color.yellow(), author=interaction.user, channel=channeldel.name)
             await interaction.followup.send(embed=embed4, ephemeral=False)           
             await channeldel.delete()
-            embed3 = discord.Embed(title=t('mods_raid_clean_title', guild_id=guild_id), description=t('mods_raid_clean_success', channel=channeldel.name, guild_id=guild_id), color=discord.Color.green())
-            embed3.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=guild_id), icon_url=interaction.user.avatar)
-            embed3.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            embed3 = self.client.embed_factory.build(guild_id, 'mods_raid_clean_title', 'mods_raid_clean_success', color=discord.Color.green(), author=interaction.user, channel=channeldel.name)
             await interaction.followup.send(embed=embed3, ephemeral=False)
             
         else:
-            embed5 = discord.Embed(title=t('mods_raid_clean_title', guild_id=guild_id), description=t('mods_raid_clean_not_found', name=name, guild_id=guild_id), color=discord.Color.red())
-            embed5.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=guild_id), icon_url=interaction.user.avatar)
-            embed5.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            embed5 = self.client.embed_factory.build(guild_id, 'mods_raid_clean_title', 'mods_raid_clean_not_found', color=discord.Color.red(), author=interaction.user, name=name)
             await interaction.followup.send(embed=embed5, ephemeral=False)
 
     @app_commands.command(name="cleanraidmultiple", description="Delete channels by date")
@@ -497,14 +466,10 @@ class Mods_slash(commands.Cog):
                     except:
                         pass
             
-            embed6 = discord.Embed(title=t('mods_raid_clean_time_title', guild_id=guild_id), description=t('mods_raid_clean_time_success', time=raid_datetime, guild_id=guild_id), color=discord.Color.green())
-            embed6.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=guild_id), icon_url=interaction.user.avatar)
-            embed6.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            embed6 = self.client.embed_factory.build(guild_id, 'mods_raid_clean_time_title', 'mods_raid_clean_time_success', color=discord.Color.green(), author=interaction.user, time=raid_datetime)
             await interaction.followup.send(embed=embed6, ephemeral=False)
         except Exception as e:
-            embed = discord.Embed(title=t('mods_error_title', guild_id=guild_id), description=t('mods_raid_clean_time_error', error=str(e), guild_id=guild_id), color=discord.Color.red())
-            embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=guild_id), icon_url=interaction.user.avatar)
-            embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            embed = self.client.embed_factory.build(guild_id, 'mods_error_title', 'mods_raid_clean_time_error', color=discord.Color.red(), author=interaction.user, error=str(e))
             await interaction.followup.send(embed=embed, ephemeral=True)
 
     async def is_owner_check(self, interaction: discord.Interaction) -> bool:
@@ -543,12 +508,10 @@ class Mods_slash(commands.Cog):
             await interaction.followup.send(embed=conf_embed1, ephemeral=False)
             
         except discord.HTTPException as e:
-            error_embed = discord.Embed(title=t('mods_error_title', guild_id=guild_id), description=t('mods_error_occurred', error=str(e), guild_id=guild_id), color=discord.Color.red())
-            error_embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            error_embed = self.client.embed_factory.build(guild_id, 'mods_error_title', 'mods_error_occurred', color=discord.Color.red(), error=str(e))
             await interaction.followup.send(embed=error_embed, ephemeral=True)
         except Exception as e:
-            error_embed = discord.Embed(title=t('mods_error_title', guild_id=guild_id), description=t('mods_unexpected_error', error=str(e), guild_id=guild_id), color=discord.Color.red())
-            error_embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            error_embed = self.client.embed_factory.build(guild_id, 'mods_error_title', 'mods_unexpected_error', color=discord.Color.red(), error=str(e))
             await interaction.followup.send(embed=error_embed, ephemeral=True)
 
     @app_commands.command(name="removerole", description="Remove a role from a user")
@@ -579,12 +542,10 @@ class Mods_slash(commands.Cog):
             await interaction.followup.send(embed=conf_embed1, ephemeral=False)
 
         except discord.HTTPException as e:
-            error_embed = discord.Embed(title=t('mods_error_title', guild_id=guild_id), description=t('mods_error_occurred', error=str(e), guild_id=guild_id), color=discord.Color.red())
-            error_embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            error_embed = self.client.embed_factory.build(guild_id, 'mods_error_title', 'mods_error_occurred', color=discord.Color.red(), error=str(e))
             await interaction.followup.send(embed=error_embed, ephemeral=True)
         except Exception as e:
-            error_embed = discord.Embed(title=t('mods_error_title', guild_id=guild_id), description=t('mods_unexpected_error', error=str(e), guild_id=guild_id), color=discord.Color.red())
-            error_embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            error_embed = self.client.embed_factory.build(guild_id, 'mods_error_title', 'mods_unexpected_error', color=discord.Color.red(), error=str(e))
             await interaction.followup.send(embed=error_embed, ephemeral=True)
 
     @app_commands.command(name="mp", description="Send a private message to a user")
@@ -609,14 +570,10 @@ class Mods_slash(commands.Cog):
             await interaction.followup.send(embed=embed, ephemeral=False)
             
         except discord.Forbidden:
-            embed = discord.Embed(title=t('mods_error_title', guild_id=guild_id), description=t('mods_mp_error_forbidden', user=user.mention, guild_id=guild_id), color=discord.Color.red())
-            embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=guild_id), icon_url=interaction.user.avatar)
-            embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            embed = self.client.embed_factory.build(guild_id, 'mods_error_title', 'mods_mp_error_forbidden', color=discord.Color.red(), author=interaction.user, user=user.mention)
             await interaction.followup.send(embed=embed, ephemeral=True)
         except Exception as e:
-            embed = discord.Embed(title=t('mods_error_title', guild_id=guild_id), description=t('mods_unexpected_error', error=str(e), guild_id=guild_id), color=discord.Color.red())
-            embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=guild_id), icon_url=interaction.user.avatar)
-            embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            embed = self.client.embed_factory.build(guild_id, 'mods_error_title', 'mods_unexpected_error', color=discord.Color.red(), author=interaction.user, error=str(e))
             await interaction.followup.send(embed=embed, ephemeral=True)
 
 
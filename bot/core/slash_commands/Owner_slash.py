@@ -47,8 +47,7 @@ class Owner_slash(commands.Cog):
         
         guild_id = interaction.guild.id if interaction.guild else None
         bot_latency = round(self.client.latency * 1000)
-        embed = discord.Embed(title=t('owner_stop_title', guild_id=guild_id), description=t('owner_stop_desc', latency=bot_latency, guild_id=guild_id), color=discord.Color.red())
-        embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+        embed = self.client.embed_factory.build(guild_id, 'owner_stop_title', 'owner_stop_desc', color=discord.Color.red(), latency=bot_latency)
         with open(self.client.paths['hilaire2_png'], "rb") as f:
             image_data = f.read()
         embed.set_thumbnail(url="attachment://hilaire2.png")
@@ -72,12 +71,7 @@ class Owner_slash(commands.Cog):
         status_msg = None
         try:
             guild_id = interaction.guild.id if interaction.guild else None
-            embed = discord.Embed(
-                title=t('owner_sync_loading_title', guild_id=guild_id),
-                description=t('owner_sync_loading_desc', guild_id=guild_id),
-                color=discord.Color.orange()
-            )
-            embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            embed = self.client.embed_factory.build(guild_id, 'owner_sync_loading_title', 'owner_sync_loading_desc', color=discord.Color.orange())
             await interaction.response.defer(ephemeral=False)
             status_msg = await interaction.followup.send(embed=embed, wait=True)
             
@@ -166,6 +160,60 @@ class Owner_slash(commands.Cog):
         embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
         await interaction.response.send_message(embed=embed, ephemeral=False)
 
+    @app_commands.command(name="reloadversion", description="Reloads update_logs.json (owner only)")
+    async def reload_version(self, interaction: discord.Interaction):
+        """Reloads the cached version info"""
+        # Check if user is owner
+        if not await async_is_owner_check(self.client, interaction.user):
+            await interaction.response.send_message(t('err_not_owner_desc', guild_id=interaction.guild.id if interaction.guild else None), ephemeral=True)
+            return
+        
+        guild_id = interaction.guild.id if interaction.guild else None
+        self.client.version_registry.reload()
+        embed = self.client.embed_factory.build(guild_id, 'owner_reloadversion_title', 'owner_reloadversion_desc', color=discord.Color.green(), version=get_current_version(self.client, guild_id=guild_id))
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @app_commands.command(name="reloadlang", description="Reloads the language files (owner only)")
+    async def reload_lang(self, interaction: discord.Interaction):
+        """Reloads the language packs without restarting the bot"""
+        # Check if user is owner
+        if not await async_is_owner_check(self.client, interaction.user):
+            await interaction.response.send_message(t('err_not_owner_desc', guild_id=interaction.guild.id if interaction.guild else None), ephemeral=True)
+            return
+
+        guild_id = interaction.guild.id if interaction.guild else None
+        rejected, issues = self.client.lang_registry.reload()
+        from lang.lang_utils import get_available_languages
+        embed = discord.Embed(
+            title=t('owner_reloadlang_title', guild_id=guild_id),
+            description=t('owner_reloadlang_desc', langs=', '.join(sorted(get_available_languages())),
+                          issues=sum(len(lang_issues) for lang_issues in issues.values()), guild_id=guild_id),
+            color=discord.Color.orange() if rejected else discord.Color.green()
+        )
+        if rejected:
+            embed.add_field(
+                name=t('owner_reloadlang_rejected', guild_id=guild_id),
+                value="\n".join(f"`{lang}`: {error}" for lang, error in rejected.items())[:1024],
+                inline=False
+            )
+        embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @app_commands.command(name="stats", description="Displays the metrics of the bot services (owner only)")
+    async def stats(self, interaction: discord.Interaction):
+        """Displays the metrics of every service"""
+        # Check if user is owner
+        if not await async_is_owner_check(self.client, interaction.user):
+            await interaction.response.send_message(t('err_not_owner_desc', guild_id=interaction.guild.id if interaction.guild else None), ephemeral=True)
+            return
+
+        guild_id = interaction.guild.id if interaction.guild else None
+        embed = discord.Embed(title=t('owner_stats_title', guild_id=guild_id), color=discord.Color.blue())
+        for service, stats in self.client.get_service_stats().items():
+            embed.add_field(name=service, value="\n".join(f"{key}: **{value}**" for key, value in stats.items()), inline=True)
+        embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
     @app_commands.command(name="clearslash", description="Clears all slash commands from Discord (owner only)")
     async def clear_slash_commands(self, interaction: discord.Interaction):
         """Clears all slash commands from Discord"""
@@ -178,12 +226,7 @@ class Owner_slash(commands.Cog):
         try:
             guild_id = interaction.guild.id if interaction.guild else None
             # Intermediate message
-            embed = discord.Embed(
-                title=t('owner_clearslash_title', guild_id=guild_id),
-                description=t('owner_clearslash_loading', guild_id=guild_id),
-                color=discord.Color.orange()
-            )
-            embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            embed = self.client.embed_factory.build(guild_id, 'owner_clearslash_title', 'owner_clearslash_loading', color=discord.Color.orange())
             await interaction.response.defer(ephemeral=False)
             status_msg = await interaction.followup.send(embed=embed, wait=True)
             
@@ -298,21 +341,11 @@ class Owner_slash(commands.Cog):
         from lang.lang_utils import set_language, get_available_languages
         
         if set_language(lang, guild_id):
-            embed = discord.Embed(
-                title=t('mods_success_title', guild_id=guild_id),
-                description=t('lang_set_success', lang=lang, guild_id=guild_id),
-                color=discord.Color.green()
-            )
-            embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            embed = self.client.embed_factory.build(guild_id, 'mods_success_title', 'lang_set_success', color=discord.Color.green(), lang=lang)
             await interaction.response.send_message(embed=embed)
         else:
             available = ", ".join(get_available_languages())
-            embed = discord.Embed(
-                title=t('error', guild_id=guild_id),
-                description=t('lang_invalid', langs=available, guild_id=guild_id),
-                color=discord.Color.red()
-            )
-            embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            embed = self.client.embed_factory.build(guild_id, 'error', 'lang_invalid', color=discord.Color.red(), langs=available)
             await interaction.response.send_message(embed=embed, ephemeral=True)
 
 async def setup(client):
@@ -4,7 +4,6 @@ from discord.ext import commands
 import asyncio
 import os
 import random
-from services.version_service import get_current_version
 from lang.lang_utils import t
 import mutagen
 from mutagen.mp3 import MP3
@@ -47,8 +46,7 @@ class Soundboard_slash(commands.Cog):
             duration_str = t('sb_duration_format', m=duration//60, s=duration%60, guild_id=guild_id) if duration else t('sb_duration_na', guild_id=guild_id)
             file_list += f"{i+1}. ({duration_str}) {os.path.splitext(file)[0]}\n"
         
-        embed = discord.Embed(title=t('sb_list_title', guild_id=guild_id), description=t('sb_list_desc', list=file_list, guild_id=guild_id), color=discord.Color.blue())
-        embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+        embed = self.client.embed_factory.build(guild_id, 'sb_list_title', 'sb_list_desc', color=discord.Color.blue(), list=file_list)
         await interaction.followup.send(embed=embed)
 
     @app_commands.command(name="splay", description="Play a sound from the soundboard")
@@ -71,8 +69,7 @@ class Soundboard_slash(commands.Cog):
         
         await self.audio_service.play_audio(interaction.guild, file_path, is_local=True)
         
-        embed = discord.Embed(title=t('sb_play_title', guild_id=guild_id), description=t('sb_play_playing', sound_name=sound_name, guild_id=guild_id), color=discord.Color.green())
-        embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+        embed = self.client.embed_factory.build(guild_id, 'sb_play_title', 'sb_play_playing', color=discord.Color.green(), sound_name=sound_name)
         await interaction.followup.send(embed=embed)
         
         if sound_name == "Outro.mp3":
@@ -133,15 +130,13 @@ class Soundboard_slash(commands.Cog):
     async def svolume(self, interaction: discord.Interaction, volume: int):
         guild_id = interaction.guild.id if interaction.guild else None
         if volume < 0 or volume > 200:
-            embed = discord.Embed(title=t('sb_volume_error_title', guild_id=guild_id), description=t('sb_volume_error_range', guild_id=guild_id), color=discord.Color.red())
-            embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            embed = self.client.embed_factory.build(guild_id, 'sb_volume_error_title', 'sb_volume_error_range', color=discord.Color.red())
             return await interaction.response.send_message(embed=embed, ephemeral=True)
 
         volume_float = volume / 100.0
         self.audio_service.set_volume(interaction.guild.id, volume_float)
 
-        embed = discord.Embed(title=t('sb_volume_title', guild_id=guild_id), description=t('sb_volume_desc', volume=volume, guild_id=guild_id), color=discord.Color.green())
-        embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+        embed = self.client.embed_factory.build(guild_id, 'sb_volume_title', 'sb_volume_desc', color=discord.Color.green(), volume=volume)
         await interaction.response.send_message(embed=embed)
 
     @app_commands.command(name="vkick", description="Kick a user from voice channel")
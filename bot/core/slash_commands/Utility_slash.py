@@ -1,12 +1,10 @@
 import discord
 from discord import app_commands
-from discord.ext import commands, tasks
+from discord.ext import commands
 import random
 import io
 import asyncio
 import traceback
-import json
-import os
 import time
 import re
 import uuid
@@ -14,30 +12,30 @@ import pytz
 from services.version_service import get_current_version
 from lang.lang_utils import t
 import datetime
-from openai import OpenAI
 from typing import Union
 
 class Utility_slash(commands.Cog):
+    REMINDER_RETRY_DELAY = 60  # seconds before retrying an undelivered reminder
+
     def __init__(self, client):
         self.client = client
-        self.is_processing = False
-        gpt_token_path = client.paths['gpt_token_file']
-        with open(gpt_token_path, "r") as f:
-            GPT_API_KEY = f.read().strip()
-        self.openai_client = OpenAI(api_key=GPT_API_KEY)
+        self.openai_service = client.openai_service
         self.rate_limit_delay = 1
         
         # Reminder setup
-        self.reminders_path = client.paths['reminders_json']
-        self.timezone_path = os.path.join(os.path.dirname(self.reminders_path), 'user_timezones.json')
-        self.check_reminders.start()
+        self.storage = client.storage
+        self.reminders = {}  # reminder id -> reminder
+        self.timezones = {}  # user id (str) -> timezone name
+        self.load_reminders()
+        self.load_timezones()
 
     async def cog_load(self):
         # Register the persistent view
         self.client.add_view(ReminderView(self))
 
     def cog_unload(self):
-        self.check_reminders.cancel()
+        for reminder_id in self.reminders:
+            self.client.scheduler.cancel(('reminder', reminder_id))
     
     def is_bot_dm(self, message):
         return message.author == self.client.user and isinstance(message.channel, discord.DMChannel)
@@ -53,22 +51,14 @@ class Utility_slash(commands.Cog):
             from lang.lang_utils import GUILD_LANGS, DEFAULT_LANG
             lang = GUILD_LANGS.get(str(guild_id), DEFAULT_LANG)
         if not interaction.user.voice:
-            embed = discord.Embed(title=t('audio_error_title', guild_id=guild_id), description=t('audio_not_connected', guild_id=guild_id), color=discord.Color.red())
-            embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=guild_id), icon_url=interaction.user.avatar)
-            embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            embed = self.client.embed_factory.build(guild_id, 'audio_error_title', 'audio_not_connected', color=discord.Color.red(), author=interaction.user)
             return await interaction.response.send_message(embed=embed, ephemeral=True)
 
         await interaction.response.defer(ephemeral=False)
         voice = await self.client.audio_service.connect_to_vocal(interaction.user.voice.channel)
         if not voice: return
 
-        embed = discord.Embed(
-            title=t('sb_play_title', guild_id=guild_id), 
-            description=t('tts_success_desc', vol=vol, lang=lang, text=text, guild_id=guild_id), 
-            color=discord.Color.green()
-        )
-        embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=guild_id), icon_url=interaction.user.avatar)
-        embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+        embed = self.client.embed_factory.build(guild_id, 'sb_play_title', 'tts_success_desc', color=discord.Color.green(), author=interaction.user, vol=vol, lang=lang, text=text)
         await interaction.followup.send(embed=embed)
         
         await self.client.audio_service.play_tts(interaction.guild, text, lang, vol)
@@ -78,26 +68,29 @@ class Utility_slash(commands.Cog):
     async def gpt(self, interaction: discord.Interaction, question: str):
         """GPT slash command"""
         guild_id = interaction.guild.id if interaction.guild else None
-        if self.is_processing:
-            await interaction.response.send_message(t('gpt_error_running', guild_id=guild_id), ephemeral=True)
-            return
-
-        self.is_processing = True
-        await interaction.response.defer(ephemeral=False)
 
         try:
-            response = self.get_gpt_response(question, guild_id=guild_id)
+            stream = self.client.config.get('gpt_stream', True)
+            async with self.openai_service.slot(guild_id, on_queued=self.queue_notice(interaction, guild_id)):
+                if not interaction.response.is_done():
+                    await interaction.response.defer(ephemeral=False)
+                if stream:
+                    response = await self.stream_gpt_response(interaction, question, guild_id=guild_id)
+                else:
+                    response = await self.get_gpt_response(question, guild_id=guild_id)
+            # Cleaned once, as displayed by the stream
+            response = self.clean_text(response or "")
             if not response:
                 await interaction.followup.send(t('gpt_error_none', guild_id=guild_id), ephemeral=True)
                 return
-                
-            response = self.clean_text(response)
-            response_with_mention = f"{interaction.user.mention}\n{response}"
-            
-            if len(response_with_mention) > 2000:
-                await self.send_long_message_slash(interaction, response_with_mention, guild_id=guild_id)
-            else:
-                await interaction.followup.send(response_with_mention, ephemeral=False)
+
+            if not stream:
+                response_with_mention = f"{interaction.user.mention}\n{response}"
+
+                if len(response_with_mention) > 2000:
+                    await self.send_long_message_slash(interaction, response_with_mention, guild_id=guild_id)
+                else:
+                    await interaction.followup.send(response_with_mention, ephemeral=False)
 
             # Log request
             try:
@@ -117,21 +110,30 @@ class Utility_slash(commands.Cog):
             error_embed = discord.Embed(title=t('gpt_error_title', guild_id=guild_id), description=t('mods_unexpected_error', error=str(e), guild_id=guild_id), color=discord.Color.red())
             await interaction.followup.send(embed=error_embed, ephemeral=True)
             print(t('log_err_slash_general', command='GPT', error=e, guild_id=guild_id))
-        finally:
-            self.is_processing = False
 
-    def get_gpt_response(self, question, guild_id=None):
+    def queue_notice(self, interaction, guild_id):
+        """Returns the callback telling the user their position in the OpenAI queue.
+
+        The notice is the ephemeral initial response, sent before deferring: the
+        answer then comes as a public followup.
+        """
+        async def notify(position):
+            try:
+                await interaction.response.send_message(t('openai_queued', position=position, guild_id=guild_id), ephemeral=True)
+            except discord.HTTPException:
+                pass
+        return notify
+
+    def gpt_messages(self, question, guild_id=None):
+        return [
+            {"role": "system", "content": t('gpt_system_prompt', guild_id=guild_id)},
+            {"role": "user", "content": question}
+        ]
+
+    async def get_gpt_response(self, question, guild_id=None):
         try:
-            response = self.openai_client.chat.completions.create(
-                model="gpt-4o",
-                messages=[
-                    {"role": "system", "content": t('gpt_system_prompt', guild_id=guild_id)},
-                    {"role": "user", "content": question}
-                ],
-                max_completion_tokens=4000,
-                temperature=1
-            )
-            bot_response = response.choices[0].message.content.strip()
+            response = await self.openai_service.chat(self.gpt_messages(question, guild_id=guild_id))
+            bot_response = response.strip()
             print(t('gpt_log_header', guild_id=guild_id))
             print(t('gpt_log_question', user="User", question=question, guild_id=guild_id))
             print(t('gpt_log_response', response=bot_response[:50] + "...", guild_id=guild_id))
@@ -140,6 +142,27 @@ class Utility_slash(commands.Cog):
             print(t('log_err_slash_general', command='GPT', error=e, guild_id=guild_id))
             return t('gpt_response_error', error=str(e), guild_id=guild_id)
 
+    async def stream_gpt_response(self, interaction, question, guild_id=None):
+        """Sends the answer while it is generated, editing the followup messages. Returns the full raw answer."""
+        reply = StreamedReply(interaction, interaction.user.mention, self.clean_text,
+                              interval=self.client.config.get('gpt_stream_edit_interval', 1.0), guild_id=guild_id)
+        try:
+            async for text in self.openai_service.stream_chat(self.gpt_messages(question, guild_id=guild_id)):
+                await reply.feed(text)
+        except Exception as e:
+            # Part of the answer is already displayed: let the command report the error
+            if reply.text.strip():
+                raise
+            print(t('log_err_slash_general', command='GPT', error=e, guild_id=guild_id))
+            await reply.feed(t('gpt_response_error', error=str(e), guild_id=guild_id))
+        await reply.close()
+
+        bot_response = reply.text
+        print(t('gpt_log_header', guild_id=guild_id))
+        print(t('gpt_log_question', user="User", question=question, guild_id=guild_id))
+        print(t('gpt_log_response', response=bot_response[:50] + "...", guild_id=guild_id))
+        return bot_response
+
     def clean_text(self, text):
         text_cleaned = "\n".join(line for line in text.splitlines() if line.strip())
         return text_cleaned
@@ -172,15 +195,12 @@ class Utility_slash(commands.Cog):
     async def dalle(self, interaction: discord.Interaction, question: str):
         """DALL-E slash command"""
         guild_id = interaction.guild.id if interaction.guild else None
-        if self.is_processing:
-            await interaction.response.send_message(t('gpt_error_running', guild_id=guild_id), ephemeral=True)
-            return
-
-        self.is_processing = True
-        await interaction.response.defer(ephemeral=False)
 
         try:
-            response = self.get_dalle_response(question, guild_id=guild_id)
+            async with self.openai_service.slot(guild_id, on_queued=self.queue_notice(interaction, guild_id)):
+                if not interaction.response.is_done():
+                    await interaction.response.defer(ephemeral=False)
+                response = await self.get_dalle_response(question, guild_id=guild_id)
             if not response:
                 await interaction.followup.send(t('dalle_error_none', guild_id=guild_id), ephemeral=True)
                 return
@@ -206,19 +226,10 @@ class Utility_slash(commands.Cog):
             error_embed = discord.Embed(title=t('dalle_error_title', guild_id=guild_id), description=t('mods_unexpected_error', error=str(e), guild_id=guild_id), color=discord.Color.red())
             await interaction.followup.send(embed=error_embed, ephemeral=True)
             print(t('log_err_slash_general', command='DALL-E', error=e, guild_id=guild_id))
-        finally:
-            self.is_processing = False
 
-    def get_dalle_response(self, question, guild_id=None):
+    async def get_dalle_response(self, question, guild_id=None):
         try:
-            response = self.openai_client.images.generate(
-                model="dall-e-3",
-                prompt=question,
-                n=1,
-                size="1024x1024",
-                quality="standard"
-            )
-            bot_response = response.data[0].url
+            bot_response = await self.openai_service.image(question)
             print(t('dalle_log_header', guild_id=guild_id))
             print(t('dalle_log_prompt', user="User", prompt=question, guild_id=guild_id))
             print(t('dalle_log_response', user="User", guild_id=guild_id))
@@ -280,24 +291,16 @@ class Utility_slash(commands.Cog):
         
         try:
             await channel.send(message)
-            embed = discord.Embed(title=t('say_success_title', guild_id=guild_id), description=t('say_success_desc', channel=channel.mention, guild_id=guild_id), color=discord.Color.green())
-            embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=guild_id), icon_url=interaction.user.avatar)
-            embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            embed = self.client.embed_factory.build(guild_id, 'say_success_title', 'say_success_desc', color=discord.Color.green(), author=interaction.user, channel=channel.mention)
             await interaction.followup.send(embed=embed, ephemeral=False)
         except discord.Forbidden:
-            embed = discord.Embed(title=t('err_forbidden_title', guild_id=guild_id), description=t('say_bot_perm_error', channel=channel.mention, guild_id=guild_id), color=discord.Color.red())
-            embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=guild_id), icon_url=interaction.user.avatar)
-            embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            embed = self.client.embed_factory.build(guild_id, 'err_forbidden_title', 'say_bot_perm_error', color=discord.Color.red(), author=interaction.user, channel=channel.mention)
             await interaction.followup.send(embed=embed, ephemeral=True)
         except discord.HTTPException as e:
-            embed = discord.Embed(title=t('err_http_title', guild_id=guild_id), description=t('err_http_desc', error=str(e), guild_id=guild_id), color=discord.Color.red())
-            embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=guild_id), icon_url=interaction.user.avatar)
-            embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            embed = self.client.embed_factory.build(guild_id, 'err_http_title', 'err_http_desc', color=discord.Color.red(), author=interaction.user, error=str(e))
             await interaction.followup.send(embed=embed, ephemeral=True)
         except Exception as e:
-            embed = discord.Embed(title=t('error', guild_id=guild_id), description=t('mods_unexpected_error', error=str(e), guild_id=guild_id), color=discord.Color.red())
-            embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=guild_id), icon_url=interaction.user.avatar)
-            embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            embed = self.client.embed_factory.build(guild_id, 'error', 'mods_unexpected_error', color=discord.Color.red(), author=interaction.user, error=str(e))
             await interaction.followup.send(embed=embed, ephemeral=True)
             
     @app_commands.command(name="deldms", description="Delete all bot DMs")
@@ -309,8 +312,7 @@ class Utility_slash(commands.Cog):
         
         try:
             total_deleted = 0
-            embed = discord.Embed(title=t('deldms_loading', guild_id=guild_id), color=discord.Color.yellow())
-            embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            embed = self.client.embed_factory.build(guild_id, 'deldms_loading', color=discord.Color.yellow())
             await interaction.followup.send(embed=embed, ephemeral=False)
 
             tasks = []
@@ -339,13 +341,11 @@ class Utility_slash(commands.Cog):
             if total_deleted > 0:
                 embed1 = discord.Embed(title=t('deldms_total_title', guild_id=guild_id), description=f"{total_deleted}", color=discord.Color.purple())
             else:
-                embed1 = discord.Embed(title=t('deldms_total_none', guild_id=guild_id), color=discord.Color.red())
-            embed1.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+                embed1 = self.client.embed_factory.build(guild_id, 'deldms_total_none', color=discord.Color.red())
             await interaction.followup.send(embed=embed1, ephemeral=False)
             
         except Exception as e:
-            embed = discord.Embed(title=t('error', guild_id=guild_id), description=t('mods_unexpected_error', error=str(e), guild_id=guild_id), color=discord.Color.red())
-            embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            embed = self.client.embed_factory.build(guild_id, 'error', 'mods_unexpected_error', color=discord.Color.red(), error=str(e))
             await interaction.followup.send(embed=embed, ephemeral=True)
             import traceback
             traceback.print_exc()
@@ -363,7 +363,7 @@ class Utility_slash(commands.Cog):
                     del audio_cog.progress_tasks[guild_id]
                 
                 # Session cleanup for downloads
-                asyncio.create_task(audio_cog._robust_session_cleanup())
+                audio_cog._release_session(guild_id)
             
             # Stop any soundboard random tasks
             sb_cog = self.client.get_cog('Soundboard_slash')
@@ -378,48 +378,52 @@ class Utility_slash(commands.Cog):
             except:
                 desc = "Bot disconnected."
             
-            embed = discord.Embed(title=t('yt_leave_title', guild_id=guild_id), description=t('yt_leave_desc', guild_id=guild_id), color=discord.Color.green())
-            embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=guild_id), icon_url=interaction.user.avatar)
-            embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            embed = self.client.embed_factory.build(guild_id, 'yt_leave_title', 'yt_leave_desc', color=discord.Color.green(), author=interaction.user)
             await interaction.response.send_message(embed=embed)
         else:
-            embed = discord.Embed(title=t('audio_error_title', guild_id=guild_id), description=t('audio_not_connected', guild_id=guild_id), color=discord.Color.red())
-            embed.set_author(name=t('help_requested_by', user=interaction.user.name, guild_id=guild_id), icon_url=interaction.user.avatar)
-            embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+            embed = self.client.embed_factory.build(guild_id, 'audio_error_title', 'audio_not_connected', color=discord.Color.red(), author=interaction.user)
             await interaction.response.send_message(embed=embed, ephemeral=True)
 
     # --- Reminder Logic ---
 
     def load_reminders(self):
-        if os.path.exists(self.reminders_path):
-            try:
-                with open(self.reminders_path, "r", encoding='utf-8') as f:
-                    data = json.load(f)
-                    return data if isinstance(data, list) else []
-            except:
-                return []
-        return []
+        try:
+            self.reminders = {}
+            for user_reminders in self.storage.load_namespace('reminders').values():
+                self.reminders.update(user_reminders)
+            for reminder in list(self.reminders.values()):
+                if self._next_fire_time(reminder) is None:
+                    self.delete_reminder(reminder)
+                else:
+                    self.schedule_reminder(reminder)
+        except Exception as e:
+            print(f"Error loading reminders: {e}")
 
-    def save_reminders(self, reminders):
-        with open(self.reminders_path, "w", encoding='utf-8') as f:
-            json.dump(reminders, f, indent=4)
+    def get_reminders(self):
+        return list(self.reminders.values())
+
+    def save_reminder(self, reminder):
+        self.reminders[reminder['id']] = reminder
+        self.storage.put_nowait('reminders', reminder['user_id'], reminder['id'], reminder)
+        self.schedule_reminder(reminder)
+
+    def delete_reminder(self, reminder):
+        if self.reminders.pop(reminder['id'], None) is not None:
+            self.storage.delete_nowait('reminders', reminder['user_id'], reminder['id'])
+        self.client.scheduler.cancel(('reminder', reminder['id']))
 
     def load_timezones(self):
-        if os.path.exists(self.timezone_path):
-            try:
-                with open(self.timezone_path, "r", encoding='utf-8') as f:
-                    return json.load(f)
-            except:
-                return {}
-        return {}
+        try:
+            self.timezones = self.storage.load_namespace('timezones').get('', {})
+        except Exception as e:
+            print(f"Error loading timezones: {e}")
 
-    def save_timezones(self, timezones):
-        with open(self.timezone_path, "w", encoding='utf-8') as f:
-            json.dump(timezones, f, indent=4)
+    def save_timezone(self, user_id, tz_name):
+        self.timezones[str(user_id)] = tz_name
+        self.storage.put_nowait('timezones', '', str(user_id), tz_name)
 
     def get_user_timezone(self, user_id):
-        timezones = self.load_timezones()
-        tz_name = timezones.get(str(user_id))
+        tz_name = self.timezones.get(str(user_id))
         if tz_name:
             try:
                 return pytz.timezone(tz_name)
@@ -500,85 +504,95 @@ class Utility_slash(commands.Cog):
 
         return None
 
-    @tasks.loop(minutes=1)
-    async def check_reminders(self):
-        reminders = self.load_reminders()
-        now = int(time.time())
-        updated = False
-        
-        for reminder in reminders[:]:
-            try:
-                target_time = reminder['target_time']
-                notified = reminder.get('notified', False)
-                is_initial = now >= target_time and not notified
-                spam_interval = reminder.get('spam_interval', 0) * 60
-                should_resend = False
-                
-                # Only resend if we are past target_time AND it has already been notified once
-                if now >= target_time and notified and not reminder.get('acknowledged', False) and spam_interval > 0:
-                    last_notified = reminder.get('last_notified') or target_time
-                    if now >= last_notified + spam_interval:
-                        should_resend = True
-
-                if is_initial or should_resend:
-                    user = self.client.get_user(reminder['user_id'])
-                    if not user:
-                        try: user = await self.client.fetch_user(reminder['user_id'])
-                        except: pass
-                    
-                    if user:
-                        # Resolve guild context for localization
-                        guild_id = reminder.get('guild_id')
-                        if not guild_id:
-                            channel = self.client.get_channel(reminder['channel_id'])
-                            if channel and hasattr(channel, 'guild'):
-                                guild_id = channel.guild.id
-
-                        embed = discord.Embed(title=t('reminder_embed_title', guild_id=guild_id), description=reminder['message'], color=discord.Color.gold())
-                        embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
-                        view = ReminderView(self, guild_id=guild_id)
-                        destination_type = reminder.get('destination', 'channel')
-                        msg = None
-                        
-                        target_channel = self.client.get_channel(reminder['channel_id'])
-                        if not target_channel and reminder.get('channel_id'):
-                            try:
-                                target_channel = await self.client.fetch_channel(reminder['channel_id'])
-                            except:
-                                pass
-
-                        if destination_type == 'dm':
-                            try: msg = await user.send(embed=embed, view=view)
-                            except:
-                                if target_channel: msg = await target_channel.send(content=user.mention, embed=embed, view=view)
-                        else:
-                            if target_channel:
-                                try: msg = await target_channel.send(content=user.mention, embed=embed, view=view)
-                                except:
-                                    try: msg = await user.send(embed=embed, view=view)
-                                    except: pass
-                            else:
-                                try: msg = await user.send(embed=embed, view=view)
-                                except: pass
-                        
-                        if msg:
-                            reminder['message_id'] = msg.id
-                            reminder['notified'] = True
-                            reminder['last_notified'] = now
-                            updated = True
-                
-                if reminder.get('acknowledged', False) or (reminder.get('notified', False) and spam_interval <= 0):
-                    reminders.remove(reminder)
-                    updated = True
-            except Exception as e:
-                print(f"Error checking reminder: {e}")
+    def _next_fire_time(self, reminder):
+        """Returns when a reminder must be sent next (target or spam re-send), or None."""
+        if not reminder.get('notified', False):
+            return reminder['target_time']
+        spam_interval = reminder.get('spam_interval', 0) * 60
+        if spam_interval > 0 and not reminder.get('acknowledged', False):
+            return (reminder.get('last_notified') or reminder['target_time']) + spam_interval
+        return None
 
-        if updated: self.save_reminders(reminders)
+    def schedule_reminder(self, reminder, deadline=None):
+        key = ('reminder', reminder['id'])
+        deadline = deadline or self._next_fire_time(reminder)
+        if deadline is None:
+            self.client.scheduler.cancel(key)
+            return
+        self.client.scheduler.schedule(key, deadline, lambda: self.fire_reminder(reminder['id']))
 
-    @check_reminders.before_loop
-    async def before_check_reminders(self):
+    async def fire_reminder(self, reminder_id):
+        reminder = self.reminders.get(reminder_id)
+        if reminder is None:
+            return
         await self.client.wait_until_ready()
 
+        try:
+            msg = await self.send_reminder(reminder)
+        except Exception as e:
+            print(f"Error checking reminder: {e}")
+            msg = None
+
+        # Cancelled/acknowledged while we were sending
+        if reminder_id not in self.reminders:
+            return
+        if not msg:
+            # Delivery failed (user/channel unreachable), retry later
+            self.schedule_reminder(reminder, int(time.time()) + self.REMINDER_RETRY_DELAY)
+            return
+
+        reminder['message_id'] = msg.id
+        reminder['notified'] = True
+        reminder['last_notified'] = int(time.time())
+        if self._next_fire_time(reminder) is None:
+            self.delete_reminder(reminder)
+        else:
+            self.save_reminder(reminder)
+
+    async def send_reminder(self, reminder):
+        """Sends a reminder to its channel or DM. Returns the sent message, or None."""
+        user = self.client.get_user(reminder['user_id'])
+        if not user:
+            try: user = await self.client.fetch_user(reminder['user_id'])
+            except: pass
+        if not user:
+            return None
+
+        # Resolve guild context for localization
+        guild_id = reminder.get('guild_id')
+        if not guild_id:
+            channel = self.client.get_channel(reminder['channel_id'])
+            if channel and hasattr(channel, 'guild'):
+                guild_id = channel.guild.id
+
+        embed = discord.Embed(title=t('reminder_embed_title', guild_id=guild_id), description=reminder['message'], color=discord.Color.gold())
+        embed.set_footer(text=get_current_version(self.client, guild_id=guild_id))
+        view = ReminderView(self, guild_id=guild_id)
+        destination_type = reminder.get('destination', 'channel')
+        msg = None
+        
+        target_channel = self.client.get_channel(reminder['channel_id'])
+        if not target_channel and reminder.get('channel_id'):
+            try:
+                target_channel = await self.client.fetch_channel(reminder['channel_id'])
+            except:
+                pass
+
+        if destination_type == 'dm':
+            try: msg = await user.send(embed=embed, view=view)
+            except:
+                if target_channel: msg = await target_channel.send(content=user.mention, embed=embed, view=view)
+        else:
+            if target_channel:
+                try: msg = await target_channel.send(content=user.mention, embed=embed, view=view)
+                except:
+                    try: msg = await user.send(embed=embed, view=view)
+                    except: pass
+            else:
+                try: msg = await user.send(embed=embed, view=view)
+                except: pass
+        return msg
+
     reminder_group = app_commands.Group(name="reminder", description="Manage your reminders")
     timezone_group = app_commands.Group(name="timezone", description="Manage your local timezone", parent=reminder_group)
 
@@ -589,15 +603,13 @@ class Utility_slash(commands.Cog):
         try: pytz.timezone(name)
         except: return await interaction.response.send_message(t('reminder_timezone_error_invalid', guild_id=guild_id), ephemeral=True)
             
-        timezones = self.load_timezones()
-        timezones[str(interaction.user.id)] = name
-        self.save_timezones(timezones)
+        self.save_timezone(interaction.user.id, name)
         await interaction.response.send_message(t('reminder_timezone_success', tz=name, guild_id=guild_id), ephemeral=True)
 
     @timezone_group.command(name="info", description="Show your current timezone")
     async def timezone_info(self, interaction: discord.Interaction):
         guild_id = interaction.guild.id if interaction.guild else None
-        tz_name = self.load_timezones().get(str(interaction.user.id))
+        tz_name = self.timezones.get(str(interaction.user.id))
         if not tz_name: return await interaction.response.send_message(t('reminder_timezone_not_set', guild_id=guild_id), ephemeral=True)
         await interaction.response.send_message(t('reminder_timezone_info', tz=tz_name, guild_id=guild_id), ephemeral=True)
 
@@ -612,14 +624,12 @@ class Utility_slash(commands.Cog):
         if target_time == "timezone_not_set": return await interaction.response.send_message(t('reminder_timezone_not_set', guild_id=guild_id), ephemeral=True)
         if target_time is None: return await interaction.response.send_message(t('reminder_error_time', guild_id=guild_id), ephemeral=True)
         
-        reminders = self.load_reminders()
-        reminders.append({
+        self.save_reminder({
             'id': str(uuid.uuid4()), 'user_id': interaction.user.id, 'channel_id': interaction.channel_id,
             'guild_id': interaction.guild_id,
             'message': message, 'target_time': target_time, 'spam_interval': spam_interval,
             'notified': False, 'acknowledged': False, 'last_notified': 0, 'message_id': None, 'destination': destination
         })
-        self.save_reminders(reminders)
         
         success_msg = t('reminder_set_success', time=f"<t:{target_time}:F>", guild_id=guild_id)
         if spam_interval > 0: success_msg += t('reminder_spam_on', interval=spam_interval, guild_id=guild_id)
@@ -628,7 +638,7 @@ class Utility_slash(commands.Cog):
     @reminder_group.command(name="list", description="List your reminders")
     async def reminder_list(self, interaction: discord.Interaction):
         guild_id = interaction.guild.id if interaction.guild else None
-        user_reminders = [r for r in self.load_reminders() if r['user_id'] == interaction.user.id]
+        user_reminders = [r for r in self.get_reminders() if r['user_id'] == interaction.user.id]
         if not user_reminders: return await interaction.response.send_message(t('reminder_list_empty', guild_id=guild_id), ephemeral=True)
             
         embed = discord.Embed(title=t('reminder_list_title', guild_id=guild_id), color=discord.Color.blue())
@@ -640,15 +650,90 @@ class Utility_slash(commands.Cog):
     @reminder_group.command(name="cancel", description="Cancel a reminder")
     async def reminder_cancel(self, interaction: discord.Interaction, number: int):
         guild_id = interaction.guild.id if interaction.guild else None
-        reminders = self.load_reminders()
-        user_reminders = [r for r in reminders if r['user_id'] == interaction.user.id]
+        user_reminders = [r for r in self.get_reminders() if r['user_id'] == interaction.user.id]
         if number < 1 or number > len(user_reminders): return await interaction.response.send_message(t('error', guild_id=guild_id), ephemeral=True)
         
-        reminder_to_remove = user_reminders[number-1]
-        reminders = [r for r in reminders if r['id'] != reminder_to_remove['id']]
-        self.save_reminders(reminders)
+        self.delete_reminder(user_reminders[number-1])
         await interaction.response.send_message(t('reminder_cancel_success', guild_id=guild_id), ephemeral=True)
 
+class StreamedReply:
+    """Followup messages edited progressively with the text of a stream.
+
+    The text displayed is clean() of the text received: clean() is applied to
+    each line once it is complete, so the messages add up to the cleaned full
+    answer. The first message is sent with the first text received, then edits
+    are throttled to one per interval. Text that no longer fits in a message
+    rolls over into a new one, split on a line break when possible.
+    """
+    MAX_LENGTH = 2000
+
+    def __init__(self, interaction, header, clean, interval=1.0, guild_id=None):
+        self.interaction = interaction
+        self.header = header  # first line of the current message
+        self.clean = clean
+        self.interval = interval
+        self.guild_id = guild_id
+        self.text = ""  # whole text received
+        self.cleaned = ""  # clean() of the complete lines received
+        self.line = ""  # line being received
+        self.start = 0  # offset of the current message in the displayed text
+        self.message = None  # current followup message
+        self.shown = None  # content displayed by the current message
+        self.count = 1  # messages sent, the current one included
+        self.last_edit = 0.0
+
+    def displayed(self):
+        """Returns clean() of the text received so far."""
+        line = self.clean(self.line)
+        if self.cleaned and line:
+            return f"{self.cleaned}\n{line}"
+        return self.cleaned or line
+
+    async def feed(self, text):
+        self.text += text
+        lines = (self.line + text).splitlines(keepends=True)
+        # The last line is still being received unless it ends with a line break
+        self.line = lines.pop() if lines and lines[-1].splitlines()[0] == lines[-1] else ""
+        complete = self.clean("".join(lines))
+        if complete:
+            self.cleaned = f"{self.cleaned}\n{complete}" if self.cleaned else complete
+
+        pending = self.displayed()[self.start:]
+        limit = self.MAX_LENGTH - len(self.header) - 1
+        while len(pending) > limit:
+            split = pending.rfind('\n', 0, limit)
+            if split <= 0:
+                split = limit
+            await self._show(pending[:split])
+            # Only the line break at the split point is dropped, indentation is kept
+            if pending[split] == '\n':
+                split += 1
+            self.start += split
+            pending = pending[split:]
+            self.count += 1
+            self.header = t('long_message_continued', current=self.count, guild_id=self.guild_id)
+            self.message = self.shown = None
+            limit = self.MAX_LENGTH - len(self.header) - 1
+        if time.monotonic() - self.last_edit >= self.interval:
+            await self._show(pending)
+
+    async def close(self):
+        """Displays the text still waiting for an edit."""
+        await self._show(self.displayed()[self.start:])
+
+    async def _show(self, body):
+        if not body.strip():
+            return
+        content = f"{self.header}\n{body}"
+        if content == self.shown:
+            return
+        if self.message is None:
+            self.message = await self.interaction.followup.send(content, ephemeral=False, wait=True)
+        else:
+            await self.message.edit(content=content)
+        self.shown = content
+        self.last_edit = time.monotonic()
+
 class ReminderView(discord.ui.View):
     def __init__(self, cog, guild_id=None):
         super().__init__(timeout=None)
@@ -661,14 +746,13 @@ class ReminderView(discord.ui.View):
 
     @discord.ui.button(label="OK", style=discord.ButtonStyle.green, custom_id="reminder_ack_btn")
     async def acknowledge(self, interaction: discord.Interaction, button: discord.ui.Button):
-        reminders = self.cog.load_reminders()
         message_id = interaction.message.id
         
-        # Filter out the acknowledged reminder
-        new_reminders = [r for r in reminders if r.get('message_id') != message_id]
+        # Remove the acknowledged reminder
+        reminder = next((r for r in self.cog.get_reminders() if r.get('message_id') == message_id), None)
         
-        if len(new_reminders) < len(reminders):
-            self.cog.save_reminders(new_reminders)
+        if reminder:
+            self.cog.delete_reminder(reminder)
             button.disabled = True
             button.label = t('reminder_ack_success', guild_id=interaction.guild_id)
             await interaction.response.edit_message(view=self)
@@ -1,5 +1,7 @@
 import json
 import os
+import re
+import string
 import logging
 
 logger = logging.getLogger('discord_bot')
@@ -9,62 +11,205 @@ DEFAULT_LANG = 'en'
 GUILD_LANGS = {} # guild_id (str) -> lang_code
 
 _loaded_langs = {}
+_compiled_langs = {}  # lang_code -> {key: (text, renderer or None)}
+_bundles = {}  # lang_code -> Bundle (default language merged in)
+_guild_bundles = {}  # guild_id -> Bundle
+_FORMATTER = string.Formatter()
+
+class Bundle:
+    """Translations of one language with the default language fallback already merged.
+
+    Templates are parsed at load time: plain strings are returned as is,
+    templates with placeholders carry a renderer (see _renderer). Fetch one
+    with get_bundle() and call it like t(): tr('key', **kwargs).
+    """
+    __slots__ = ('lang', '_entries')
+
+    def __init__(self, lang, entries):
+        self.lang = lang
+        self._entries = entries
+
+    def __call__(self, key, **kwargs):
+        entry = self._entries.get(key)
+        if entry is None:
+            return key
+        text, render = entry
+        if kwargs and render is not None:
+            try:
+                return render(kwargs)
+            except Exception as e:
+                print(f"Format error for key '{key}': {e}")
+                return text
+        return text
+
+    def is_static(self, key):
+        """Returns whether a key renders the same text whatever the arguments."""
+        entry = self._entries.get(key)
+        return entry is None or entry[1] is None
+
+def _renderer(text):
+    """Parses a template once into literal and field segments.
+
+    Returns a function rendering the template from a kwargs dict, like
+    text.format_map. Templates with positional fields or nested format specs
+    keep text.format_map.
+    """
+    segments = []  # literal str or (field, simple name, conversion, format spec)
+    for literal, field, spec, conversion in _FORMATTER.parse(text):
+        if literal:
+            segments.append(literal)
+        if field is None:
+            continue
+        if not field or field[0].isdigit() or '{' in spec:
+            return text.format_map
+        segments.append((field, field.isidentifier(), conversion, spec))
+
+    def render(kwargs):
+        parts = []
+        for segment in segments:
+            if segment.__class__ is str:
+                parts.append(segment)
+                continue
+            field, simple, conversion, spec = segment
+            value = kwargs[field] if simple else _FORMATTER.get_field(field, (), kwargs)[0]
+            if conversion:
+                value = _FORMATTER.convert_field(value, conversion)
+            parts.append(format(value, spec))
+        return ''.join(parts)
+    return render
+
+def _compile(translations):
+    """Pre-parses a language file into {key: (text, renderer or None)}."""
+    compiled = {}
+    for key, text in translations.items():
+        if isinstance(text, str) and ('{' in text or '}' in text):
+            compiled[key] = (text, _renderer(text))
+        else:
+            compiled[key] = (text, None)
+    return compiled
+
+def _clear_bundles():
+    _bundles.clear()
+    _guild_bundles.clear()
+
+def placeholders(text):
+    """Returns the placeholder names of a template. Raises ValueError if it is malformed."""
+    names = set()
+    for _, field, _, _ in _FORMATTER.parse(text):
+        if field is not None:
+            names.add(re.split(r'[.\[]', field, maxsplit=1)[0])
+    return names
+
+def _read_pack(path):
+    """Reads and validates a language file: a flat JSON object of well-formed string templates."""
+    with open(path, encoding='utf-8') as f:
+        translations = json.load(f)
+    if not isinstance(translations, dict):
+        raise ValueError("not a JSON object")
+    for key, text in translations.items():
+        if not isinstance(text, str):
+            raise ValueError(f"'{key}' is not a string")
+        try:
+            placeholders(text)
+        except ValueError as e:
+            raise ValueError(f"'{key}': {e}") from None
+    return translations
+
+def check_placeholders(translations, reference):
+    """Compares a pack to the reference (default language) pack.
+
+    Returns {key: (missing, unknown)}: placeholders of the reference template the
+    translation drops, and placeholders the callers do not provide.
+    """
+    issues = {}
+    for key, text in translations.items():
+        expected = reference.get(key)
+        if expected is None:
+            continue
+        names, expected_names = placeholders(text), placeholders(expected)
+        if names != expected_names:
+            issues[key] = (sorted(expected_names - names), sorted(names - expected_names))
+    return issues
+
+def get_pack_mtimes():
+    """Returns {filename: mtime} of the language files."""
+    mtimes = {}
+    try:
+        for entry in os.scandir(LANG_DIR):
+            if entry.name.endswith(".json") and entry.name != "config.json":
+                mtimes[entry.name] = entry.stat().st_mtime
+    except OSError:
+        pass
+    return mtimes
 
 def load_languages():
-    """Loads all available languages into cache."""
-    global _loaded_langs
+    """Loads all available languages and swaps them in at once.
+
+    A file that cannot be read or fails validation keeps its previously loaded
+    pack. Returns {lang_code: error} for the rejected files.
+    """
+    global _loaded_langs, _compiled_langs
+    errors = {}
     if not os.path.exists(LANG_DIR):
-        return
+        return errors
 
+    loaded, compiled = {}, {}
     for filename in os.listdir(LANG_DIR):
         if filename.endswith(".json") and filename not in ("config.json",):
             lang_code = filename[:-5]
             path = os.path.join(LANG_DIR, filename)
             try:
-                with open(path, encoding='utf-8') as f:
-                    _loaded_langs[lang_code] = json.load(f)
+                loaded[lang_code] = _read_pack(path)
+                compiled[lang_code] = _compile(loaded[lang_code])
             except Exception as e:
                 logger.error(f"Error loading language {lang_code}: {e}")
+                errors[lang_code] = e
+                if lang_code in _loaded_langs:
+                    loaded[lang_code] = _loaded_langs[lang_code]
+                    compiled[lang_code] = _compiled_langs[lang_code]
+
+    # Rebinding both tables and dropping the bundles happens without awaiting,
+    # so no lookup ever sees a mix of old and new packs
+    _loaded_langs, _compiled_langs = loaded, compiled
+    _clear_bundles()
+    return errors
+
+def _bundle_for(lang_code):
+    bundle = _bundles.get(lang_code)
+    if bundle is None:
+        if not _loaded_langs:
+            load_languages()
+        # Fallback chain merged once: requested language over the default language
+        entries = dict(_compiled_langs.get(DEFAULT_LANG) or {})
+        if lang_code != DEFAULT_LANG:
+            entries.update(_compiled_langs.get(lang_code) or {})
+        bundle = _bundles[lang_code] = Bundle(lang_code, entries)
+    return bundle
+
+def get_bundle(guild_id=None, _locale=None):
+    """
+    Returns the translation bundle to use.
+    Priority: explicit _locale > guild_id config > Global DEFAULT_LANG
+    """
+    if _locale:
+        return _bundle_for(_locale)
+    if guild_id:
+        bundle = _guild_bundles.get(guild_id)
+        if bundle is None:
+            bundle = _guild_bundles[guild_id] = _bundle_for(GUILD_LANGS.get(str(guild_id)) or DEFAULT_LANG)
+        return bundle
+    return _bundle_for(DEFAULT_LANG)
 
 def get_text(key, _locale=None, guild_id=None, **kwargs):
     """
     Retrieves translated text for the given key and selected language.
     Priority: explicit _locale > guild_id config > Global DEFAULT_LANG
     """
-    if not _loaded_langs:
-        load_languages()
-
-    # 1. Check explicit locale
-    target_lang = _locale
-    
-    # 2. Check guild config if provided
-    if not target_lang and guild_id:
-        target_lang = GUILD_LANGS.get(str(guild_id))
-    
-    # 3. Fallback to global default
-    if not target_lang:
-        target_lang = DEFAULT_LANG
-
-    # Try requested language, then default language, otherwise return the key
-    translations = _loaded_langs.get(target_lang) or {}
-    text = translations.get(key)
-    
-    # Fallback to default language if key is not found in the target language
-    if text is None:
-        default_translations = _loaded_langs.get(DEFAULT_LANG) or {}
-        text = default_translations.get(key, key)
-
-    if kwargs:
-        try:
-            return text.format(**kwargs)
-        except Exception as e:
-            print(f"Format error for key '{key}': {e}")
-            return text
-    return text
+    return get_bundle(guild_id, _locale)(key, **kwargs)
 
 def t(key, _locale=None, guild_id=None, **kwargs):
     """Shortcut for get_text."""
-    return get_text(key, _locale, guild_id=guild_id, **kwargs)
+    return get_text(key, _locale, guild_id, **kwargs)
 
 CONFIG_FILE = os.path.join(LANG_DIR, 'config.json')
 
@@ -77,6 +222,7 @@ def load_config():
                 config = json.load(f)
                 DEFAULT_LANG = config.get('language', DEFAULT_LANG)
                 GUILD_LANGS = config.get('guild_languages', {})
+            _clear_bundles()
         except Exception as e:
             logger.error(f"Error loading config: {e}")
 
@@ -99,6 +245,7 @@ def set_language(lang_code, guild_id=None):
             GUILD_LANGS[str(guild_id)] = lang_code
         else:
             DEFAULT_LANG = lang_code
+        _clear_bundles()
         save_config()
         return True
     return False
@@ -107,6 +254,10 @@ def get_available_languages():
     """Returns list of available language codes."""
     return list(_loaded_langs.keys())
 
+def get_pack(lang_code):
+    """Returns the raw translations of a language ({} if unknown)."""
+    return _loaded_langs.get(lang_code, {})
+
 # Initial load
 load_languages()
 load_config()
@@ -36,8 +36,8 @@ def get_used_keys():
                 with open(filepath, 'r', encoding='utf-8') as f:
                     content = f.read()
                 
-                # Standard t('key') and t("key")
-                matches = re.findall(r"t\(['\"]([^'\"]+)['\"]", content)
+                # Standard t('key') and t("key"), and bundle handles tr('key')
+                matches = re.findall(r"tr?\(['\"]([^'\"]+)['\"]", content)
                 used_keys.update(matches)
                 
                 # Special cases for dynamic keys
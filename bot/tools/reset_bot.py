@@ -47,6 +47,13 @@ DATA_FILES = [
     os.path.join(bot_root, "lang", "config.json")
 ]
 
+# SQLite database (with its WAL journal files)
+DB_FILES = [
+    os.path.join(bot_root, "json", "bot.db"),
+    os.path.join(bot_root, "json", "bot.db-wal"),
+    os.path.join(bot_root, "json", "bot.db-shm")
+]
+
 # VxT Data files
 VXT_DIR = os.path.join(bot_root, "json", "vxt_lists")
 VXT_FILES = []
@@ -150,6 +157,8 @@ def main():
             # We don't use safe_remove here to avoid "Removing..." messages for files
             # Instead we just "empty" them via reset_json_file
             reset_json_file(file_path)
+    for db_path in DB_FILES:
+        safe_remove(db_path)
 
     # 3. Reset Logs
     print("\n" + t('reset_logs_title'))